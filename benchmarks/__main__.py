@@ -0,0 +1,60 @@
+"""Run query builder benchmarks: `python -m benchmarks --help`."""
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import harness, scenarios  # noqa: F401
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument('-k', '--filter', default='', help='run benchmarks containing substring')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds per benchmark')
+    parser.add_argument('--save', type=Path, help='store results as JSON')
+    parser.add_argument('--compare', type=Path, help='JSON baseline to compare results with')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='relative growth of a metric treated as a regression',
+    )
+    return parser.parse_args()
+
+
+def run(name_filter: str, min_time: float) -> list[harness.Result]:
+    results = [
+        harness.measure(bench, min_time=min_time)
+        for bench in harness.registered()
+        if name_filter in bench.name
+    ]
+    for result in results:
+        sys.stdout.write(
+            f'{result.name:<30} {result.ops_per_sec:>12,.0f} ops/s '
+            f'p50 {result.p50_us:>9.1f} us p99 {result.p99_us:>9.1f} us '
+            f'alloc {result.peak_alloc_bytes:>9,} B\n',
+        )
+    return results
+
+
+def report(regressions: list[harness.Regression]) -> None:
+    for regression in regressions:
+        sys.stdout.write(
+            f'REGRESSION {regression.name} {regression.metric}: '
+            f'{regression.baseline:.1f} -> {regression.current:.1f} ({regression.ratio:.2f}x)\n',
+        )
+
+
+def main() -> int:
+    args = parse_args()
+    results = run(args.filter, args.min_time)
+    if args.save:
+        harness.save(results, args.save)
+    if not args.compare:
+        return 0
+    regressions = harness.compare(results, harness.load(args.compare), args.threshold)
+    report(regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Construction and build cost of expression-heavy queries.
+
+Run from the repository root: `python -m benchmarks.expression_tree`.
+Run it on two revisions to compare expression representations.
+"""
+import sys
+from collections.abc import Callable
+from timeit import Timer
+from typing import Any
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.func import std
+from edgeql_qb.operators import BinaryOp
+from edgeql_qb.queries import SelectQuery
+from edgeql_qb.types import int64
+
+A = EdgeDBModel('A')
+
+
+def deep_condition(depth: int) -> BinaryOp:
+    condition = A.c.p_int64 > int64(0)
+    for i in range(depth):
+        condition = condition & ((A.c.p_int32 + -A.c.p_int64) * int64(i) != int64(i))
+    return condition
+
+
+def deep_filter() -> SelectQuery:
+    return A.select(A.c.p_str).where(deep_condition(20))
+
+
+def computed_shape() -> SelectQuery:
+    return A.select(
+        *(
+            (std.len(A.c.p_str) + (A.c.p_int64 - -A.c.p_int32) * int64(i)).label(f'computed_{i}')
+            for i in range(20)
+        ),
+    )
+
+
+def measure(func: Callable[[], Any]) -> float:
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> None:
+    for factory in (deep_filter, computed_shape):
+        query = factory()
+        construction = measure(factory)
+        build = measure(query.build)
+        sys.stdout.write(
+            f'{factory.__name__:<16} construction: {construction * 1e6:9.1f} us '
+            f'build: {build * 1e6:9.1f} us\n',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""Minimal benchmark harness: timing percentiles, allocations and baseline comparison."""
+import json
+import platform
+import statistics
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+from typing import Any
+
+Operation = Callable[[], Any]
+
+
+@dataclass(slots=True, frozen=True)
+class Benchmark:
+    name: str
+    operation: Operation
+
+
+@dataclass(slots=True, frozen=True)
+class Result:
+    name: str
+    samples: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_alloc_bytes: int
+
+
+@dataclass(slots=True, frozen=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+_registry: list[Benchmark] = []
+
+
+def benchmark(name: str) -> Callable[[Operation], Operation]:
+    """Register a zero-argument callable as a benchmark."""
+    def decorator(operation: Operation) -> Operation:
+        _registry.append(Benchmark(name, operation))
+        return operation
+    return decorator
+
+
+def registered() -> list[Benchmark]:
+    return list(_registry)
+
+
+def percentile(sorted_samples: list[int], fraction: float) -> float:
+    index = min(len(sorted_samples) - 1, round(fraction * (len(sorted_samples) - 1)))
+    return sorted_samples[index] / 1e3
+
+
+def peak_allocation(operation: Operation) -> int:
+    """Peak size of memory allocated by a single call, in bytes."""
+    tracemalloc.start()
+    try:
+        operation()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def measure(bench: Benchmark, min_time: float = 0.5, min_samples: int = 100) -> Result:
+    operation = bench.operation
+    for _ in range(min(min_samples, 10)):
+        operation()
+    samples: list[int] = []
+    deadline = perf_counter() + min_time
+    while len(samples) < min_samples or perf_counter() < deadline:
+        start = perf_counter_ns()
+        operation()
+        samples.append(perf_counter_ns() - start)
+    samples.sort()
+    return Result(
+        name=bench.name,
+        samples=len(samples),
+        ops_per_sec=1e9 / statistics.fmean(samples),
+        p50_us=percentile(samples, 0.5),
+        p99_us=percentile(samples, 0.99),
+        peak_alloc_bytes=peak_allocation(operation),
+    )
+
+
+def save(results: Iterable[Result], path: Path) -> None:
+    document = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + '\n')
+
+
+def load(path: Path) -> dict[str, Result]:
+    document = json.loads(path.read_text())
+    return {name: Result(**result) for name, result in document['results'].items()}
+
+
+METRICS = ('p50_us', 'p99_us', 'peak_alloc_bytes')
+
+
+def regressions_of(result: Result, previous: Result, threshold: float) -> list[Regression]:
+    return [
+        Regression(result.name, metric, getattr(previous, metric), getattr(result, metric))
+        for metric in METRICS
+        if getattr(result, metric) > getattr(previous, metric) * (1 + threshold)
+    ]
+
+
+def compare(
+    results: Iterable[Result],
+    baseline: dict[str, Result],
+    threshold: float = 0.1,
+) -> list[Regression]:
+    """Latencies and allocations that grew more than `threshold` relative to the baseline."""
+    return [
+        regression
+        for result in results
+        if result.name in baseline
+        for regression in regressions_of(result, baseline[result.name], threshold)
+    ]
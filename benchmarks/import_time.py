@@ -0,0 +1,70 @@
+"""Check that `import edgeql_qb` fits into the startup time budget.
+
+Run from the repository root: `python -m benchmarks.import_time`.
+The package is imported in fresh interpreters with `-X importtime`, the fastest run
+is compared with the budget, so the check exits with a non-zero code if it is exceeded.
+"""
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# cumulative import time of the package in milliseconds, with modules of the standard library;
+# the fastest of 10 runs is ~55 ms with lazy renderers and ~120 ms with eager ones,
+# the margin covers noise only, pass `--budget-ms` on slower machines
+BUDGET_MS = 65.0
+
+
+@dataclass(slots=True, frozen=True)
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time', description=__doc__)
+    parser.add_argument('--module', default='edgeql_qb', help='module to import')
+    parser.add_argument('--runs', type=int, default=10, help='number of fresh interpreters')
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS, help='time limit')
+    parser.add_argument('--top', type=int, default=10, help='number of slowest imports to show')
+    return parser.parse_args()
+
+
+def parse_line(line: str) -> ImportTime | None:
+    """Parse `import time: self [us] | cumulative | imported package`, skip the header."""
+    _, _, timings = line.partition('import time:')
+    self_us, cumulative_us, module = timings.split('|')
+    if not self_us.strip().isdigit():
+        return None
+    return ImportTime(module.strip(), int(self_us), int(cumulative_us))
+
+
+def import_times(module: str) -> list[ImportTime]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    lines = [parse_line(line) for line in result.stderr.splitlines()]
+    return [line for line in lines if line is not None]
+
+
+def cumulative_us(times: list[ImportTime], module: str) -> int:
+    return next(time.cumulative_us for time in times if time.module == module)
+
+
+def main() -> int:
+    args = parse_args()
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    fastest = min(runs, key=lambda times: cumulative_us(times, args.module))
+    for time in sorted(fastest, key=lambda time: time.self_us, reverse=True)[:args.top]:
+        sys.stdout.write(f'{time.module:<40} self {time.self_us / 1e3:7.2f} ms\n')
+    total_ms = cumulative_us(fastest, args.module) / 1e3
+    sys.stdout.write(f'import {args.module}: {total_ms:.2f} ms, budget {args.budget_ms:.2f} ms\n')
+    return 1 if total_ms > args.budget_ms else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
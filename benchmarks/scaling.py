@@ -0,0 +1,51 @@
+"""Check that build time grows linearly with the size of a query.
+
+Run from the repository root: `python -m benchmarks.scaling`.
+Time per element should stay roughly constant while the number of elements grows.
+"""
+import sys
+from collections.abc import Callable
+from timeit import Timer
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.expression import Column
+from edgeql_qb.queries import InsertQuery, SelectQuery
+
+A = EdgeDBModel('A')
+SIZES = (10, 100, 1_000, 10_000)
+
+
+def wide_select(size: int) -> SelectQuery:
+    return A.select(*(Column(f'p_{i}') for i in range(size)))
+
+
+def long_where_chain(size: int) -> SelectQuery:
+    query = A.select()
+    for i in range(size):
+        query = query.where(A.c.p_int64 != i)
+    return query
+
+
+def wide_insert(size: int) -> InsertQuery:
+    return A.insert.values(**{f'p_{i}': i for i in range(size)})
+
+
+def measure(factory: Callable[[int], SelectQuery | InsertQuery], size: int) -> float:
+    query = factory(size)
+    timer = Timer(query.build)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main() -> None:
+    for factory in (wide_select, long_where_chain, wide_insert):
+        for size in SIZES:
+            seconds = measure(factory, size)
+            sys.stdout.write(
+                f'{factory.__name__:<18} {size:>6} elements: '
+                f'{seconds * 1e3:10.3f} ms/build {seconds / size * 1e6:8.3f} us/element\n',
+            )
+
+
+if __name__ == '__main__':
+    main()
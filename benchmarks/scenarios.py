@@ -0,0 +1,147 @@
+"""Query builder scenarios on the model from tests/dbschema/default.esdl."""
+from collections.abc import Callable
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from benchmarks.harness import benchmark
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.func import std
+from edgeql_qb.operators import Alias
+from edgeql_qb.types import float64, int16, int32, int64
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+Nested2 = EdgeDBModel('Nested2')
+Nested3 = EdgeDBModel('Nested3')
+WithConstraints = EdgeDBModel('WithConstraints')
+
+A_COLUMNS = (
+    A.c.p_bool, A.c.p_str, A.c.p_datetime, A.c.p_local_datetime, A.c.p_local_date,
+    A.c.p_local_time, A.c.p_duration, A.c.p_int16, A.c.p_int32, A.c.p_int64,
+    A.c.p_float32, A.c.p_float64, A.c.p_bigint, A.c.p_decimal, A.c.p_json, A.c.p_bytes,
+)
+
+
+def wide_select() -> Any:
+    return A.select(*A_COLUMNS).where(A.c.p_str == 'value').order_by(A.c.p_int64.desc())
+
+
+def deep_paths() -> Any:
+    return Nested1.select(
+        *(Nested1.c.nested2.nested3.name for _ in range(20)),
+    ).where(Nested1.c.nested2.nested3.name == 'n3')
+
+
+def nested_shapes() -> Any:
+    return Nested1.select(
+        Nested1.c.name,
+        Nested1.c.nested2(
+            Nested1.c.nested2.name,
+            Nested1.c.nested2.nested3(
+                Nested1.c.nested2.nested3.name,
+            ).where(Nested3.c.name == 'n3').order_by(Nested3.c.name).limit(10),
+        ).where(Nested2.c.name != 'n2'),
+    ).where(Nested1.c.nested2.nested3.name.like('n%')).limit(100)
+
+
+def where_chain() -> Any:
+    query = A.select(A.c.p_int64)
+    for i in range(50):
+        query = query.where((A.c.p_int64 != int64(i)) | (A.c.p_int32 > int32(i)))
+    return query
+
+
+def insert_values() -> Any:
+    return A.insert.values(
+        p_bool=True,
+        p_str='value',
+        p_datetime=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        p_int16=int16(1),
+        p_int32=int32(2),
+        p_int64=int64(3),
+        p_float64=float64(4.5),
+        p_decimal=Decimal('5.5'),
+        p_bytes=b'bytes',
+    )
+
+
+def insert_many() -> Any:
+    return A.insert.values_many(
+        {'p_str': f'row {i}', 'p_int64': int64(i), 'p_decimal': Decimal(i)}
+        for i in range(1000)
+    )
+
+
+def upsert() -> Any:
+    return (
+        WithConstraints
+        .insert
+        .values(name='name', composite1='c1', composite2='c2')
+        .unless_conflict(
+            on=(WithConstraints.c.composite1, WithConstraints.c.composite2),
+            else_=WithConstraints.update.values(name='new name'),
+        )
+    )
+
+
+def group_using_by() -> Any:
+    decade = (A.c.p_int64 // 10).label('decade')
+    length = std.len(A.c.p_str).label('length')
+    return A.group(A.c.p_str, A.c.p_int64).using(decade, length).by(decade, length)
+
+
+def select_from_subquery() -> Any:
+    return Nested1.select(
+        Nested1.c.name,
+        Nested1.c.nested2(Nested1.c.nested2.name),
+    ).select_from(
+        Nested1.insert.values(
+            name='n1',
+            nested2=Nested2.select().where(Nested2.c.name == 'n2').limit1,
+        ),
+    )
+
+
+def update_with() -> Any:
+    x = Alias('x').assign(int64(10))
+    return (
+        A.update
+        .with_(x)
+        .values(p_int64=A.c.p_int64 + x, p_str=std.str_lower(A.c.p_str))
+        .where(A.c.p_str == 'value')
+    )
+
+
+def delete_ordered() -> Any:
+    return A.delete.where(A.c.p_int64 > int64(0)).order_by(A.c.p_int64.desc()).limit(10)
+
+
+def count_filtered() -> Any:
+    return A.count.where((A.c.p_int16 <= int16(2)) & A.c.p_str.ilike('v%'))
+
+
+SCENARIOS: tuple[Callable[[], Any], ...] = (
+    wide_select,
+    nested_shapes,
+    deep_paths,
+    where_chain,
+    insert_values,
+    insert_many,
+    upsert,
+    group_using_by,
+    select_from_subquery,
+    update_with,
+    delete_ordered,
+    count_filtered,
+)
+
+
+def register(factory: Callable[[], Any]) -> None:
+    query = factory()
+    benchmark(f'{factory.__name__}.construct')(factory)
+    benchmark(f'{factory.__name__}.build')(query.build)
+
+
+for scenario in SCENARIOS:
+    register(scenario)
@@ -0,0 +1,135 @@
+import json
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from edgeql_qb.render.types import CompiledQuery, RenderedQuery
+
+
+@dataclass(slots=True, frozen=True)
+class Cost:
+    """Estimated cost and rows of a plan node and, for analyzed queries, the actual ones.
+
+    Times are in milliseconds, actual rows are per loop like in the server output.
+    """
+
+    startup_cost: float
+    total_cost: float
+    plan_rows: float
+    actual_startup_time: float | None = None
+    actual_total_time: float | None = None
+    actual_rows: float | None = None
+    actual_loops: float | None = None
+
+    @classmethod
+    def from_json(cls, node: Mapping[str, Any]) -> 'Cost':
+        return cls(
+            startup_cost=node.get('startup_cost', 0.0),
+            total_cost=node.get('total_cost', 0.0),
+            plan_rows=node.get('plan_rows', 0.0),
+            actual_startup_time=node.get('actual_startup_time'),
+            actual_total_time=node.get('actual_total_time'),
+            actual_rows=node.get('actual_rows'),
+            actual_loops=node.get('actual_loops'),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class PlanNode:
+    """Node of the fine grained plan, `contexts` are parts of the query text it executes."""
+
+    node_type: str
+    cost: Cost
+    contexts: tuple[str, ...]
+    children: tuple['PlanNode', ...]
+
+    def walk(self) -> Iterator['PlanNode']:
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            yield node
+            nodes.extend(reversed(node.children))
+
+
+@dataclass(slots=True, frozen=True)
+class ShapeNode:
+    """Node of the coarse grained plan, it is a shape element or the whole query."""
+
+    path: tuple[str, ...]
+    cost: Cost
+    relations: tuple[str, ...]
+    children: tuple['ShapeNode', ...]
+
+
+@dataclass(slots=True, frozen=True)
+class Analysis:
+    buffers: tuple[str, ...]
+    plan: PlanNode | None
+    shape: ShapeNode | None
+
+    @property
+    def most_expensive_path(self) -> ShapeNode | None:
+        """Follow the most expensive shape element down to the leaf, costs include children."""
+        if self.shape is None:
+            return None
+        node = self.shape
+        while node.children:
+            node = max(node.children, key=lambda child: child.cost.total_cost)
+        return node
+
+    def summary(self) -> str:
+        node = self.most_expensive_path
+        if node is None:
+            return 'no shape plan'
+        path = '.'.join(node.path) or '<query>'
+        actual = node.cost.actual_total_time
+        timing = '' if actual is None else f', actual time {actual:.3f} ms'
+        return f'most expensive shape: {path} (cost {node.cost.total_cost:.2f}{timing})'
+
+
+def render_analyze(rendered: RenderedQuery | CompiledQuery) -> RenderedQuery:
+    return RenderedQuery(f'analyze {rendered.query}', rendered.context)
+
+
+def parse_contexts(node: Mapping[str, Any], buffers: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(
+        context.get('text') or buffers[context['buffer_idx']][context['start']:context['end']]
+        for context in node.get('contexts') or ()
+    )
+
+
+def parse_plan(node: Mapping[str, Any], buffers: tuple[str, ...]) -> PlanNode:
+    return PlanNode(
+        node_type=node.get('node_type') or node.get('plan_type', ''),
+        cost=Cost.from_json(node),
+        contexts=parse_contexts(node, buffers),
+        children=tuple(
+            parse_plan(child, buffers)
+            for child in (*node.get('plans', ()), *node.get('subplans', ()))
+        ),
+    )
+
+
+def parse_shape(node: Mapping[str, Any], path: tuple[str, ...] = ()) -> ShapeNode:
+    return ShapeNode(
+        path=path,
+        cost=Cost.from_json(node),
+        relations=tuple(node.get('relations', ())),
+        children=tuple(
+            parse_shape(child['node'], (*path, *child['attribute_path']))
+            for child in node.get('children', ())
+        ),
+    )
+
+
+def parse_analysis(output: str | Mapping[str, Any]) -> Analysis:
+    """Parse JSON output of the `analyze` statement, either text or decoded."""
+    data = json.loads(output) if isinstance(output, str) else output
+    buffers = tuple(data.get('buffers', ()))
+    fine_grained = data.get('fine_grained')
+    coarse_grained = data.get('coarse_grained')
+    return Analysis(
+        buffers=buffers,
+        plan=None if fine_grained is None else parse_plan(fine_grained, buffers),
+        shape=None if coarse_grained is None else parse_shape(coarse_grained),
+    )
@@ -0,0 +1,25 @@
+from collections.abc import Iterable
+from concurrent.futures import Executor
+
+from edgeql_qb.render.types import BuildableQuery, RenderedQuery
+
+
+def build_query(query: BuildableQuery) -> RenderedQuery:
+    """Build the query in a worker, it is a module function, so process pools can pickle it."""
+    return query.build()
+
+
+def build_many(
+    queries: Iterable[BuildableQuery],
+    executor: Executor | None = None,
+    *,
+    chunksize: int = 1,
+) -> list[RenderedQuery]:
+    """Build queries on the executor, results are in the order of the queries.
+
+    Queries are built one by one in the calling thread without an executor.
+    A process pool pickles queries and rendered results, `chunksize` sends them in batches.
+    """
+    if executor is None:
+        return [query.build() for query in queries]
+    return list(executor.map(build_query, queries, chunksize=chunksize))
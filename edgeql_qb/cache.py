@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from threading import Lock
+from typing import Any, NamedTuple, Protocol
+
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.render.types import RenderedQuery
+
+
+class CacheableQuery(Protocol):
+    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
+        ...  # pragma: no cover
+
+    def _structure(self, values: list[Any]) -> Hashable:
+        ...  # pragma: no cover
+
+
+class QueryTemplate(NamedTuple):
+    query: str
+    names: tuple[str, ...]
+
+
+def parameter_index(name: str) -> int:
+    """Index of `$prefix_N` parameter assigned by the build generator."""
+    return int(name.rpartition('_')[2])
+
+
+class BuildCache:
+    """LRU cache of rendered queries keyed by query structure with literal values left out.
+
+    Cached query text is reused for every query of the same structure,
+    and the parameters are extracted from the query on every call.
+    The cache can be shared by threads, queries are rendered outside of the lock,
+    so a structure missed by several threads at once may be rendered more than once.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        assert maxsize > 0, 'Cache size should be positive'
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict[Hashable, QueryTemplate]()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def build(self, query: CacheableQuery) -> RenderedQuery:
+        values: list[Any] = []
+        key = query._structure(values)
+        template = self._lookup(key)
+        if template is None:
+            return self._render(key, query, values)
+        return RenderedQuery(template.query, FrozenDict(zip(template.names, values)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _lookup(self, key: Hashable) -> QueryTemplate | None:
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template
+
+    def _render(self, key: Hashable, query: CacheableQuery, values: list[Any]) -> RenderedQuery:
+        rendered = query.build()
+        names = tuple(sorted(rendered.context, key=parameter_index))
+        assert len(names) == len(values), f'Query parameters mismatch: {names} {values}'
+        with self._lock:
+            self._templates[key] = QueryTemplate(rendered.query, names)
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return rendered
@@ -0,0 +1,115 @@
+import ast
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import reduce
+from types import ModuleType
+from typing import Any
+
+from edgeql_qb.render.context import RenderContext
+from edgeql_qb.render.query_literal import literal_value
+from edgeql_qb.render.types import BuildableQuery, RenderedQuery
+from edgeql_qb.types import Arg
+
+__all__ = ['Arg', 'RegisteredQuery', 'register']
+
+
+@dataclass(slots=True, frozen=True)
+class RegisteredQuery:
+    """Query which is rendered ahead of time by `python -m edgeql_qb.codegen`."""
+
+    query: BuildableQuery
+
+
+def register(query: BuildableQuery) -> RegisteredQuery:
+    """Mark the query for code generation, it's generated under the name of the variable."""
+    return RegisteredQuery(query)
+
+
+def registered_queries(module: ModuleType) -> list[tuple[str, RegisteredQuery]]:
+    return [
+        (name, value)
+        for name, value in vars(module).items()
+        if isinstance(value, RegisteredQuery)
+    ]
+
+
+def annotation_types(value: Any) -> list[type]:
+    """Type of the parameter value followed by types of elements of collections."""
+    if isinstance(value, tuple):
+        # collections are passed to queries as tuples, the first element defines the type
+        assert value, 'Element type of an empty sample is unknown'
+        return [Sequence, *annotation_types(value[0])]
+    return [type(value)]
+
+
+def type_name(value_type: type) -> str:
+    if value_type.__module__ == 'builtins':
+        return value_type.__qualname__
+    return f'{value_type.__module__}.{value_type.__qualname__}'
+
+
+def annotation(arg: Arg) -> str:
+    names = [type_name(value_type) for value_type in annotation_types(literal_value(arg.sample))]
+    return reduce(lambda inner, outer: f'{outer}[{inner}]', reversed(names))
+
+
+def is_literal(text: str, value: Any) -> bool:
+    with suppress(ValueError, SyntaxError):
+        return bool(ast.literal_eval(text) == value)
+    return False
+
+
+def constant(value: Any) -> str:
+    text = repr(value)
+    assert is_literal(text, value), f'{value!r} is not a literal, make it an `Arg`'
+    return text
+
+
+def generate_function(name: str, rendered: RenderedQuery) -> str:
+    args: dict[str, Arg] = {}
+    items = []
+    for parameter, value in rendered.context.items():
+        if isinstance(value, Arg):
+            known = args.setdefault(value.name, value)
+            assert annotation(known) == annotation(value), f'Argument {value.name} changes type'
+            items.append(f'{parameter!r}: {value.name}')
+        else:
+            items.append(f'{parameter!r}: {constant(value)}')
+    signature = ', '.join(f'{arg.name}: {annotation(arg)}' for arg in args.values())
+    return (
+        f'{name.upper()} = {rendered.query!r}\n'
+        '\n'
+        '\n'
+        f'def {name}({signature}) -> dict[str, Any]:\n'
+        f'    return {{{", ".join(items)}}}\n'
+    )
+
+
+def annotation_modules(rendered: list[RenderedQuery]) -> list[str]:
+    modules = {
+        value_type.__module__
+        for query in rendered
+        for value in query.context.values()
+        if isinstance(value, Arg)
+        for value_type in annotation_types(literal_value(value.sample))
+    }
+    return sorted(modules - {'builtins'})
+
+
+def generate_module(module: ModuleType) -> str:
+    """Render registered queries of the module into Python source without edgeql_qb imports."""
+    queries = registered_queries(module)
+    assert queries, f'No registered queries in {module.__name__}'
+    rendered = [query.query.build(RenderContext(dedup=True)) for _, query in queries]
+    imports = [f'import {name}\n' for name in annotation_modules(rendered)]
+    functions = [
+        generate_function(name, query)
+        for (name, _), query in zip(queries, rendered, strict=True)
+    ]
+    return ''.join([
+        f'"""Generated by `python -m edgeql_qb.codegen {module.__name__}`, do not edit."""\n',
+        *imports,
+        'from typing import Any\n',
+        *(f'\n\n{function}' for function in functions),
+    ])
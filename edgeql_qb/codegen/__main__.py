@@ -0,0 +1,55 @@
+"""Render registered queries into Python modules: `python -m edgeql_qb.codegen --help`."""
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+from edgeql_qb.codegen import generate_module
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m edgeql_qb.codegen', description=__doc__)
+    parser.add_argument('modules', nargs='+', help='modules with registered queries')
+    parser.add_argument(
+        '--suffix',
+        default='_edgeql',
+        help='suffix of generated modules, they are written next to the source modules',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='do not write anything, exit with non-zero code if generated modules are outdated',
+    )
+    return parser.parse_args()
+
+
+def output_path(module_name: str, suffix: str) -> Path:
+    source = Path(str(importlib.import_module(module_name).__file__))
+    return source.with_name(f'{source.stem}{suffix}.py')
+
+
+def generate(module_name: str, suffix: str, *, check: bool) -> bool:
+    """Write the generated module, return whether it was up to date."""
+    source = generate_module(importlib.import_module(module_name))
+    path = output_path(module_name, suffix)
+    if path.exists() and path.read_text() == source:
+        return True
+    if not check:
+        path.write_text(source)
+    sys.stdout.write(f'{"outdated" if check else "generated"} {path}\n')
+    return False
+
+
+def main() -> int:
+    args = parse_args()
+    sys.path.insert(0, '')
+    outdated = [
+        module
+        for module in args.modules
+        if not generate(module, args.suffix, check=args.check)
+    ]
+    return 1 if args.check and outdated else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
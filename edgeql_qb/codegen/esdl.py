@@ -0,0 +1,207 @@
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import dropwhile, takewhile
+
+TOKENS = re.compile(
+    r"""
+    (?P<skip>\s+|\#[^\n]*)
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|\$(?P<tag>\w*)\$.*?\$(?P=tag)\$)
+    | (?P<name>`[^`]+`|[A-Za-z_]\w*(?:::[A-Za-z_]\w*)*)
+    | (?P<punctuation>:=|->|\S)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+OPENING = {'{': '}', '(': ')', '[': ']'}
+POINTER_QUALIFIERS = {'required', 'optional', 'single', 'multi', 'overloaded'}
+# every object type has the identity, it comes from `std::BaseObject`
+BASE_PROPERTIES = (('id', 'uuid'),)
+
+
+@dataclass(slots=True, frozen=True)
+class Statement:
+    """Tokens of a declaration and statements of its block, if it has any."""
+
+    head: tuple[str, ...]
+    body: tuple['Statement', ...] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Pointer:
+    """Property or link, `target` is None for computed ones.
+
+    `kind` is None when the keyword is omitted, links are told apart by the target then.
+    """
+
+    name: str
+    target: str | None
+    kind: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ObjectType:
+    module: str
+    name: str
+    bases: tuple[str, ...] = ()
+    pointers: tuple[Pointer, ...] = ()
+    abstract: bool = False
+
+    @property
+    def qualified_name(self) -> str:
+        return f'{self.module}::{self.name}'
+
+
+@dataclass(slots=True, frozen=True)
+class Member:
+    """Resolved pointer, `target` is a qualified object type for links."""
+
+    name: str
+    target: str | None
+    is_link: bool
+
+
+@dataclass(slots=True)
+class Schema:
+    types: dict[str, ObjectType] = field(default_factory=dict)
+
+    def add(self, object_type: ObjectType) -> None:
+        name = object_type.qualified_name
+        assert name not in self.types, f'Type {name} is declared twice'
+        self.types[name] = object_type
+
+    def resolve(self, name: str, module: str) -> str:
+        """Qualify the name of an object type declared in the schema, others are left as is."""
+        local = f'{module}::{name}'
+        return local if '::' not in name and local in self.types else name
+
+    def members(self, name: str) -> dict[str, Member]:
+        """Pointers of the type including inherited ones, own pointers come last."""
+        object_type = self.types[name]
+        members = self.inherited(object_type)
+        for pointer in object_type.pointers:
+            members[pointer.name] = self.member(pointer, object_type.module)
+        return members
+
+    def inherited(self, object_type: ObjectType) -> dict[str, Member]:
+        members = {
+            property_name: Member(property_name, type_name, is_link=False)
+            for property_name, type_name in BASE_PROPERTIES
+        }
+        bases = (self.resolve(base, object_type.module) for base in object_type.bases)
+        for base in bases:
+            # bases which are not declared in the schema come from the standard library
+            members.update(self.members(base) if base in self.types else {})
+        return members
+
+    def member(self, pointer: Pointer, module: str) -> Member:
+        target = None if pointer.target is None else self.resolve(pointer.target, module)
+        return Member(
+            pointer.name,
+            target,
+            is_link=target in self.types and pointer.kind != 'property',
+        )
+
+
+def tokenize(text: str) -> Iterator[str]:
+    for match in TOKENS.finditer(text):
+        if match.lastgroup != 'skip':
+            yield match.group().strip('`') if match.lastgroup == 'name' else match.group()
+
+
+def parse_statements(  # noqa: C901
+    tokens: Iterator[str],
+    closing: str | None = None,
+) -> tuple[Statement, ...]:
+    """Split tokens into statements, they end with `;` or with a block."""
+    statements = []
+    head: list[str] = []
+    for token in takewhile(lambda token: token != closing, tokens):
+        if token == '{' and head:
+            statements.append(Statement(tuple(head), parse_statements(tokens, '}')))
+            head = []
+        elif token in OPENING:
+            head.extend([token, *skip_group(tokens, OPENING[token])])
+        elif token == ';':
+            statements.append(Statement(tuple(head)))
+            head = []
+        else:
+            head.append(token)
+    statements.append(Statement(tuple(head)))
+    return tuple(statement for statement in statements if statement.head)
+
+
+def skip_group(tokens: Iterator[str], closing: str) -> Iterator[str]:
+    """Tokens up to the closing bracket, brackets inside are not statements."""
+    for token in takewhile(lambda token: token != closing, tokens):
+        yield token
+        if token in OPENING:
+            yield from skip_group(tokens, OPENING[token])
+    yield closing
+
+
+def type_expression(tokens: Iterable[str]) -> str:
+    return ''.join(f'{token} ' if token in {',', ':'} else token for token in tokens)
+
+
+def pointer_kind(head: tuple[str, ...]) -> tuple[str | None, tuple[str, ...]]:
+    """Split off qualifiers and the keyword, which may be omitted."""
+    declaration = tuple(dropwhile(POINTER_QUALIFIERS.__contains__, head))
+    if declaration[:1] in {('property',), ('link',)}:
+        return declaration[0], declaration[1:]
+    return None, declaration
+
+
+def parse_pointer(head: tuple[str, ...]) -> Pointer | None:
+    """Parse `[required] [multi] [property | link] name (-> | :) type` or a computed one.
+
+    Other declarations, like annotations and constraints, are not pointers.
+    """
+    kind, declaration = pointer_kind(head)
+    match declaration:
+        case (name, '->' | ':', *target) if target:
+            return Pointer(name, type_expression(target), kind)
+        case (name, ':=', *_):
+            return Pointer(name, None, kind)
+    return None
+
+
+def parse_type(module: str, statement: Statement) -> ObjectType:
+    head = statement.head
+    abstract = head[0] == 'abstract'
+    name = head[head.index('type') + 1]
+    bases = head[head.index('extending') + 1:] if 'extending' in head else ()
+    pointers = [parse_pointer(member.head) for member in statement.body or ()]
+    return ObjectType(
+        module=module,
+        name=name,
+        bases=tuple(base for base in bases if base != ','),
+        pointers=tuple(pointer for pointer in pointers if pointer is not None),
+        abstract=abstract,
+    )
+
+
+def is_object_type(head: tuple[str, ...]) -> bool:
+    return head[:1] == ('type',) or head[:2] == ('abstract', 'type')
+
+
+def module_types(module: str, statements: Iterable[Statement]) -> Iterator[ObjectType]:
+    for statement in statements:
+        yield from statement_types(module, statement)
+
+
+def statement_types(module: str, statement: Statement) -> Iterator[ObjectType]:
+    if statement.head[:1] == ('module',) and statement.body is not None:
+        yield from module_types(statement.head[1], statement.body)
+    elif is_object_type(statement.head):
+        yield parse_type(module, statement)
+
+
+def parse_esdl(text: str, schema: Schema | None = None) -> Schema:
+    """Collect object types of the schema file, everything else is skipped.
+
+    Types of several files go to the same schema, so links can refer across files.
+    """
+    schema = Schema() if schema is None else schema
+    for object_type in module_types('default', parse_statements(tokenize(text))):
+        schema.add(object_type)
+    return schema
@@ -0,0 +1,110 @@
+import keyword
+from collections.abc import Sequence
+
+from edgeql_qb.codegen.esdl import Member, ObjectType, Schema
+from edgeql_qb.expression import LinkColumn
+
+DEFAULT_MODULE = 'default'
+
+
+def class_name(object_type: ObjectType) -> str:
+    """Python name of the model, types of other modules are prefixed with the module."""
+    if object_type.module == DEFAULT_MODULE:
+        return object_type.name
+    prefix = ''.join(part[:1].upper() + part[1:] for part in object_type.module.split('::'))
+    return f'{prefix}{object_type.name}'
+
+
+def is_attribute(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def attributes(schema: Schema, object_type: ObjectType) -> list[Member]:
+    # names which are not identifiers are unreachable by attribute access anyway
+    members = schema.members(object_type.qualified_name).values()
+    return [member for member in members if is_attribute(member.name)]
+
+
+def link_class(schema: Schema, member: Member) -> str:
+    assert member.target is not None
+    return f'{class_name(schema.types[member.target])}Link'
+
+
+def generate_link(schema: Schema, object_type: ObjectType) -> str:
+    """Link to the type, its path steps are resolved by `LinkColumn`."""
+    members = attributes(schema, object_type)
+    properties = [
+        f'        {member.name!r}: {member.target!r},\n'
+        for member in members
+        if not member.is_link
+    ]
+    # attributes of columns themselves shadow the steps of the same names
+    annotations = [
+        f'    {member.name}: {link_class(schema, member)!r}\n'
+        if member.is_link
+        else f'    {member.name}: Column\n'
+        for member in members
+        if not hasattr(LinkColumn, member.name)
+    ]
+    return ''.join([
+        f'class {class_name(object_type)}Link(LinkColumn):\n',
+        '    __slots__ = ()\n',
+        '    properties = {\n',
+        *properties,
+        '    }\n',
+        '\n',
+        *annotations,
+    ])
+
+
+def generate_links(schema: Schema, object_type: ObjectType) -> str:
+    """Targets are assigned after all classes are declared, links may form cycles."""
+    links = ', '.join(
+        f'{member.name!r}: {link_class(schema, member)}'
+        for member in attributes(schema, object_type)
+        if member.is_link
+    )
+    return f'{class_name(object_type)}Link.links = {{{links}}}\n' if links else ''
+
+
+def generate_column(schema: Schema, member: Member) -> str:
+    if member.is_link:
+        return f'    {member.name} = {link_class(schema, member)}({member.name!r})\n'
+    return f'    {member.name} = Column({member.name!r}, type_name={member.target!r})\n'
+
+
+def generate_model(schema: Schema, object_type: ObjectType) -> str:
+    name = class_name(object_type)
+    module = '' if object_type.module == DEFAULT_MODULE else f', module={object_type.module!r}'
+    return ''.join([
+        f'class {name}Columns(ModelColumns):\n',
+        *(generate_column(schema, member) for member in attributes(schema, object_type)),
+        '\n',
+        '\n',
+        '@dataclass(slots=True, frozen=True)\n',
+        f'class {name}Model(EdgeDBModel):\n',
+        f'    c: {name}Columns = field(default_factory={name}Columns)\n',
+        '\n',
+        '\n',
+        f'{name} = {name}Model({object_type.name!r}{module})\n',
+    ])
+
+
+def generate_models(schema: Schema, sources: Sequence[str]) -> str:
+    """Render models of object types of the schema into Python source."""
+    types = list(schema.types.values())
+    assert types, 'No object types in the schema'
+    names = [class_name(object_type) for object_type in types]
+    assert len(set(names)) == len(names), 'Names of generated models collide'
+    links = ''.join(generate_links(schema, object_type) for object_type in types)
+    return ''.join([
+        '"""Generated by `python -m edgeql_qb.codegen.models '
+        f'{" ".join(sources)}`, do not edit."""\n',
+        'from dataclasses import dataclass, field\n',
+        '\n',
+        'from edgeql_qb import EdgeDBModel\n',
+        'from edgeql_qb.expression import Column, LinkColumn, ModelColumns\n',
+        *(f'\n\n{generate_link(schema, object_type)}' for object_type in types),
+        f'\n\n{links}' if links else '',
+        *(f'\n\n{generate_model(schema, object_type)}' for object_type in types),
+    ])
@@ -0,0 +1,45 @@
+"""Generate models from schema files: `python -m edgeql_qb.codegen.models --help`."""
+import argparse
+import sys
+from pathlib import Path
+
+from edgeql_qb.codegen.esdl import Schema, parse_esdl
+from edgeql_qb.codegen.models import generate_models
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m edgeql_qb.codegen.models',
+        description=__doc__,
+    )
+    parser.add_argument('schema', nargs='+', help='.esdl files of the schema')
+    parser.add_argument('--output', '-o', required=True, help='path of the generated module')
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='do not write anything, exit with non-zero code if the generated module is outdated',
+    )
+    return parser.parse_args()
+
+
+def read_schema(paths: list[str]) -> Schema:
+    schema = Schema()
+    for path in paths:
+        parse_esdl(Path(path).read_text(), schema)
+    return schema
+
+
+def main() -> int:
+    args = parse_args()
+    source = generate_models(read_schema(args.schema), args.schema)
+    output = Path(args.output)
+    if output.exists() and output.read_text() == source:
+        return 0
+    if not args.check:
+        output.write_text(source)
+    sys.stdout.write(f'{"outdated" if args.check else "generated"} {output}\n')
+    return 1 if args.check else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Protocol
+
+from edgeql_qb.analyze import Analysis, parse_analysis, render_analyze
+from edgeql_qb.render.types import BuildableQuery, CompiledQuery, RenderedQuery
+
+
+class AsyncClient(Protocol):
+    async def query(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        ...  # pragma: no cover
+
+    async def query_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        ...  # pragma: no cover
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        ...  # pragma: no cover
+
+
+Executable = BuildableQuery | RenderedQuery | CompiledQuery
+
+
+def render(query: Executable) -> RenderedQuery | CompiledQuery:
+    """Build the query unless it is rendered already."""
+    if isinstance(query, RenderedQuery | CompiledQuery):
+        return query
+    return query.build()
+
+
+async def fetch(query: Executable, client: AsyncClient) -> Any:
+    """Build the query once and return all of its results."""
+    rendered = render(query)
+    return await client.query(rendered.query, **rendered.context)
+
+
+async def fetch_single(query: Executable, client: AsyncClient) -> Any:
+    """Build the query once and return its only result or None."""
+    rendered = render(query)
+    return await client.query_single(rendered.query, **rendered.context)
+
+
+async def execute(query: Executable, client: AsyncClient) -> None:
+    """Build the query once and execute it without fetching results."""
+    rendered = render(query)
+    await client.execute(rendered.query, **rendered.context)
+
+
+async def fetch_analysis(query: Executable, client: AsyncClient) -> Analysis:
+    """Execute the query with `analyze` and parse the plan returned by the server."""
+    rendered = render_analyze(render(query))
+    output = await client.query_single(rendered.query, **rendered.context)
+    return parse_analysis(output)
+
+
+async def gather(
+    queries: Iterable[Executable],
+    client: AsyncClient,
+    *,
+    concurrency: int | None = None,
+    method: Callable[[Executable, AsyncClient], Awaitable[Any]] = fetch,
+) -> list[Any]:
+    """Run queries in parallel and return their results in the order of queries.
+
+    At most `concurrency` queries are awaited at the same time, all of them by default.
+    Queries are built before the first of them is sent, so the rendering errors
+    are raised before anything is executed.
+    """
+    assert concurrency is None or concurrency > 0, 'Concurrency should be positive'
+    rendered = [render(query) for query in queries]
+    if concurrency is None or concurrency >= len(rendered):
+        return list(await asyncio.gather(*(method(query, client) for query in rendered)))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(query: Executable) -> Any:
+        async with semaphore:
+            return await method(query, client)
+
+    return list(await asyncio.gather(*(bounded(query) for query in rendered)))
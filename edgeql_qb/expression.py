@@ -1,15 +1,11 @@
 from abc import ABC, abstractmethod
-from collections import deque
-from collections.abc import Iterator
+from collections.abc import Hashable, Iterator
 from dataclasses import dataclass, field, replace
-from enum import Enum, auto
-from functools import singledispatch
 from typing import (
     TYPE_CHECKING,
     Any,
-    Generic,
+    ClassVar,
     Optional,
-    TypeVar,
     Union,
     cast,
 )
@@ -21,12 +17,10 @@ from edgeql_qb.operators import (
     Node,
     OperationsMixin,
     OpLiterals,
-    Ops,
     SortedExpression,
     UnaryOp,
-    sort_ops,
 )
-from edgeql_qb.types import GenericHolder, unsafe_text
+from edgeql_qb.types import INFERRED_HOLDERS, SCALAR_HOLDERS, Arg, GenericHolder, unsafe_text
 
 if TYPE_CHECKING:
     from edgeql_qb.queries import EdgeDBModel  # pragma: no cover
@@ -38,26 +32,14 @@ class QueryLiteral:
     value: Any
 
 
-class SymbolType(Enum):
-    column = auto()
-    shape = auto()
-    sort_direction = auto()
-    literal = auto()
-    operator = auto()
-    subquery = auto()
-    alias = auto()
-    text = auto()
-    func_invocation = auto()
-
-
 @dataclass(slots=True, frozen=True)
 class Shape:
     parent: 'Column'
     columns: tuple[Union['Column', 'Shape'], ...]
     filters: tuple['Expression', ...] = field(default_factory=tuple)
     ordered_by: tuple['Expression', ...] = field(default_factory=tuple)
-    limit_val: int | unsafe_text | FuncInvocation | None = None
-    offset_val: int | unsafe_text | FuncInvocation | None = None
+    limit_val: int | Arg | unsafe_text | FuncInvocation | None = None
+    offset_val: int | Arg | unsafe_text | FuncInvocation | None = None
 
     def where(self, compared: Union['BinaryOp', 'UnaryOp', 'FuncInvocation']) -> 'Shape':
         return replace(self, filters=(*self.filters, Expression(compared)))
@@ -69,23 +51,51 @@ class Shape:
         new_expressions = [Expression(exp) for exp in columns]
         return replace(self, ordered_by=(*self.ordered_by, *new_expressions))
 
-    def limit(self, value: int | FuncInvocation | unsafe_text) -> 'Shape':
+    def limit(self, value: int | Arg | FuncInvocation | unsafe_text) -> 'Shape':
         return replace(self, limit_val=value)
 
-    def offset(self, value: int | FuncInvocation | unsafe_text) -> 'Shape':
+    def offset(self, value: int | Arg | FuncInvocation | unsafe_text) -> 'Shape':
         return replace(self, offset_val=value)
 
 
 @dataclass(slots=True, frozen=True)
 class Column(OperationsMixin):
+    """Property or link, a step of the path from the object being queried.
+
+    Steps are interned: a column builds each step once and returns the same node
+    afterwards, so the path and its rendered forms are computed once as well.
+    """
+
     column_name: str
     parent: Optional['Column'] = None
+    # EdgeDB type of the property, it is known for columns of generated models
+    type_name: str | None = field(default=None, compare=False)
+    path: tuple[str, ...] = field(init=False, compare=False, repr=False)
+    _steps: dict[str, 'Column'] = field(
+        default_factory=dict,
+        init=False,
+        compare=False,
+        repr=False,
+    )
+    _dotted: dict[str, str] = field(default_factory=dict, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        parent_path = () if self.parent is None else self.parent.path
+        object.__setattr__(self, 'path', (*parent_path, self.column_name))
 
     def __call__(self, *columns: Union['Column', Shape]) -> Shape:
         return Shape(self, columns)
 
     def __getattr__(self, name: str) -> 'Column':
-        return Column(name, self)
+        if name == '_steps':
+            # the object is not initialized yet, e.g. while it is being copied
+            raise AttributeError(name)
+        # steps are looked up by name, columns themselves can't be keys: `==` builds a filter
+        step = self._steps.get(name)
+        if step is None:
+            # threads racing for a new step agree on the one stored first
+            step = self._steps.setdefault(name, self._step(name))
+        return step
 
     def __eq__(self, other: Any) -> BinaryOp:  # type: ignore[override]
         return BinaryOp('=', self, other)
@@ -93,6 +103,34 @@ class Column(OperationsMixin):
     def __ne__(self, other: Any) -> BinaryOp:  # type: ignore[override]
         return BinaryOp('!=', self, other)
 
+    def _step(self, name: str) -> 'Column':
+        return Column(name, self)
+
+    def dotted(self, prefix: str) -> str:
+        """Render the whole path, like `.a.b` for the `.` prefix."""
+        rendered = self._dotted.get(prefix)
+        if rendered is None:
+            rendered = self._dotted.setdefault(prefix, f'{prefix}{".".join(self.path)}')
+        return rendered
+
+
+@dataclass(slots=True, frozen=True)
+class LinkColumn(Column):
+    """Link of a generated model, its properties and links are known ahead of time.
+
+    Unknown names raise AttributeError instead of becoming columns.
+    """
+
+    properties: ClassVar[dict[str, str | None]] = {}
+    links: ClassVar[dict[str, type['LinkColumn']]] = {}
+
+    def _step(self, name: str) -> Column:
+        if name in self.links:
+            return self.links[name](name, self)
+        if name in self.properties:
+            return Column(name, self, self.properties[name])
+        raise AttributeError(f'{type(self).__name__} has no property or link {name!r}')
+
 
 SelectExpressions = (
     Column
@@ -111,6 +149,9 @@ class BaseModel:
 
 
 class SubQuery(ABC):
+    # queries without side effects, their repetitions can be evaluated once
+    hoistable: ClassVar[bool] = False
+
     @abstractmethod
     def build(self, generator: Iterator[int] | None = None) -> 'RenderedQuery':
         raise NotImplementedError()  # pragma: no cover
@@ -118,6 +159,10 @@ class SubQuery(ABC):
     def label(self, name: str) -> BinaryOp:
         return BinaryOp(':=', Alias(name), self)
 
+    @abstractmethod
+    def _structure(self, values: list[Any]) -> Hashable:
+        raise NotImplementedError()  # pragma: no cover
+
 
 class UpdateSubQuery(SubQuery):
     pass
@@ -144,76 +189,6 @@ AnyExpression = (
     | unsafe_text
 )
 FilterExpressions = BinaryOp | UnaryOp
-StackType = TypeVar('StackType')
-
-
-class Stack(Generic[StackType]):
-    def __init__(self) -> None:
-        self._stack = deque[StackType]()
-
-    def push(self, frame: StackType) -> None:
-        self._stack.append(frame)
-
-    def pop(self) -> StackType:
-        return self._stack.pop()
-
-    def popn(self, argcount: int) -> list[StackType]:
-        return [self._stack.pop() for _ in range(argcount)]
-
-
-@singledispatch
-def _determine_type(value: Any) -> SymbolType:
-    return SymbolType.literal
-
-
-@_determine_type.register
-def _(value: Column) -> SymbolType:
-    return SymbolType.column
-
-
-@_determine_type.register
-def _(value: Shape) -> SymbolType:
-    return SymbolType.shape
-
-
-@_determine_type.register
-def _(value: SubQuery) -> SymbolType:
-    return SymbolType.subquery
-
-
-@_determine_type.register
-def _(value: Alias) -> SymbolType:
-    return SymbolType.alias
-
-
-@_determine_type.register
-def _(value: unsafe_text) -> SymbolType:
-    return SymbolType.text
-
-
-@_determine_type.register
-def _(value: FuncInvocation) -> SymbolType:
-    return SymbolType.func_invocation
-
-
-@_determine_type.register
-def _(value: str) -> SymbolType:
-    if value in sort_ops:
-        return SymbolType.sort_direction
-    elif value in Ops:
-        return SymbolType.operator
-    else:
-        return SymbolType.literal
-
-
-class Symbol:
-    __slots__ = 'value', 'type', 'arity', 'depth'
-
-    def __init__(self, value: Any, arity: int | None = None, depth: int = 0):
-        self.value = value
-        self.type = _determine_type(value)
-        self.arity = arity
-        self.depth = depth
 
 
 def build_binary_op(op: OpLiterals, left: Node, right: Node) -> Node:
@@ -234,41 +209,32 @@ def build_unary_op(op: OpLiterals, argument: Node) -> Node:
     return Node(argument, op)
 
 
-def evaluate(stack: Stack[AnyExpression], symbol: Symbol) -> None:  # noqa: C901
-    match symbol.type:
-        case (
-            SymbolType.column
-            | SymbolType.shape
-            | SymbolType.text
-            | SymbolType.alias
-            | SymbolType.subquery
-        ):
-            stack.push(symbol.value)
-        case SymbolType.operator:
-            match symbol.arity:
-                case 1:
-                    argument = stack.pop()
-                    stack.push(build_unary_op(symbol.value, cast(Node, argument)))
-                case 2:
-                    left, right = stack.popn(2)
-                    stack.push(build_binary_op(symbol.value, cast(Node, left), cast(Node, right)))
-                case _:  # pragma: no cover
-                    assert False
-        case SymbolType.literal:
-            stack.push(QueryLiteral(symbol.value))
-        case SymbolType.sort_direction:
-            sorted_expression = stack.pop()
-            stack.push(SortedExpression(cast(OperationsMixin, sorted_expression), symbol.value))
-        case SymbolType.func_invocation:
-            args = stack.popn(symbol.value.arity)
-            invocation = FuncInvocation(
-                func=symbol.value.func,
-                args=tuple(args),
-                arity=symbol.value.arity,
-            )
-            stack.push(invocation)
-        case _:  # pragma: no cover
-            assert False
+def typed_operand(operand: Any, other: Any) -> Any:
+    """Cast a number to the type of the property it is compared with or assigned to.
+
+    Python numbers have no exact EdgeDB counterpart, but generated models know the type.
+    """
+    holder = SCALAR_HOLDERS.get(other.type_name or '') if isinstance(other, Column) else None
+    if holder is None:
+        return operand
+    if isinstance(operand, list | tuple | set | frozenset):
+        # elements of `in` collections have the type of the property too
+        return tuple(typed_number(item, holder) for item in operand)
+    return typed_number(operand, holder)
+
+
+def typed_number(value: Any, holder: type[GenericHolder[Any]]) -> Any:
+    return holder(value) if type(value) in (int, float) else value
+
+
+def inferred_operand(operand: Any, column: Column) -> Any:
+    """Cast a number to the type of the property, int64 or float64 when the type is unknown.
+
+    Parameters without casts are rejected by the server, so generated filters cast them.
+    """
+    operand = typed_operand(operand, column)
+    holder = INFERRED_HOLDERS.get(type(operand))
+    return operand if holder is None else holder(operand)
 
 
 def _replace_alias_with_label(node: Any, depth: int) -> Any:
@@ -284,53 +250,76 @@ def _replace_alias_with_label(node: Any, depth: int) -> Any:
             return node
 
 
+def normalize(expr: Any, depth: int = 0) -> 'AnyExpression':  # noqa: C901
+    """Convert user's expression to the tree of nodes ready for rendering.
+
+    Operations become `Node`s with simplified signs, nested assignments become labels
+    and python values become `QueryLiteral`s.
+    """
+    match expr:
+        case UnaryOp(operation, element):
+            # a := -(b := 1) -> a := -b
+            element = _replace_alias_with_label(element, depth)
+            return build_unary_op(operation, cast(Node, normalize(element, depth + 1)))
+        case BinaryOp(operation, left, right):
+            new_depth = depth + 1
+            # a := (b := value) + 1 -> a := b + 1
+            left = _replace_alias_with_label(left, new_depth)
+            # a := 1 + (b := value) -> a := 1 + b
+            right = _replace_alias_with_label(right, new_depth)
+            left, right = typed_operand(left, right), typed_operand(right, left)
+            return build_binary_op(
+                operation,
+                cast(Node, normalize(left, new_depth)),
+                cast(Node, normalize(right, new_depth)),
+            )
+        case SortedExpression(expression, direction):
+            return SortedExpression(
+                cast(OperationsMixin, normalize(expression, depth + 1)),
+                direction,
+            )
+        case FuncInvocation(func, args, arity):
+            # a := fun(b := 1, c := 2) -> a := fun(b, c)
+            normalized_args = tuple(
+                normalize(_replace_alias_with_label(arg, depth), depth + 1)
+                for arg in args
+            )
+            return FuncInvocation(func=func, args=normalized_args, arity=arity)
+        case Column() | Alias() | Shape() | SubQuery() | Node() | QueryLiteral() | unsafe_text():
+            return expr
+        case _:
+            return QueryLiteral(expr)
+
+
 class Expression:
+    """Expression normalized once, at the moment of query construction."""
+
+    __slots__ = ('tree',)
+
     def __init__(self, expression: AnyExpression):
-        self.serialized = tuple(self._to_polish_notation(expression))
+        self.tree = normalize(expression)
 
     def to_infix_notation(self) -> 'AnyExpression':
-        stack = Stack[AnyExpression]()
-        for symbol in reversed(self.serialized):
-            evaluate(stack, symbol)
-        return stack.pop()
-
-    def _to_polish_notation(  # noqa: C901
-            self,
-            expr: AnyExpression,
-            depth: int = 0,
-    ) -> Iterator[Symbol]:
-        match expr:
-            case Column() | Alias():
-                yield Symbol(expr, depth=depth)
-            case UnaryOp(operation, element):
-                yield Symbol(operation, arity=1, depth=depth)
-                # a := -(b := 1) -> a := -b
-                element = _replace_alias_with_label(element, depth)
-                yield from self._to_polish_notation(element, depth + 1)
-            case BinaryOp(operation, left, right):
-                yield Symbol(operation, arity=2, depth=depth)
-
-                new_depth = depth + 1
-                # a := (b := value) + 1 -> a := b + 1
-                left = _replace_alias_with_label(left, new_depth)
-                # a := 1 + (b := value) -> a := 1 + b
-                right = _replace_alias_with_label(right, new_depth)
-
-                yield from self._to_polish_notation(left, new_depth)
-                yield from self._to_polish_notation(right, new_depth)
-            case SortedExpression(expression, direction):
-                yield Symbol(direction, depth=depth)
-                yield from self._to_polish_notation(expression, depth + 1)
-            case FuncInvocation(_, args):
-                yield Symbol(expr, arity=expr.arity, depth=depth)
-                for arg in args:
-                    # a := fun(b := 1, c := 2) -> a := fun(b, c)
-                    flat_arg = _replace_alias_with_label(arg, depth)
-                    yield from self._to_polish_notation(flat_arg, depth + 1)
-            case _:
-                yield Symbol(expr, depth=depth)
+        return self.tree
+
+
+_root_columns: dict[str, Column] = {}
 
 
 class Columns:
     def __getattribute__(self, name: str) -> Column:
-        return Column(name)
+        if name.startswith('__'):
+            # names with double underscores are reserved by EdgeDB, they belong to the object,
+            # e.g. `__reduce_ex__` is looked up to pickle models for process pools
+            return object.__getattribute__(self, name)  # type: ignore[no-any-return]
+        # columns don't refer to models, so models share the first steps of their paths
+        column = _root_columns.get(name)
+        if column is None:
+            column = _root_columns.setdefault(name, Column(name))
+        return column
+
+
+class ModelColumns(Columns):
+    """Columns of a generated model, they are class attributes created once."""
+
+    __getattribute__ = object.__getattribute__
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Iterator, Mapping
-from functools import reduce
 from typing import Any
 
 
@@ -10,27 +9,86 @@ class FrozenDict(Mapping[str, Any]):
 
     Python 3.10 has no hashable mapping type, so I steel this class from here:
     https://stackoverflow.com/a/2704866.
+
+    Union does not copy its operands: the result keeps references to both of them,
+    and they are merged into a plain dict on the first read.
+    The hash is computed once and memoized.
     """
 
+    __slots__ = '_d', '_hash', '_operands'
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self._d = dict(*args, **kwargs)
+        self._d: dict[str, Any] | None = dict(*args, **kwargs)
+        self._operands: tuple[FrozenDict, ...] = ()
+        self._hash: int | None = None
+
+    @classmethod
+    def _union(cls, left: FrozenDict, right: FrozenDict) -> FrozenDict:
+        new = cls.__new__(cls)
+        new._d = None
+        new._operands = (left, right)
+        new._hash = None
+        return new
+
+    @property
+    def _data(self) -> dict[str, Any]:
+        # operands are read before the data: they are dropped only after the data is set,
+        # so a union merged by another thread at the same time is never read half-done
+        operands = self._operands
+        data = self._d
+        if data is None:
+            data = self._d = self._merge_operands(operands)
+            self._operands = ()
+        return data
+
+    @staticmethod
+    def _merge_operands(operands: tuple[FrozenDict, ...]) -> dict[str, Any]:
+        """Merge pending unions from left to right without recursion."""
+        merged: dict[str, Any] = {}
+        pending = list(reversed(operands))
+        while pending:
+            node = pending.pop()
+            node_operands = node._operands
+            node_data = node._d
+            if node_data is None:
+                pending.extend(reversed(node_operands))
+            else:
+                merged |= node_data
+        return merged
+
+    def __reduce__(self) -> tuple[type[FrozenDict], tuple[dict[str, Any]]]:
+        # unions are pickled merged, pickling of a long chain of operands would recurse deeply
+        return FrozenDict, (self._data,)
+
+    def _is_empty(self) -> bool:
+        # union of two non-empty mappings can't be empty, so there is no need to merge it
+        return self._d is not None and not self._d
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._d)
+        return iter(self._data)
 
     def __len__(self) -> int:
-        return len(self._d)
+        return len(self._data)
 
     def __getitem__(self, key: str) -> Any:
-        return self._d[key]
+        return self._data[key]
 
     def __or__(self, other: FrozenDict) -> FrozenDict:
-        new = dict(self)
-        new |= other
-        return FrozenDict(new)
+        if other._is_empty():
+            return self
+        if self._is_empty():
+            return other
+        return FrozenDict._union(self, other)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._data == other._data
+        return Mapping.__eq__(self, other)
 
     def __hash__(self) -> int:
-        return reduce(lambda acc, pair: acc ^ hash(pair), self.items(), 0)
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
 
     def __repr__(self) -> str:
-        return repr(self._d)
+        return repr(self._data)
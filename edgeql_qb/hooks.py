@@ -0,0 +1,92 @@
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from time import perf_counter_ns
+from typing import Any, Protocol
+
+from edgeql_qb.render.types import RenderedQuery
+
+
+@dataclass(slots=True, frozen=True)
+class StageReport:
+    """Cost of rendering one stage of a query.
+
+    `net_blocks` is the difference of allocated memory blocks before and after the stage,
+    not the number of allocations: blocks freed within the stage cancel out,
+    and blocks allocated by other threads at the same time are counted too.
+    It's always zero on interpreters other than CPython.
+    The last report of every build has the `query` stage and describes the whole query.
+    """
+
+    query: str
+    stage: str
+    elapsed_ns: int
+    net_blocks: int
+    length: int
+    parameters: int
+
+
+BuildHook = Callable[[StageReport], None]
+
+
+class StageRunner(Protocol):
+    def __call__(
+        self,
+        stage: str,
+        render: Callable[..., RenderedQuery],
+        *args: Any,
+    ) -> RenderedQuery:
+        ...  # pragma: no cover
+
+
+_subscribers: list[BuildHook] = []
+
+
+def subscribe(hook: BuildHook) -> BuildHook:
+    """Report stages of all queries to the hook, can be used as a decorator."""
+    _subscribers.append(hook)
+    return hook
+
+
+def unsubscribe(hook: BuildHook) -> None:
+    _subscribers.remove(hook)
+
+
+def _render(stage: str, render: Callable[..., RenderedQuery], *args: Any) -> RenderedQuery:
+    return render(*args)
+
+
+def _measure(
+    query: str,
+    subscribers: tuple[BuildHook, ...],
+    stage: str,
+    render: Callable[..., RenderedQuery],
+    *args: Any,
+) -> RenderedQuery:
+    blocks = sys.getallocatedblocks()
+    started = perf_counter_ns()
+    rendered = render(*args)
+    elapsed = perf_counter_ns() - started
+    report = StageReport(
+        query=query,
+        stage=stage,
+        elapsed_ns=elapsed,
+        net_blocks=sys.getallocatedblocks() - blocks,
+        length=len(rendered.query),
+        parameters=len(rendered.context),
+    )
+    for subscriber in subscribers:
+        subscriber(report)
+    return rendered
+
+
+def stage_runner(query: str, hooks: tuple[BuildHook, ...]) -> StageRunner:
+    """Return function rendering stages of the query and reporting them to subscribers.
+
+    Stages are rendered without any measurements when nobody is subscribed.
+    """
+    subscribers = (*_subscribers, *hooks)
+    if not subscribers:
+        return _render
+    return partial(_measure, query, subscribers)
@@ -0,0 +1,180 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import singledispatch
+from typing import Any, Literal
+from uuid import UUID
+
+from edgeql_qb.expression import Column, Expression, inferred_operand
+from edgeql_qb.operators import BinaryOp, OpLiterals, SortedExpression
+
+SeekDirection = Literal['after', 'before']
+
+# comparison that selects rows following the cursor, by the sort order of a key
+SEEK_OPERATIONS: dict[tuple[SeekDirection, str], OpLiterals] = {
+    ('after', 'asc'): '>',
+    ('after', 'desc'): '<',
+    ('before', 'asc'): '<',
+    ('before', 'desc'): '>',
+}
+
+
+REVERSED_ORDERS: dict[str, Literal['asc', 'desc']] = {'asc': 'desc', 'desc': 'asc'}
+
+
+@dataclass(slots=True, frozen=True)
+class SortKey:
+    column: Column
+    order: Literal['asc', 'desc']
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        return self.column.path
+
+    @property
+    def name(self) -> str:
+        return f'{".".join(self.path)} {self.order}'
+
+
+@dataclass(slots=True, frozen=True)
+class Cursor:
+    """Values of sort keys of a row, the page starts right after or before this row.
+
+    `keys` are names of sort keys, they protect against seeking with a different order.
+    """
+
+    keys: tuple[str, ...]
+    values: tuple[Any, ...]
+
+    def __post_init__(self) -> None:
+        empty = [key for key, value in zip(self.keys, self.values, strict=True) if value is None]
+        if empty:
+            raise ValueError(f'Sort keys {empty} of the cursor row are empty, use required ones')
+
+    @property
+    def token(self) -> str:
+        payload = [list(self.keys), [cursor_value(value) for value in self.values]]
+        return urlsafe_b64encode(_encoder.encode(payload).encode()).decode()
+
+    @classmethod
+    def from_token(cls, token: str) -> 'Cursor':
+        keys, values = json.loads(urlsafe_b64decode(token.encode()))
+        return cls(tuple(keys), tuple(VALUE_DECODERS[tag](value) for tag, value in values))
+
+
+@dataclass(slots=True, frozen=True)
+class Seek:
+    direction: SeekDirection
+    cursor: Cursor
+
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+@singledispatch
+def cursor_value(value: Any) -> tuple[str, Any]:
+    """Tagged JSON value which is decoded back to a value of the same type."""
+    raise NotImplementedError(f'{type(value)!r} is not supported in cursors')  # pragma: no cover
+
+
+@cursor_value.register(str)
+@cursor_value.register(bool)
+@cursor_value.register(int)
+@cursor_value.register(float)
+def _(value: str | bool | int | float) -> tuple[str, Any]:
+    return 'json', value
+
+
+@cursor_value.register(datetime)
+@cursor_value.register(date)
+@cursor_value.register(time)
+def _(value: datetime | date | time) -> tuple[str, Any]:
+    return type(value).__name__, value.isoformat()
+
+
+@cursor_value.register
+def _(value: timedelta) -> tuple[str, Any]:
+    return 'timedelta', value // timedelta(microseconds=1)
+
+
+@cursor_value.register(Decimal)
+@cursor_value.register(UUID)
+def _(value: Decimal | UUID) -> tuple[str, Any]:
+    return type(value).__name__.lower(), str(value)
+
+
+VALUE_DECODERS: dict[str, Callable[[Any], Any]] = {
+    'json': lambda value: value,
+    'datetime': datetime.fromisoformat,
+    'date': date.fromisoformat,
+    'time': time.fromisoformat,
+    'timedelta': lambda value: timedelta(microseconds=value),
+    'decimal': Decimal,
+    'uuid': UUID,
+}
+
+
+def sort_key(expression: Expression) -> SortKey:
+    match expression.to_infix_notation():
+        case SortedExpression(Column() as column, order):
+            return SortKey(column, order)
+        case Column() as column:
+            return SortKey(column, 'asc')
+        case tree:
+            raise NotImplementedError(f'Keyset pagination by {tree!r} is not supported')
+
+
+def sort_keys(ordered_by: tuple[Expression, ...]) -> tuple[SortKey, ...]:
+    assert ordered_by, 'Keyset pagination requires ordered query'
+    return tuple(sort_key(expression) for expression in ordered_by)
+
+
+def row_value(row: Any, path: tuple[str, ...]) -> Any:
+    """Value of a property of the query result, rows may be objects or mappings."""
+    for name in path:
+        row = row[name] if isinstance(row, Mapping) else getattr(row, name)
+    return row
+
+
+def row_cursor(ordered_by: tuple[Expression, ...], row: Any) -> Cursor:
+    keys = sort_keys(ordered_by)
+    return Cursor(
+        keys=tuple(key.name for key in keys),
+        values=tuple(row_value(row, key.path) for key in keys),
+    )
+
+
+def seek_condition(ordered_by: tuple[Expression, ...], seek: Seek) -> Expression:
+    """Condition selecting rows after or before the cursor in the order of the query.
+
+    Keys `a asc, b desc` after values `x, y` become `.a > x or .a = x and .b < y`.
+    """
+    keys = sort_keys(ordered_by)
+    assert seek.cursor.keys == tuple(key.name for key in keys), (
+        f'Cursor of {list(seek.cursor.keys)} does not match the query order'
+    )
+    pairs = list(zip(keys, seek.cursor.values, strict=True))
+    last_key, last_value = pairs[-1]
+    condition = seek_comparison(last_key, last_value, seek.direction)
+    for key, value in reversed(pairs[:-1]):
+        tie = (key.column == inferred_operand(value, key.column)) & condition
+        condition = seek_comparison(key, value, seek.direction) | tie
+    return Expression(condition)
+
+
+def seek_comparison(key: SortKey, value: Any, direction: SeekDirection) -> BinaryOp:
+    operation = key.column.op(SEEK_OPERATIONS[direction, key.order])
+    return operation(inferred_operand(value, key.column))
+
+
+def seek_order(ordered_by: tuple[Expression, ...], seek: Seek) -> tuple[Expression, ...]:
+    """Order of the page, rows before the cursor are taken backwards starting from the nearest."""
+    if seek.direction == 'after':
+        return ordered_by
+    return tuple(
+        Expression(SortedExpression(key.column, REVERSED_ORDERS[key.order]))
+        for key in sort_keys(ordered_by)
+    )
@@ -0,0 +1,28 @@
+import importlib.util
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Proxy of the module, which is imported on the first access to its attributes.
+
+    The module is imported by the regular import system, which holds the import lock,
+    so the first access is safe from several threads, unlike with `LazyLoader`.
+    Attributes are copied to the proxy, so later accesses are plain lookups.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(import_module(self.__name__), name)
+        setattr(self, name, value)
+        return value
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import the module, it is executed on the first access to its attributes."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    assert importlib.util.find_spec(name) is not None, f'Module {name} is not found'
+    return LazyModule(name)
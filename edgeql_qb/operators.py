@@ -2,7 +2,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
-from edgeql_qb.types import GenericHolder
+from edgeql_qb.types import GenericHolder, unsafe_text
 
 if TYPE_CHECKING:
     from edgeql_qb.expression import SubQuery  # pragma: no cover
@@ -153,7 +153,7 @@ class OperationsMixin:
 class BinaryOp(OperationsMixin):
     operation: OpLiterals
     left: OperationsMixin
-    right: Union[OperationsMixin, 'SubQuery', GenericHolder[Any]]
+    right: Union[OperationsMixin, 'SubQuery', GenericHolder[Any], unsafe_text]
 
     def __eq__(self, other: Any) -> 'BinaryOp':  # type: ignore[override]
         return BinaryOp('=', self, other)
@@ -1,7 +1,8 @@
-from collections.abc import Iterator
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable, Iterator
 from dataclasses import dataclass, field, replace
 from itertools import count
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from edgeql_qb.expression import (
     BaseModel,
@@ -14,26 +15,107 @@ from edgeql_qb.expression import (
     UpdateSubQuery,
 )
 from edgeql_qb.func import FuncInvocation
+from edgeql_qb.hooks import BuildHook, StageRunner, stage_runner
+from edgeql_qb.lazy import lazy_import
 from edgeql_qb.operators import BinaryOp, SortedExpression, UnaryOp
-from edgeql_qb.render.condition import render_conditions
-from edgeql_qb.render.count import render_count, render_count_inner
-from edgeql_qb.render.delete import render_delete
-from edgeql_qb.render.group import (
-    render_group,
-    render_group_by_expressions,
-    render_using_expressions,
-)
-from edgeql_qb.render.insert import render_insert, render_unless_conflict
-from edgeql_qb.render.insert import render_values as render_insert_values
-from edgeql_qb.render.order_by import render_order_by
-from edgeql_qb.render.pagination import render_limit, render_offset
-from edgeql_qb.render.select import render_select
 from edgeql_qb.render.tools import combine_many_renderers
-from edgeql_qb.render.types import RenderedQuery
-from edgeql_qb.render.update import render_update
-from edgeql_qb.render.update import render_values as render_update_values
-from edgeql_qb.render.with_expr import render_with_expression
-from edgeql_qb.types import unsafe_text
+from edgeql_qb.render.types import CompiledQuery, RenderedQuery
+from edgeql_qb.types import Arg, unsafe_text
+
+if TYPE_CHECKING:
+    from edgeql_qb import execution, keyset  # pragma: no cover
+    from edgeql_qb.keyset import Cursor, Seek  # pragma: no cover
+    from edgeql_qb.render import stages  # pragma: no cover
+    from edgeql_qb.render.rows import JsonRows, Row  # pragma: no cover
+    from edgeql_qb.render.structure import QueryDescription  # pragma: no cover
+else:
+    # renderers, pagination and execution are not needed until queries are built or executed
+    execution = lazy_import('edgeql_qb.execution')
+    keyset = lazy_import('edgeql_qb.keyset')
+    stages = lazy_import('edgeql_qb.render.stages')
+
+
+class FingerprintMixin(ABC):
+    """Fingerprint and literal values of a frozen query, computed once on the first request."""
+
+    __slots__ = ()
+
+    _description: 'QueryDescription | None'
+
+    def fingerprint(self) -> str:
+        """Stable digest of the query structure with literal values left out."""
+        return self._describe().fingerprint
+
+    def value_vector(self) -> tuple[Any, ...]:
+        """Literal values of the query in the order of parameters."""
+        return self._describe().values
+
+    def _describe(self) -> 'QueryDescription':
+        if self._description is None:
+            object.__setattr__(self, '_description', stages.describe(self))
+        assert self._description is not None
+        return self._description
+
+    @abstractmethod
+    def _structure(self, values: list[Any]) -> Hashable:
+        raise NotImplementedError()  # pragma: no cover
+
+
+class ExecutionMixin(ABC):
+    """Shortcuts of `edgeql_qb.execution` functions, every call builds the query once."""
+
+    __slots__ = ()
+
+    async def fetch(self, client: 'execution.AsyncClient') -> Any:
+        return await execution.fetch(self, client)
+
+    async def fetch_single(self, client: 'execution.AsyncClient') -> Any:
+        return await execution.fetch_single(self, client)
+
+    async def execute(self, client: 'execution.AsyncClient') -> None:
+        await execution.execute(self, client)
+
+    def analyze(self) -> RenderedQuery:
+        """Build the query wrapped into `analyze`, it returns the plan instead of data."""
+        return stages.render_analyze(self.build())
+
+    @abstractmethod
+    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
+        raise NotImplementedError()  # pragma: no cover
+
+
+BuildMixinT = TypeVar('BuildMixinT', bound='BuildMixin')
+
+
+@dataclass(slots=True, frozen=True)
+class BuildMixin(FingerprintMixin, ExecutionMixin):
+    """Hooks, build and compilation shared by queries, they render their stages."""
+
+    _hooks: tuple[BuildHook, ...] = field(default=(), compare=False, kw_only=True)
+    _description: 'QueryDescription | None' = field(
+        default=None,
+        init=False,
+        compare=False,
+        repr=False,
+    )
+
+    def hooks(self: BuildMixinT, *hooks: BuildHook) -> BuildMixinT:
+        return replace(self, _hooks=(*self._hooks, *hooks))
+
+    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
+        run = stage_runner(type(self).__name__, self._hooks)
+        return run('query', self._render_stages, generator or count(), run)
+
+    def compile(self) -> CompiledQuery:
+        return CompiledQuery.from_rendered(self.build())
+
+    @abstractmethod
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
+        raise NotImplementedError()  # pragma: no cover
+
+
+def cursor_of(cursor: 'Cursor | str') -> 'Cursor':
+    return keyset.Cursor.from_token(cursor) if isinstance(cursor, str) else cursor
 
 
 @dataclass(slots=True, frozen=True)
@@ -72,15 +154,18 @@ class EdgeDBModel(BaseModel):
 
 
 @dataclass(slots=True, frozen=True)
-class SelectQuery(SubQuery):
+class SelectQuery(BuildMixin, SubQuery):
+    hoistable: ClassVar[bool] = True
+
     _model: EdgeDBModel
     _select: tuple[Expression, ...] = field(default_factory=tuple)
     _select_from_query: SubQuery | None = None
     _with_aliases: tuple[Expression, ...] = field(default_factory=tuple)
     _filters: tuple[Expression, ...] = field(default_factory=tuple)
     _ordered_by: tuple[Expression, ...] = field(default_factory=tuple)
-    _limit_val: int | unsafe_text | FuncInvocation | None = None
-    _offset_val: int | unsafe_text | FuncInvocation | None = None
+    _limit_val: int | Arg | unsafe_text | FuncInvocation | None = None
+    _offset_val: int | Arg | unsafe_text | FuncInvocation | None = None
+    _seek: 'Seek | None' = None
 
     def select_from(self, query: SubQuery) -> 'SelectQuery':
         return replace(self, _select_from_query=query)
@@ -99,29 +184,53 @@ class SelectQuery(SubQuery):
         new_expressions = [Expression(exp) for exp in columns]
         return replace(self, _ordered_by=(*self._ordered_by, *new_expressions))
 
-    def limit(self, value: int | FuncInvocation | unsafe_text) -> 'SelectQuery':
+    def limit(self, value: int | Arg | FuncInvocation | unsafe_text) -> 'SelectQuery':
         return replace(self, _limit_val=value)
 
     @property
     def limit1(self) -> 'SelectQuery':
         return replace(self, _limit_val=unsafe_text('1'))
 
-    def offset(self, value: int | FuncInvocation | unsafe_text) -> 'SelectQuery':
+    def offset(self, value: int | Arg | FuncInvocation | unsafe_text) -> 'SelectQuery':
         return replace(self, _offset_val=value)
 
-    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
-        gen = generator or count()
-        rendered_with = render_with_expression(self._with_aliases, gen, self._model.module)
-        rendered_select = render_select(
+    def after(self, cursor: 'Cursor | str') -> 'SelectQuery':
+        """Select rows following the cursor in the order of the query instead of skipping them."""
+        return replace(self, _seek=keyset.Seek('after', cursor_of(cursor)))
+
+    def before(self, cursor: 'Cursor | str') -> 'SelectQuery':
+        """Select rows preceding the cursor, nearest first.
+
+        The order of the query is reversed, so the limit takes rows right before the cursor;
+        reverse the page to show it in the order of the query.
+        """
+        return replace(self, _seek=keyset.Seek('before', cursor_of(cursor)))
+
+    def cursor(self, row: Any) -> str:
+        """Return token of the row to continue pagination after or before it."""
+        return keyset.row_cursor(self._ordered_by, row).token
+
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
+        rendered_with = run(
+            'with',
+            stages.render_with_expression,
+            self._with_aliases,
+            gen,
+            self._model.module,
+            self,
+        )
+        rendered_select = run(
+            'select',
+            stages.render_select,
             self._model.name,
             self._select,
             gen,
             self._select_from_query,
         )
-        rendered_filters = render_conditions(self._filters, gen)
-        rendered_order_by = render_order_by(self._ordered_by, gen)
-        rendered_offset = render_offset(self._offset_val, gen)
-        rendered_limit = render_limit(self._limit_val, gen)
+        rendered_filters = run('filters', stages.render_conditions, self._seek_filters(), gen)
+        rendered_order_by = run('order_by', stages.render_order_by, self._seek_order(), gen)
+        rendered_offset = run('offset', stages.render_offset, self._offset_val, gen)
+        rendered_limit = run('limit', stages.render_limit, self._limit_val, gen)
         return combine_many_renderers(
             rendered_with,
             rendered_select,
@@ -131,23 +240,52 @@ class SelectQuery(SubQuery):
             rendered_limit,
         )
 
+    def _seek_filters(self) -> tuple[Expression, ...]:
+        if self._seek is None:
+            return self._filters
+        return (*self._filters, keyset.seek_condition(self._ordered_by, self._seek))
+
+    def _seek_order(self) -> tuple[Expression, ...]:
+        if self._seek is None:
+            return self._ordered_by
+        return keyset.seek_order(self._ordered_by, self._seek)
+
+    def _structure(self, values: list[Any]) -> Hashable:
+        return (
+            SelectQuery,
+            stages.structure(self._model, values),
+            stages.structure(self._with_aliases, values),
+            stages.structure(self._select_from_query, values),
+            stages.structure(self._select, values),
+            stages.structure(self._seek_filters(), values),
+            stages.structure(self._seek_order(), values),
+            stages.structure(self._offset_val, values),
+            stages.structure(self._limit_val, values),
+        )
+
 
 @dataclass(slots=True, frozen=True)
-class CountQuery:
+class CountQuery(BuildMixin):
     _model: EdgeDBModel
     _filters: tuple[Expression, ...] = field(default_factory=tuple)
 
     def where(self, compared: BinaryOp | UnaryOp | FuncInvocation) -> 'CountQuery':
         return replace(self, _filters=(*self._filters, Expression(compared)))
 
-    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
-        gen = generator or count()
-        inner = render_count_inner(self._model.name, self._filters, gen)
-        return render_count(inner)
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
+        inner = run('count', stages.render_count_inner, self._model.name, self._filters, gen)
+        return stages.render_count(inner)
+
+    def _structure(self, values: list[Any]) -> Hashable:
+        return (
+            CountQuery,
+            stages.structure(self._model, values),
+            stages.structure(self._filters, values),
+        )
 
 
 @dataclass(slots=True, frozen=True)
-class GroupQuery:
+class GroupQuery(BuildMixin):
     _model: EdgeDBModel
     _select: tuple[Expression, ...] = field(default_factory=tuple)
     _with_aliases: tuple[Expression, ...] = field(default_factory=tuple)
@@ -165,12 +303,23 @@ class GroupQuery:
     def by(self, *group_by: Column | BinaryOp) -> 'GroupQuery':
         return replace(self, _group_by=group_by)
 
-    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
-        gen = generator or count()
-        rendered_with = render_with_expression(self._with_aliases, gen, self._model.module)
-        rendered_group = render_group(self._model.name, self._select, gen)
-        rendered_using = render_using_expressions(self._using_expressions, gen)
-        rendered_group_by = render_group_by_expressions(self._group_by)
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
+        rendered_with = run(
+            'with',
+            stages.render_with_expression,
+            self._with_aliases,
+            gen,
+            self._model.module,
+            self,
+        )
+        rendered_group = run('group', stages.render_group, self._model.name, self._select, gen)
+        rendered_using = run(
+            'using',
+            stages.render_using_expressions,
+            self._using_expressions,
+            gen,
+        )
+        rendered_group_by = run('by', stages.render_group_by_expressions, self._group_by)
         return combine_many_renderers(
             rendered_with,
             rendered_group,
@@ -178,15 +327,25 @@ class GroupQuery:
             rendered_group_by,
         )
 
+    def _structure(self, values: list[Any]) -> Hashable:
+        return (
+            GroupQuery,
+            stages.structure(self._model, values),
+            stages.structure(self._with_aliases, values),
+            stages.structure(self._select, values),
+            stages.structure(self._using_expressions, values),
+            tuple(stages.render_group_by(group_by).query for group_by in self._group_by),
+        )
+
 
 @dataclass(slots=True, frozen=True)
-class DeleteQuery:
+class DeleteQuery(BuildMixin):
     _model: EdgeDBModel
     _with_aliases: tuple[Expression, ...] = field(default_factory=tuple)
     _filters: tuple[Expression, ...] = field(default_factory=tuple)
     _ordered_by: tuple[Expression, ...] = field(default_factory=tuple)
-    _limit_val: int | unsafe_text | FuncInvocation | None = None
-    _offset_val: int | unsafe_text | FuncInvocation | None = None
+    _limit_val: int | Arg | unsafe_text | FuncInvocation | None = None
+    _offset_val: int | Arg | unsafe_text | FuncInvocation | None = None
 
     def where(self, compared: BinaryOp | UnaryOp) -> 'DeleteQuery':
         return replace(self, _filters=(*self._filters, Expression(compared)))
@@ -202,20 +361,26 @@ class DeleteQuery:
         new_expressions = [Expression(exp) for exp in columns]
         return replace(self, _ordered_by=(*self._ordered_by, *new_expressions))
 
-    def limit(self, value: int | FuncInvocation | unsafe_text) -> 'DeleteQuery':
+    def limit(self, value: int | Arg | FuncInvocation | unsafe_text) -> 'DeleteQuery':
         return replace(self, _limit_val=value)
 
-    def offset(self, value: int | FuncInvocation | unsafe_text) -> 'DeleteQuery':
+    def offset(self, value: int | Arg | FuncInvocation | unsafe_text) -> 'DeleteQuery':
         return replace(self, _offset_val=value)
 
-    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
-        gen = generator or count()
-        rendered_with = render_with_expression(self._with_aliases, gen, self._model.module)
-        rendered_delete = render_delete(self._model.name)
-        rendered_filters = render_conditions(self._filters, gen)
-        rendered_order_by = render_order_by(self._ordered_by, gen)
-        rendered_offset = render_offset(self._offset_val, gen)
-        rendered_limit = render_limit(self._limit_val, gen)
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
+        rendered_with = run(
+            'with',
+            stages.render_with_expression,
+            self._with_aliases,
+            gen,
+            self._model.module,
+            self,
+        )
+        rendered_delete = run('delete', stages.render_delete, self._model.name)
+        rendered_filters = run('filters', stages.render_conditions, self._filters, gen)
+        rendered_order_by = run('order_by', stages.render_order_by, self._ordered_by, gen)
+        rendered_offset = run('offset', stages.render_offset, self._offset_val, gen)
+        rendered_limit = run('limit', stages.render_limit, self._limit_val, gen)
         return combine_many_renderers(
             rendered_with,
             rendered_delete,
@@ -225,21 +390,86 @@ class DeleteQuery:
             rendered_limit,
         )
 
+    def _structure(self, values: list[Any]) -> Hashable:
+        return (
+            DeleteQuery,
+            stages.structure(self._model, values),
+            stages.structure(self._with_aliases, values),
+            stages.structure(self._filters, values),
+            stages.structure(self._ordered_by, values),
+            stages.structure(self._offset_val, values),
+            stages.structure(self._limit_val, values),
+        )
+
 
 @dataclass(slots=True, frozen=True)
-class InsertQuery(SubQuery):
+class InsertQuery(BuildMixin, SubQuery):
     _model: EdgeDBModel
     _with_aliases: tuple[Expression, ...] = field(default_factory=tuple)
-    _values_to_insert: list[Expression] = field(default_factory=list)
+    _values_to_insert: tuple[Expression, ...] = field(default_factory=tuple)
     _unless_conflict_value: UnlessConflict | None = None
+    _rows: 'JsonRows | None' = None
 
     def values(self, **to_insert: Any) -> 'InsertQuery':
         assert to_insert
-        values_to_insert = [
-            Expression(BinaryOp(':=', Column(name), exp))
+        values_to_insert = tuple(
+            # columns of generated models know the type of the property
+            Expression(BinaryOp(':=', getattr(self._model.c, name), exp))
             for name, exp in to_insert.items()
-        ]
-        return replace(self, _values_to_insert=values_to_insert)
+        )
+        return replace(self, _values_to_insert=values_to_insert, _rows=None)
+
+    def values_many(self, rows: Iterable['Row']) -> 'InsertQuery':
+        """Insert every row with a single statement, rows are passed as one JSON parameter."""
+        rows = list(rows)
+        return self._values_many(rows, stages.field_casts(rows, self._model.c))
+
+    def upsert_many(
+        self,
+        rows: Iterable['Row'],
+        on: tuple[Column, ...] | Column,
+        update: Iterable[str] | None = None,
+    ) -> 'InsertQuery':
+        """Insert every row or update the object conflicting with it on `on` columns.
+
+        Conflicting objects get values of `update` fields of the row,
+        all fields except `on` columns by default.
+        Conflicting objects are returned as is when there are no fields to update.
+        """
+        rows = list(rows)
+        casts = stages.field_casts(rows, self._model.c)
+        on_names = {column.column_name for column in (on if isinstance(on, tuple) else (on,))}
+        fields = (
+            [name for name in casts if name not in on_names]
+            if update is None
+            else list(update)
+        )
+        missing = set(fields) - casts.keys()
+        assert not missing, f'Rows have no fields: {sorted(missing)}'
+        to_update = {name: stages.row_field(name, casts[name]) for name in fields}
+        else_ = self._model.update.values(**to_update) if to_update else self._model
+        return self._values_many(rows, casts).unless_conflict(on=on, else_=else_)
+
+    def _values_many(self, rows: list['Row'], casts: dict[str, str]) -> 'InsertQuery':
+        values_to_insert = tuple(
+            Expression(BinaryOp(':=', Column(name), stages.row_field(name, cast)))
+            for name, cast in casts.items()
+        )
+        return replace(
+            self,
+            _values_to_insert=values_to_insert,
+            _rows=stages.encode_rows(rows, tuple(casts)),
+        )
+
+    def chunked(
+        self,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+    ) -> Iterator['InsertQuery']:
+        """Split rows of `values_many` into queries with limited rows count and payload size."""
+        assert self._rows, 'Only queries with values_many can be chunked'
+        for rows in stages.chunk_rows(self._rows, max_rows, max_bytes):
+            yield replace(self, _rows=rows)
 
     def with_(self, *with_aliases: BinaryOp) -> 'InsertQuery':
         expressions = tuple(Expression(exp) for exp in with_aliases)
@@ -252,27 +482,54 @@ class InsertQuery(SubQuery):
     ) -> 'InsertQuery':
         return replace(self, _unless_conflict_value=UnlessConflict(on=on, else_=else_))
 
-    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
         assert self._values_to_insert
-        gen = generator or count()
-        rendered_with = render_with_expression(self._with_aliases, gen, self._model.module)
-        rendered_insert = render_insert(self._model.name)
-        rendered_values = render_insert_values(self._values_to_insert, gen)
-        rendered_conflicts = render_unless_conflict(self._unless_conflict_value, gen)
+        rendered_with = run(
+            'with',
+            stages.render_with_expression,
+            self._with_aliases,
+            gen,
+            self._model.module,
+            self,
+        )
+        rendered_for = run('for', stages.render_for_rows, self._rows, gen)
+        rendered_insert = run('insert', stages.render_insert, self._model.name)
+        rendered_values = run('values', stages.render_insert_values, self._values_to_insert, gen)
+        rendered_conflicts = run(
+            'unless_conflict',
+            stages.render_unless_conflict,
+            self._unless_conflict_value,
+            gen,
+        )
         return combine_many_renderers(
             rendered_with,
+            rendered_for,
             rendered_insert,
             rendered_values,
             rendered_conflicts,
+            stages.render_for_rows_end(self._rows),
+        )
+
+    def _structure(self, values: list[Any]) -> Hashable:
+        return (
+            InsertQuery,
+            stages.structure(self._model, values),
+            stages.structure(self._with_aliases, values),
+            stages.structure(self._rows, values),
+            stages.structure(self._values_to_insert, values),
+            stages.structure(self._unless_conflict_value, values),
         )
 
 
 @dataclass(slots=True, frozen=True)
-class UpdateQuery(UpdateSubQuery):
+class UpdateQuery(BuildMixin, UpdateSubQuery):
     _model: EdgeDBModel
     _with_aliases: tuple[Expression, ...] = field(default_factory=tuple)
     _values_to_update: tuple[Expression, ...] = field(default_factory=tuple)
     _filters: tuple[Expression, ...] = field(default_factory=tuple)
+    _rows: 'JsonRows | None' = None
+    # filter of `values_many` matching objects by the key of the row being unpacked
+    _key_filter: Expression | None = None
 
     def where(self, compared: BinaryOp | UnaryOp) -> 'UpdateQuery':
         return replace(self, _filters=(*self._filters, Expression(compared)))
@@ -284,21 +541,135 @@ class UpdateQuery(UpdateSubQuery):
     def values(self, **to_update: Any) -> 'UpdateQuery':
         assert to_update
         values_to_update = tuple(
-            Expression(BinaryOp(':=', Column(name), exp))
+            Expression(BinaryOp(':=', getattr(self._model.c, name), exp))
             for name, exp in to_update.items()
         )
-        return replace(self, _values_to_update=values_to_update)
+        return replace(self, _values_to_update=values_to_update, _rows=None, _key_filter=None)
+
+    def values_many(self, rows: Iterable['Row'], key: str = 'id') -> 'UpdateQuery':
+        """Update objects matching the key of every row with values of the row.
+
+        All rows are updated with a single statement, they are passed as one JSON parameter.
+        """
+        rows = list(rows)
+        casts = stages.field_casts(rows, self._model.c)
+        assert key in casts, f'Rows have no key field {key!r}'
+        key_filter = Expression(BinaryOp('=', Column(key), stages.row_field(key, casts.pop(key))))
+        assert casts, 'Rows have no values to update'
+        values_to_update = tuple(
+            Expression(BinaryOp(':=', Column(name), stages.row_field(name, cast)))
+            for name, cast in casts.items()
+        )
+        return replace(
+            self,
+            _values_to_update=values_to_update,
+            _rows=stages.encode_rows(rows, (key, *casts)),
+            _key_filter=key_filter,
+        )
 
-    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
+    def chunked(
+        self,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+    ) -> Iterator['UpdateQuery']:
+        """Split rows of `values_many` into queries with limited rows count and payload size."""
+        assert self._rows, 'Only queries with values_many can be chunked'
+        for rows in stages.chunk_rows(self._rows, max_rows, max_bytes):
+            yield replace(self, _rows=rows)
+
+    def _all_filters(self) -> tuple[Expression, ...]:
+        if self._key_filter is None:
+            return self._filters
+        return (*self._filters, self._key_filter)
+
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
         assert self._values_to_update
-        gen = generator or count()
-        rendered_with = render_with_expression(self._with_aliases, gen, self._model.module)
-        rendered_insert = render_update(self._model.name)
-        rendered_filters = render_conditions(self._filters, gen)
-        rendered_values = render_update_values(self._values_to_update, gen)
+        rendered_with = run(
+            'with',
+            stages.render_with_expression,
+            self._with_aliases,
+            gen,
+            self._model.module,
+            self,
+        )
+        rendered_for = run('for', stages.render_for_rows, self._rows, gen)
+        rendered_insert = run('update', stages.render_update, self._model.name)
+        rendered_filters = run('filters', stages.render_conditions, self._all_filters(), gen)
+        rendered_values = run('values', stages.render_update_values, self._values_to_update, gen)
         return combine_many_renderers(
             rendered_with,
+            rendered_for,
             rendered_insert,
             rendered_filters,
             rendered_values,
+            stages.render_for_rows_end(self._rows),
+        )
+
+    def _structure(self, values: list[Any]) -> Hashable:
+        return (
+            UpdateQuery,
+            stages.structure(self._model, values),
+            stages.structure(self._with_aliases, values),
+            stages.structure(self._rows, values),
+            stages.structure(self._all_filters(), values),
+            stages.structure(self._values_to_update, values),
+        )
+
+
+Multiplexed = SelectQuery | CountQuery | GroupQuery | InsertQuery | UpdateQuery | DeleteQuery
+
+
+def multiplex(**queries: Multiplexed) -> 'MultiplexQuery':
+    """Combine independent queries into a single statement, executed in one round trip."""
+    assert queries, 'Nothing to multiplex'
+    return MultiplexQuery(tuple(queries.items()))
+
+
+@dataclass(slots=True, frozen=True)
+class MultiplexQuery(BuildMixin):
+    """Queries rendered as computed properties of a free object.
+
+    Mutations are bound in the `with` block, so each of them is executed once.
+    """
+
+    _queries: tuple[tuple[str, Multiplexed], ...]
+
+    def __post_init__(self) -> None:
+        names = [name for name, _ in self._queries]
+        assert all(name.isidentifier() for name in names), f'Invalid names: {names}'
+
+    @property
+    def _bindings(self) -> tuple[tuple[str, Multiplexed], ...]:
+        return tuple(
+            (name, query)
+            for name, query in self._queries
+            if isinstance(query, InsertQuery | UpdateQuery | DeleteQuery)
+        )
+
+    @property
+    def _elements(self) -> tuple[tuple[str, Multiplexed | None], ...]:
+        bound = dict(self._bindings)
+        return tuple((name, None if name in bound else query) for name, query in self._queries)
+
+    def split(self, result: Any) -> dict[str, Any]:
+        """Results of multiplexed queries by their names, taken from the fetched object."""
+        return {name: getattr(result, name) for name, _ in self._queries}
+
+    async def fetch(self, client: 'execution.AsyncClient') -> dict[str, Any]:
+        return self.split(await execution.fetch_single(self, client))
+
+    def _render_stages(self, gen: Iterator[int], run: StageRunner) -> RenderedQuery:
+        rendered_with = run('with', stages.render_multiplex_with, self._bindings, gen)
+        rendered_select = run('select', stages.render_multiplex_select, self._elements, gen)
+        return combine_many_renderers(rendered_with, rendered_select)
+
+    def _structure(self, values: list[Any]) -> Hashable:
+        # bindings are rendered first, their parameters go first
+        return (
+            MultiplexQuery,
+            tuple((name, query._structure(values)) for name, query in self._bindings),
+            tuple(
+                (name, None if query is None else query._structure(values))
+                for name, query in self._elements
+            ),
         )
@@ -0,0 +1,35 @@
+from collections.abc import Iterable
+
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.render.types import RenderedQuery
+
+
+class RenderBuffer:
+    """Mutable accumulator of query text fragments and parameters.
+
+    Fragments are joined only once, in `materialize`, and contexts are merged
+    with the non-copying `FrozenDict` union,
+    so assembling a query costs time linear to the number of its fragments.
+    """
+
+    __slots__ = '_context', '_fragments'
+
+    def __init__(self) -> None:
+        self._fragments: list[str] = []
+        self._context = FrozenDict()
+
+    def write(self, fragment: str) -> None:
+        self._fragments.append(fragment)
+
+    def append(self, rendered: RenderedQuery) -> None:
+        self._fragments.append(rendered.query)
+        self._context |= rendered.context
+
+    def extend(self, renderers: Iterable[RenderedQuery], separator: str = '') -> None:
+        for index, rendered in enumerate(renderers):
+            if index:
+                self.write(separator)
+            self.append(rendered)
+
+    def materialize(self) -> RenderedQuery:
+        return RenderedQuery(''.join(self._fragments), self._context)
@@ -0,0 +1,39 @@
+from collections.abc import Iterable, Sequence
+
+from edgeql_qb.expression import AnyExpression, Column, Expression
+from edgeql_qb.operators import Node
+from edgeql_qb.render.structure import structure
+
+
+def conjunctions(conditions: Iterable[AnyExpression]) -> list[AnyExpression]:
+    """Split conditions joined with `and` into a flat list of conditions."""
+    result: list[AnyExpression] = []
+    pending = list(conditions)[::-1]
+    while pending:
+        condition = pending.pop()
+        if isinstance(condition, Node) and condition.op == 'and':
+            assert condition.right is not None
+            pending.extend((condition.right, condition.left))
+        else:
+            result.append(condition)
+    return result
+
+
+def canonical_key(node: AnyExpression) -> str:
+    """Key which is the same for nodes rendered to the same text with any literal values."""
+    return repr(structure(node, []))
+
+
+def canonical_conditions(filters: Sequence[Expression]) -> list[AnyExpression]:
+    conditions = conjunctions(filter_.to_infix_notation() for filter_ in filters)
+    return sorted(conditions, key=canonical_key)
+
+
+def assignment_target(value: Expression) -> str:
+    assignment = value.to_infix_notation()
+    assert isinstance(assignment, Node) and isinstance(assignment.left, Column)
+    return assignment.left.column_name
+
+
+def canonical_assignments(values: Sequence[Expression]) -> list[Expression]:
+    return sorted(values, key=assignment_target)
@@ -0,0 +1,79 @@
+from collections.abc import Hashable, Iterator
+from itertools import count
+from threading import Lock
+from typing import Any
+
+from edgeql_qb.render.query_literal import literal_cast, literal_value
+
+
+def dedup_key(value: Any) -> Hashable | None:
+    """Key of literals which are bound to the same parameter, None for unhashable values."""
+    key = type(value), literal_cast(value), literal_value(value)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class RenderContext:
+    """Source of parameter names shared by all renderers of a query.
+
+    It is an iterator of parameter indexes, so it can be passed to `build()` as a generator.
+    With `dedup` equal literals of the same type are bound to a single parameter.
+    With `canonical` equivalent queries are rendered to the same text:
+    filters are split into conjunctions and sorted, assignments are sorted by the property name.
+    With `hoist` select subqueries repeated in the query are bound once in the `with` block.
+    A context renders a single query.
+
+    Queries are immutable, so they can be shared by threads and built concurrently:
+    every `build()` without a generator starts its own one. A context passed to `build()`
+    belongs to that build, parameter names are assigned under a lock, so subqueries
+    may take them from several threads, also on the free-threaded interpreter.
+    """
+
+    __slots__ = 'canonical', 'dedup', 'hoist', 'hoisted', '_indexes', '_lock', '_names'
+
+    def __init__(
+        self,
+        *,
+        dedup: bool = False,
+        canonical: bool = False,
+        hoist: bool = False,
+    ) -> None:
+        self.dedup = dedup
+        self.canonical = canonical
+        self.hoist = hoist
+        # names of hoisted subqueries by their keys, None until the outermost query plans them
+        self.hoisted: dict[Hashable, str] | None = None
+        self._indexes = count()
+        self._lock = Lock()
+        self._names: dict[Hashable, str] = {}
+
+    def __iter__(self) -> Iterator[int]:
+        return self
+
+    def __next__(self) -> int:
+        with self._lock:
+            return next(self._indexes)
+
+    def parameter_name(self, prefix: str, value: Any) -> str:
+        key = dedup_key(value) if self.dedup else None
+        if key is None:
+            return f'{prefix}_{next(self)}'
+        with self._lock:
+            name = self._names.get(key)
+            if name is None:
+                name = self._names[key] = f'{prefix}_{next(self._indexes)}'
+            return name
+
+
+def parameter_name(generator: Iterator[int], prefix: str, value: Any) -> str:
+    """Name of a parameter holding the literal value."""
+    if isinstance(generator, RenderContext):
+        return generator.parameter_name(prefix, value)
+    return f'{prefix}_{next(generator)}'
+
+
+def is_canonical(generator: Iterator[int]) -> bool:
+    return isinstance(generator, RenderContext) and generator.canonical
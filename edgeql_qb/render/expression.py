@@ -1,112 +1,180 @@
-from collections.abc import Iterator
-from functools import singledispatch
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
 from edgeql_qb.expression import (
     AnyExpression,
     Column,
-    Expression,
     QueryLiteral,
+    Shape,
     SubQuery,
 )
 from edgeql_qb.func import FuncInvocation
-from edgeql_qb.operators import Alias, Node
+from edgeql_qb.operators import Alias, Node, SortedExpression
+from edgeql_qb.render.context import parameter_name
 from edgeql_qb.render.func import render_function
+from edgeql_qb.render.hoisting import hoisted_name
 from edgeql_qb.render.query_literal import render_query_literal
-from edgeql_qb.render.tools import combine_many_renderers, render_binary_node
+from edgeql_qb.render.shape import render_shape
+from edgeql_qb.render.tools import (
+    combine_renderers,
+    render_binary_node,
+)
 from edgeql_qb.render.types import RenderedQuery
+from edgeql_qb.types import unsafe_text
+
+
+@dataclass(slots=True, frozen=True)
+class Clause:
+    """Rules of rendering expressions within a query clause.
+
+    Literals become parameters named `{literal_prefix}_{index}`.
+    Columns get `column_prefix` on the top level of an expression
+    and `operand_prefix` as operands of operations, except the target of assignment.
+    Columns with `full_paths` are rendered with all their parents: `.nested2.name`.
+    """
+
+    literal_prefix: str
+    column_prefix: str = ''
+    operand_prefix: str = '.'
+    full_paths: bool = False
+
+
+ExpressionHandler = Callable[[Any, Clause, Iterator[int], str], RenderedQuery]
+Handler = TypeVar('Handler', bound=ExpressionHandler)
+
+_handlers: dict[type, ExpressionHandler] = {}
+_resolved_handlers: dict[type, ExpressionHandler] = {}
+
+
+def expression_handler(node_type: type) -> Callable[[Handler], Handler]:
+    """Register renderer of the node type for expressions of all clauses."""
+    def decorator(handler: Handler) -> Handler:
+        _handlers[node_type] = handler
+        _resolved_handlers.clear()
+        return handler
+    return decorator
+
+
+def resolve_handler(node_type: type) -> ExpressionHandler:
+    handler = next((_handlers[base] for base in node_type.__mro__ if base in _handlers), None)
+    if handler is None:
+        raise NotImplementedError(f'{node_type!r} is not supported')  # pragma: no cover
+    _resolved_handlers[node_type] = handler
+    return handler
 
 
-@singledispatch
 def render_expression(
     expression: AnyExpression,
-    literal_prefix: str,
+    clause: Clause,
     generator: Iterator[int],
-    column_prefix: str = '',
+    column_prefix: str | None = None,
 ) -> RenderedQuery:
-    raise NotImplementedError(f'{expression!r} is not supported')  # pragma: no cover
+    node_type = type(expression)
+    handler = _resolved_handlers.get(node_type) or resolve_handler(node_type)
+    prefix = clause.column_prefix if column_prefix is None else column_prefix
+    return handler(expression, clause, generator, prefix)
 
 
-@render_expression.register
+expression_handler(Shape)(render_shape)
+
+
+@expression_handler(Column)
 def _(
-    expression: SubQuery,
-    literal_prefix: str,
+    expression: Column,
+    clause: Clause,
     generator: Iterator[int],
-    column_prefix: str = '',
+    column_prefix: str,
 ) -> RenderedQuery:
-    return expression.build(generator)
+    if clause.full_paths:
+        return RenderedQuery(expression.dotted(column_prefix))
+    return RenderedQuery(f'{column_prefix}{expression.column_name}')
 
 
-@render_expression.register
+@expression_handler(Alias)
 def _(
-    expression: FuncInvocation,
-    literal_prefix: str,
+    expression: Alias,
+    clause: Clause,
     generator: Iterator[int],
-    column_prefix: str = '',
+    column_prefix: str,
 ) -> RenderedQuery:
-    func = expression.func
-    arg_renderers = [
-        render_expression(
-            Expression(arg).to_infix_notation(),
-            literal_prefix,
-            generator,
-            column_prefix,
-        )
-        for arg in expression.args
-    ]
-    return render_function(func, arg_renderers)
+    return RenderedQuery(expression.name)
 
 
-@render_expression.register
+@expression_handler(unsafe_text)
 def _(
-        expression: Column,
-        literal_prefix: str,
-        generator: Iterator[int],
-        column_prefix: str = '',
+    expression: unsafe_text,
+    clause: Clause,
+    generator: Iterator[int],
+    column_prefix: str,
 ) -> RenderedQuery:
-    return RenderedQuery(f'{column_prefix}{expression.column_name}')
+    return RenderedQuery(expression)
 
 
-@render_expression.register
+@expression_handler(QueryLiteral)
 def _(
-        expression: Alias,
-        literal_prefix: str,
-        generator: Iterator[int],
-        column_prefix: str = '',
+    expression: QueryLiteral,
+    clause: Clause,
+    generator: Iterator[int],
+    column_prefix: str,
 ) -> RenderedQuery:
-    return RenderedQuery(expression.name)
+    name = parameter_name(generator, clause.literal_prefix, expression.value)
+    return render_query_literal(expression.value, name)
 
 
-@render_expression.register
+@expression_handler(FuncInvocation)
 def _(
-    expression: QueryLiteral,
-    literal_prefix: str,
+    expression: FuncInvocation,
+    clause: Clause,
     generator: Iterator[int],
-    column_prefix: str = '',
+    column_prefix: str,
 ) -> RenderedQuery:
-    index = next(generator)
-    name = f'{literal_prefix}_{index}'
-    return render_query_literal(expression.value, name)
+    arg_renderers = [
+        render_expression(arg, clause, generator, column_prefix)
+        for arg in expression.args
+    ]
+    return render_function(expression.func, arg_renderers)
 
 
-@render_expression.register
+@expression_handler(Node)
 def _(
     expression: Node,
-    literal_prefix: str,
+    clause: Clause,
     generator: Iterator[int],
-    column_prefix: str = '',
+    column_prefix: str,
 ) -> RenderedQuery:
     if expression.right is None:
-        return combine_many_renderers(
+        return combine_renderers(
             RenderedQuery(expression.op),
-            render_expression(expression.left, literal_prefix, generator, column_prefix),
+            render_expression(expression.left, clause, generator, column_prefix),
         )
+    left_prefix = '' if expression.op == ':=' else clause.operand_prefix
     return render_binary_node(
-        left=render_expression(
-            expression.left,
-            literal_prefix,
-            generator,
-            column_prefix=expression.op != ':=' and '.' or '',
-        ),
-        right=render_expression(expression.right, literal_prefix, generator, '.'),
+        left=render_expression(expression.left, clause, generator, left_prefix),
+        right=render_expression(expression.right, clause, generator, clause.operand_prefix),
         expression=expression,
     )
+
+
+@expression_handler(SortedExpression)
+def _(
+    expression: SortedExpression,
+    clause: Clause,
+    generator: Iterator[int],
+    column_prefix: str,
+) -> RenderedQuery:
+    return combine_renderers(
+        render_expression(expression.expression, clause, generator, column_prefix),
+        RenderedQuery(f' {expression.order}'),
+    )
+
+
+@expression_handler(SubQuery)
+def _(
+    expression: SubQuery,
+    clause: Clause,
+    generator: Iterator[int],
+    column_prefix: str,
+) -> RenderedQuery:
+    name = hoisted_name(generator, expression)
+    return RenderedQuery(name) if name else expression.build(generator)
@@ -1,14 +1,16 @@
 from collections.abc import Iterator
-from functools import reduce, singledispatch
+from functools import singledispatch
 from typing import Any
 
 from edgeql_qb.expression import Column, Expression
 from edgeql_qb.operators import Alias, BinaryOp
-from edgeql_qb.render.expression import render_expression
+from edgeql_qb.render.expression import Clause, render_expression
 from edgeql_qb.render.select import render_select_columns
-from edgeql_qb.render.tools import combine_renderers, join_renderers
+from edgeql_qb.render.tools import combine_renderers, join_many_renderers
 from edgeql_qb.render.types import RenderedQuery
 
+USING_CLAUSE = Clause(literal_prefix='using')
+
 
 def render_group(
         model_name: str,
@@ -29,12 +31,12 @@ def render_group(
 
 def render_using(using: tuple[Expression, ...], generator: Iterator[int]) -> RenderedQuery:
     using_expressions = [
-        render_expression(use.to_infix_notation(), 'using', generator)
+        render_expression(use.to_infix_notation(), USING_CLAUSE, generator)
         for use in using
     ]
     return combine_renderers(
         RenderedQuery(' using '),
-        reduce(join_renderers(', '), using_expressions),
+        join_many_renderers(', ', using_expressions),
     )
 
 
@@ -65,5 +67,5 @@ def render_group_by_expressions(group_by: tuple[Column | BinaryOp, ...]) -> Rend
     renderers = map(render_group_by, group_by)
     return combine_renderers(
         RenderedQuery(' by '),
-        reduce(join_renderers(', '), renderers),
+        join_many_renderers(', ', renderers),
     )
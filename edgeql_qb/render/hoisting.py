@@ -0,0 +1,147 @@
+from collections import Counter
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import singledispatch
+from typing import Any, TypeGuard
+
+from edgeql_qb.expression import BaseModel, Expression, SubQuery
+from edgeql_qb.render.context import RenderContext, dedup_key
+from edgeql_qb.render.tools import render_parentheses
+from edgeql_qb.render.types import RenderedQuery
+
+
+@dataclass(slots=True)
+class HoistingPlan:
+    """Occurrences of subqueries, in the order their bindings can refer to each other."""
+
+    counts: Counter[Hashable] = field(default_factory=Counter)
+    subqueries: dict[Hashable, SubQuery] = field(default_factory=dict)
+
+    def add(self, key: Hashable) -> bool:
+        """Count an occurrence of the subquery, return whether it is the first one."""
+        self.counts[key] += 1
+        return self.counts[key] == 1
+
+    @property
+    def repeated(self) -> list[tuple[Hashable, SubQuery]]:
+        return [(key, query) for key, query in self.subqueries.items() if self.counts[key] > 1]
+
+
+def subquery_key(query: SubQuery) -> Hashable | None:
+    """Key of structurally identical subqueries with equal values, None for unhashable values."""
+    values: list[Any] = []
+    shape = query._structure(values)
+    keys = tuple(dedup_key(value) for value in values)
+    return None if None in keys else (shape, keys)
+
+
+@singledispatch
+def children(node: Any) -> tuple[Any, ...]:
+    """Nodes of the query tree below the node."""
+    if is_dataclass(node) and not isinstance(node, type):
+        return tuple(getattr(node, field_.name) for field_ in fields(node) if field_.compare)
+    return ()
+
+
+@children.register
+def _(node: tuple) -> tuple[Any, ...]:  # type: ignore[type-arg]
+    return node
+
+
+@children.register
+def _(node: BaseModel) -> tuple[Any, ...]:
+    # columns of models are built on attribute access, there is nothing to walk through
+    return ()
+
+
+@children.register
+def _(node: Expression) -> tuple[Any, ...]:
+    return (node.tree,)
+
+
+def has_with_block(node: Any) -> bool:
+    return isinstance(node, SubQuery) and bool(getattr(node, '_with_aliases', ()))
+
+
+def hoisting_key(node: Any) -> Hashable | None:
+    return subquery_key(node) if isinstance(node, SubQuery) and node.hoistable else None
+
+
+def visit(node: Any, plan: HoistingPlan) -> None:
+    key = hoisting_key(node)
+    if key is None:
+        visit_children(node, plan)
+    elif plan.add(key):
+        visit_children(node, plan)
+        # inner subqueries are added first, so bindings refer only to the preceding ones
+        plan.subqueries[key] = node
+
+
+def visit_children(node: Any, plan: HoistingPlan) -> None:
+    # subqueries below a `with` block may refer to its aliases, so they stay in place
+    nodes = () if has_with_block(node) else children(node)
+    for child in nodes:
+        visit(child, plan)
+
+
+def root_children(query: Any) -> tuple[Any, ...]:
+    """Nodes of the outermost query which can share its `with` block."""
+    if getattr(query, '_rows', None) is not None:
+        # subqueries in the body of a `for` loop may refer to the row being unpacked
+        return ()
+    with_aliases = getattr(query, '_with_aliases', ())
+    return tuple(child for child in children(query) if child is not with_aliases)
+
+
+def plan_hoisting(query: Any) -> HoistingPlan:
+    plan = HoistingPlan()
+    for child in root_children(query):
+        visit(child, plan)
+    return plan
+
+
+def is_hoisting_root(generator: Iterator[int]) -> TypeGuard[RenderContext]:
+    """Check that nothing is rendered yet, the outermost query starts with its `with` block."""
+    return isinstance(generator, RenderContext) and generator.hoist and generator.hoisted is None
+
+
+def claim_hoisting(generator: Iterator[int], query: Any) -> list[tuple[Hashable, SubQuery]]:
+    """Find subqueries repeated in the outermost query, nested queries get nothing.
+
+    It is called before anything else is rendered, so nested queries are never taken
+    for the outermost one.
+    """
+    if not is_hoisting_root(generator):
+        return []
+    generator.hoisted = {}
+    return plan_hoisting(query).repeated
+
+
+def render_bindings(
+    repeated: list[tuple[Hashable, SubQuery]],
+    generator: Iterator[int],
+) -> list[RenderedQuery]:
+    return [
+        render_binding(f'_subquery_{index}', key, subquery, generator)
+        for index, (key, subquery) in enumerate(repeated)
+    ]
+
+
+def render_binding(
+    name: str,
+    key: Hashable,
+    subquery: SubQuery,
+    generator: Iterator[int],
+) -> RenderedQuery:
+    rendered = render_parentheses(subquery.build(generator))
+    # the name is registered after rendering, so the subquery is not replaced with itself
+    assert isinstance(generator, RenderContext) and generator.hoisted is not None
+    generator.hoisted[key] = name
+    return RenderedQuery(f'{name} := {rendered.query}', rendered.context)
+
+
+def hoisted_name(generator: Iterator[int], subquery: SubQuery) -> str | None:
+    if not isinstance(generator, RenderContext) or not generator.hoisted:
+        return None
+    key = subquery_key(subquery)
+    return None if key is None else generator.hoisted.get(key)
@@ -1,94 +1,46 @@
 from collections.abc import Iterator
-from functools import reduce, singledispatch
+from functools import singledispatch
 from typing import Any
 
 from edgeql_qb.expression import (
-    AnyExpression,
     BaseModel,
     Column,
     Expression,
-    QueryLiteral,
-    SubQuery,
     UnlessConflict,
     UpdateSubQuery,
 )
-from edgeql_qb.func import FuncInvocation
-from edgeql_qb.operators import Alias, Node
-from edgeql_qb.render.func import render_function, render_function_args
-from edgeql_qb.render.query_literal import render_query_literal
+from edgeql_qb.render.canonical import canonical_assignments
+from edgeql_qb.render.context import is_canonical
+from edgeql_qb.render.expression import Clause, render_expression
+from edgeql_qb.render.func import render_function_args
 from edgeql_qb.render.tools import (
     combine_many_renderers,
-    join_renderers,
-    render_binary_node,
+    join_many_renderers,
     render_parentheses,
 )
 from edgeql_qb.render.types import RenderedQuery
 
+INSERT_CLAUSE = Clause(literal_prefix='insert', operand_prefix='')
+
 
 def render_insert(model_name: str) -> RenderedQuery:
     return RenderedQuery(f'insert {model_name}')
 
 
-def render_values(values: list[Expression], generator: Iterator[int]) -> RenderedQuery:
+def render_values(values: tuple[Expression, ...], generator: Iterator[int]) -> RenderedQuery:
     assert values
+    ordered = canonical_assignments(values) if is_canonical(generator) else values
     renderers = [
-        render_insert_expression(value.to_infix_notation(), generator)
-        for value in values
+        render_expression(value.to_infix_notation(), INSERT_CLAUSE, generator)
+        for value in ordered
     ]
     return combine_many_renderers(
         RenderedQuery(' { '),
-        reduce(join_renderers(', '), renderers),
+        join_many_renderers(', ', renderers),
         RenderedQuery(' }'),
     )
 
 
-@singledispatch
-def render_insert_expression(expression: AnyExpression, generator: Iterator[int]) -> RenderedQuery:
-    raise NotImplementedError(f'{expression!r} is not supported')  # pragma: no cover
-
-
-@render_insert_expression.register
-def _(expression: FuncInvocation, generator: Iterator[int]) -> RenderedQuery:
-    func = expression.func
-    arg_renderers = [
-        render_insert_expression(arg, generator)
-        for arg in expression.args
-    ]
-    return render_function(func, arg_renderers)
-
-
-@render_insert_expression.register
-def _(expression: Column, generator: Iterator[int]) -> RenderedQuery:
-    return RenderedQuery(expression.column_name)
-
-
-@render_insert_expression.register
-def _(expression: Node, generator: Iterator[int]) -> RenderedQuery:
-    assert expression.right is not None, 'Unary operations is not supported in insert expressions'
-    return render_binary_node(
-        left=render_insert_expression(expression.left, generator),
-        right=render_insert_expression(expression.right, generator),
-        expression=expression,
-    )
-
-
-@render_insert_expression.register
-def _(expression: Alias, generator: Iterator[int]) -> RenderedQuery:
-    return RenderedQuery(expression.name)
-
-
-@render_insert_expression.register
-def _(expression: QueryLiteral, generator: Iterator[int]) -> RenderedQuery:
-    index = next(generator)
-    name = f'insert_{index}'
-    return render_query_literal(expression.value, name)
-
-
-@render_insert_expression.register
-def _(expression: SubQuery, generator: Iterator[int]) -> RenderedQuery:
-    return expression.build(generator)
-
-
 @singledispatch
 def render_unless_conflict_on(on: Any, generator: Iterator[int]) -> RenderedQuery:
     raise NotImplementedError(f'{on!r} is not supported')  # pragma: no cover
@@ -0,0 +1,54 @@
+from collections.abc import Iterator
+
+from edgeql_qb.render.tools import (
+    combine_many_renderers,
+    join_many_renderers,
+    render_parentheses,
+)
+from edgeql_qb.render.types import BuildableQuery, RenderedQuery
+
+
+def render_binding(name: str, query: BuildableQuery, generator: Iterator[int]) -> RenderedQuery:
+    rendered = render_parentheses(query.build(generator))
+    return RenderedQuery(f'{name} := {rendered.query}', rendered.context)
+
+
+def render_multiplex_with(
+    bindings: tuple[tuple[str, BuildableQuery], ...],
+    generator: Iterator[int],
+) -> RenderedQuery:
+    if not bindings:
+        return RenderedQuery()
+    return combine_many_renderers(
+        RenderedQuery('with '),
+        join_many_renderers(
+            ', ',
+            (render_binding(name, query, generator) for name, query in bindings),
+        ),
+        RenderedQuery(' '),
+    )
+
+
+def render_multiplex_element(
+    name: str,
+    query: BuildableQuery | None,
+    generator: Iterator[int],
+) -> RenderedQuery:
+    """Render a computed property of the query result, bound queries are referred by name."""
+    if query is None:
+        return RenderedQuery(f'{name} := {name}')
+    return render_binding(name, query, generator)
+
+
+def render_multiplex_select(
+    elements: tuple[tuple[str, BuildableQuery | None], ...],
+    generator: Iterator[int],
+) -> RenderedQuery:
+    return combine_many_renderers(
+        RenderedQuery('select { '),
+        join_many_renderers(
+            ', ',
+            (render_multiplex_element(name, query, generator) for name, query in elements),
+        ),
+        RenderedQuery(' }'),
+    )
@@ -4,11 +4,12 @@ from typing import Any
 
 from edgeql_qb.expression import Expression, QueryLiteral
 from edgeql_qb.func import FuncInvocation
+from edgeql_qb.render.context import parameter_name
 from edgeql_qb.render.func import render_function
 from edgeql_qb.render.query_literal import render_query_literal
 from edgeql_qb.render.tools import combine_many_renderers
 from edgeql_qb.render.types import RenderedQuery
-from edgeql_qb.types import int64, unsafe_text
+from edgeql_qb.types import Arg, int64, unsafe_text
 
 
 @singledispatch
@@ -16,6 +17,11 @@ def render_offset(offset: Any, generator: Iterator[int]) -> RenderedQuery:
     raise NotImplementedError(f'{offset!r} is not supported')  # pragma: no cover
 
 
+def pagination_arg(arg: Arg) -> Arg:
+    """Integer samples are cast to int64 just like plain integers."""
+    return Arg(arg.name, int64(arg.sample)) if type(arg.sample) is int else arg
+
+
 @render_offset.register
 def _(offset: None, generator: Iterator[int]) -> RenderedQuery:
     return RenderedQuery()
@@ -23,8 +29,7 @@ def _(offset: None, generator: Iterator[int]) -> RenderedQuery:
 
 @render_offset.register
 def _(offset: QueryLiteral, generator: Iterator[int]) -> RenderedQuery:
-    index = next(generator)
-    name = f'offset_{index}'
+    name = parameter_name(generator, 'offset', offset.value)
     return render_query_literal(offset.value, name)
 
 
@@ -43,8 +48,7 @@ def _(offset: FuncInvocation, generator: Iterator[int]) -> RenderedQuery:
 
 @render_offset.register
 def _(offset: int, generator: Iterator[int]) -> RenderedQuery:
-    index = next(generator)
-    name = f'offset_{index}'
+    name = parameter_name(generator, 'offset', int64(offset))
     return combine_many_renderers(
         RenderedQuery(' offset '),
         render_query_literal(int64(offset), name),
@@ -56,6 +60,16 @@ def _(offset: unsafe_text, generator: Iterator[int]) -> RenderedQuery:
     return RenderedQuery(f' offset {offset!s}')
 
 
+@render_offset.register
+def _(offset: Arg, generator: Iterator[int]) -> RenderedQuery:
+    arg = pagination_arg(offset)
+    name = parameter_name(generator, 'offset', arg)
+    return combine_many_renderers(
+        RenderedQuery(' offset '),
+        render_query_literal(arg, name),
+    )
+
+
 @singledispatch
 def render_limit(limit: Any, generator: Iterator[int]) -> RenderedQuery:
     raise NotImplementedError(f'{limit!r} is not supported')  # pragma: no cover
@@ -68,8 +82,7 @@ def _(limit: None, generator: Iterator[int]) -> RenderedQuery:
 
 @render_limit.register
 def _(limit: int, generator: Iterator[int]) -> RenderedQuery:
-    index = next(generator)
-    name = f'limit_{index}'
+    name = parameter_name(generator, 'limit', int64(limit))
     return combine_many_renderers(
         RenderedQuery(' limit '),
         render_query_literal(int64(limit), name),
@@ -83,8 +96,7 @@ def _(limit: unsafe_text, generator: Iterator[int]) -> RenderedQuery:
 
 @render_limit.register
 def _(limit: QueryLiteral, generator: Iterator[int]) -> RenderedQuery:
-    index = next(generator)
-    name = f'limit_{index}'
+    name = parameter_name(generator, 'limit', limit.value)
     return render_query_literal(limit.value, name)
 
 
@@ -99,3 +111,13 @@ def _(limit: FuncInvocation, generator: Iterator[int]) -> RenderedQuery:
         RenderedQuery(' limit '),
         render_function(func, arg_renderers),
     )
+
+
+@render_limit.register
+def _(limit: Arg, generator: Iterator[int]) -> RenderedQuery:
+    arg = pagination_arg(limit)
+    name = parameter_name(generator, 'limit', arg)
+    return combine_many_renderers(
+        RenderedQuery(' limit '),
+        render_query_literal(arg, name),
+    )
@@ -1,51 +1,118 @@
+from collections.abc import Collection
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from functools import singledispatch
 from typing import Any
+from uuid import UUID
 
 from edgeql_qb.frozendict import FrozenDict
 from edgeql_qb.render.types import RenderedQuery
-from edgeql_qb.types import GenericHolder
+from edgeql_qb.types import INFERRED_HOLDERS, Arg, GenericHolder, array
 
 
 @singledispatch
-def render_query_literal(value: Any, name: str) -> RenderedQuery:
+def literal_cast(value: Any) -> str:
+    """Type cast of a query parameter holding the value."""
     if isinstance(value, str | bool | bytes):
         # singledispatch not working for unions
-        return RenderedQuery(
-            f'<{value.__class__.__name__}>${name}',
-            FrozenDict({name: value}),
-        )
-    return RenderedQuery(f'${name}', FrozenDict({name: value}))  # pragma: no cover
+        return f'<{value.__class__.__name__}>'
+    return ''  # pragma: no cover
 
 
-@render_query_literal.register
-def _(value: GenericHolder, name: str) -> RenderedQuery:  # type: ignore[type-arg]
-    return RenderedQuery(f'<{value.edgeql_name}>${name}', FrozenDict({name: value.value}))
+@literal_cast.register
+def _(value: GenericHolder) -> str:  # type: ignore[type-arg]
+    return f'<{value.edgeql_name}>'
 
 
-@render_query_literal.register
-def _(value: datetime, name: str) -> RenderedQuery:
+@literal_cast.register
+def _(value: datetime) -> str:
     if value.tzinfo is None:
-        return RenderedQuery(f'<cal::local_datetime>${name}', FrozenDict({name: value}))
-    return RenderedQuery(f'<{value.__class__.__name__}>${name}', FrozenDict({name: value}))
+        return '<cal::local_datetime>'
+    return f'<{value.__class__.__name__}>'
+
+
+@literal_cast.register
+def _(value: date) -> str:
+    return '<cal::local_date>'
+
+
+@literal_cast.register
+def _(value: time) -> str:
+    return '<cal::local_time>'
+
 
+@literal_cast.register
+def _(value: timedelta) -> str:
+    return '<duration>'
 
-@render_query_literal.register
-def _(value: date, name: str) -> RenderedQuery:
-    return RenderedQuery(f'<cal::local_date>${name}', FrozenDict({name: value}))
 
+@literal_cast.register
+def _(value: Decimal) -> str:
+    return '<decimal>'
 
-@render_query_literal.register
-def _(value: time, name: str) -> RenderedQuery:
-    return RenderedQuery(f'<cal::local_time>${name}', FrozenDict({name: value}))
 
+@literal_cast.register
+def _(value: UUID) -> str:
+    return '<uuid>'
 
-@render_query_literal.register
-def _(value: timedelta, name: str) -> RenderedQuery:
-    return RenderedQuery(f'<duration>${name}', FrozenDict({name: value}))
 
+@literal_cast.register
+def _(value: Arg) -> str:
+    return literal_cast(value.sample)
 
-@render_query_literal.register
-def _(value: Decimal, name: str) -> RenderedQuery:
-    return RenderedQuery(f'<decimal>${name}', FrozenDict({name: value}))
+
+@literal_cast.register(list)
+@literal_cast.register(tuple)
+@literal_cast.register(set)
+@literal_cast.register(frozenset)
+def _(value: Collection[Any]) -> str:
+    # empty collections are rendered as the empty set, which takes the type of the other operand
+    return f'<array<{element_type(value)}>>' if value else ''
+
+
+def element_type(values: Collection[Any]) -> str:
+    """EdgeDB type of collection elements, taken from the first element."""
+    first = next(iter(values))
+    holder = INFERRED_HOLDERS.get(type(first))
+    return literal_cast(first)[1:-1] if holder is None else holder.edgeql_name
+
+
+@singledispatch
+def literal_value(value: Any) -> Any:
+    """Value of a literal as it is passed to the query context."""
+    return value
+
+
+@literal_value.register
+def _(value: GenericHolder) -> Any:  # type: ignore[type-arg]
+    return value.value
+
+
+@literal_value.register
+def _(value: array) -> tuple[Any, ...]:
+    return tuple(literal_value(item) for item in value.value)
+
+
+@literal_value.register(list)
+@literal_value.register(tuple)
+@literal_value.register(set)
+@literal_value.register(frozenset)
+def _(value: Collection[Any]) -> tuple[Any, ...]:
+    # tuple keeps the query context hashable
+    return tuple(literal_value(item) for item in value)
+
+
+def is_empty_collection(value: Any) -> bool:
+    """Empty collections have no element type, so they are not passed as parameters."""
+    return isinstance(value, list | tuple | set | frozenset) and not value
+
+
+def render_query_literal(value: Any, name: str) -> RenderedQuery:
+    if is_empty_collection(value):
+        return RenderedQuery('{}', FrozenDict())
+    parameter = f'{literal_cast(value)}${name}'
+    sample = value.sample if isinstance(value, Arg) else value
+    if isinstance(sample, list | tuple | set | frozenset):
+        # collections are sets of values in queries, so `in` operator works with them
+        parameter = f'array_unpack({parameter})'
+    return RenderedQuery(parameter, FrozenDict({name: literal_value(value)}))
@@ -0,0 +1,149 @@
+import json
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from functools import singledispatch
+from typing import Any
+from uuid import UUID
+
+from edgeql_qb.expression import Column, Columns, inferred_operand
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.render.context import parameter_name
+from edgeql_qb.render.query_literal import literal_cast, literal_value
+from edgeql_qb.render.types import RenderedQuery
+from edgeql_qb.types import GenericHolder, unsafe_text
+
+Row = Mapping[str, Any]
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+@dataclass(slots=True, frozen=True)
+class JsonRows:
+    """Rows encoded as JSON objects, the server unpacks them one by one into `item`."""
+
+    rows: tuple[str, ...]
+
+    @property
+    def payload(self) -> str:
+        return f'[{",".join(self.rows)}]'
+
+
+@singledispatch
+def json_value(value: Any) -> Any:
+    """Value of a literal as it is encoded into a JSON row."""
+    if isinstance(value, bytes):
+        raise NotImplementedError('bytes are not supported in JSON rows')  # pragma: no cover
+    return value
+
+
+@json_value.register
+def _(value: GenericHolder) -> Any:  # type: ignore[type-arg]
+    return value.value
+
+
+@json_value.register(date)
+@json_value.register(time)
+def _(value: date | time) -> str:
+    return value.isoformat()
+
+
+@json_value.register
+def _(value: timedelta) -> str:
+    return f'{value // timedelta(microseconds=1)} microseconds'
+
+
+@json_value.register(Decimal)
+@json_value.register(UUID)
+def _(value: Decimal | UUID) -> str:
+    return str(value)
+
+
+def field_cast(value: Any, column: Column) -> str:
+    """Type cast of a row field, values that JSON has no type for are cast from strings.
+
+    Numbers get the type of the column, int64 or float64 when it is unknown.
+    """
+    cast = literal_cast(inferred_operand(value, column))
+    if not cast:
+        raise TypeError(f'Unknown type of {value!r}, wrap it into a type holder')
+    if isinstance(json_value(value), str) and not isinstance(literal_value(value), str):
+        return f'{cast}<str>'
+    return cast
+
+
+def field_casts(rows: Sequence[Row], columns: Columns) -> dict[str, str]:
+    """Type casts of row fields taken from the first value of each field which is not None."""
+    assert rows, 'No rows'
+    assert all(name.isidentifier() for name in rows[0]), f'Invalid field names: {list(rows[0])}'
+    values = {
+        name: next((row[name] for row in rows if row[name] is not None), None)
+        for name in rows[0]
+    }
+    unknown = [name for name, value in values.items() if value is None]
+    assert not unknown, f'Unknown types of fields with no values: {unknown}'
+    return {name: field_cast(value, getattr(columns, name)) for name, value in values.items()}
+
+
+def encode_row(row: Row, names: Sequence[str]) -> str:
+    return _encoder.encode({name: json_value(row[name]) for name in names})
+
+
+def encode_rows(rows: Sequence[Row], names: Sequence[str]) -> JsonRows:
+    fields = set(names)
+    assert all(row.keys() == fields for row in rows), 'Rows should have the same fields'
+    return JsonRows(tuple(encode_row(row, names) for row in rows))
+
+
+def row_field(name: str, cast: str) -> unsafe_text:
+    """Refer to a field of the row being unpacked."""
+    assert name.isidentifier(), f'Invalid field name: {name!r}'
+    return unsafe_text(f"{cast}item['{name}']")
+
+
+def chunk_rows(
+    rows: JsonRows,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+) -> Iterator[JsonRows]:
+    """Split rows into chunks with payloads of at most `max_rows` rows and `max_bytes` bytes.
+
+    A row which is larger than `max_bytes` on its own makes a chunk of a single row.
+    """
+    assert max_rows is None or max_rows > 0, 'Chunk size should be positive'
+    chunk: list[str] = []
+    size = 1
+    for row in rows.rows:
+        size += len(row) + 1
+        if chunk and is_chunk_full(len(chunk), size, max_rows, max_bytes):
+            yield JsonRows(tuple(chunk))
+            chunk, size = [], len(row) + 2
+        chunk.append(row)
+    yield JsonRows(tuple(chunk))
+
+
+def is_chunk_full(
+    rows: int,
+    size_with_next_row: int,
+    max_rows: int | None,
+    max_bytes: int | None,
+) -> bool:
+    return (
+        (max_rows is not None and rows >= max_rows)
+        or (max_bytes is not None and size_with_next_row > max_bytes)
+    )
+
+
+def render_for_rows(rows: JsonRows | None, generator: Iterator[int]) -> RenderedQuery:
+    if rows is None:
+        return RenderedQuery()
+    name = parameter_name(generator, 'rows', rows.payload)
+    return RenderedQuery(
+        f'for item in json_array_unpack(<json>${name}) union (',
+        FrozenDict({name: rows.payload}),
+    )
+
+
+def render_for_rows_end(rows: JsonRows | None) -> RenderedQuery:
+    return RenderedQuery() if rows is None else RenderedQuery(')')
@@ -0,0 +1,43 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from edgeql_qb.expression import Shape
+from edgeql_qb.lazy import lazy_import
+from edgeql_qb.render.pagination import render_limit, render_offset
+from edgeql_qb.render.tools import combine_many_renderers, join_many_renderers
+from edgeql_qb.render.types import RenderedQuery
+
+if TYPE_CHECKING:
+    from edgeql_qb.render import condition, expression, order_by  # pragma: no cover
+    from edgeql_qb.render.expression import Clause  # pragma: no cover
+else:
+    # shapes contain expressions, which are rendered by modules importing `render.expression`,
+    # so they are resolved on the first shape and `render.expression` imports this module
+    condition = lazy_import('edgeql_qb.render.condition')
+    expression = lazy_import('edgeql_qb.render.expression')
+    order_by = lazy_import('edgeql_qb.render.order_by')
+
+
+def render_shape(
+    shape: Shape,
+    clause: 'Clause',
+    generator: Iterator[int],
+    column_prefix: str,
+) -> RenderedQuery:
+    expressions = (
+        expression.render_expression(exp, clause, generator, column_prefix)
+        for exp in shape.columns
+    )
+    conditions = condition.render_conditions(shape.filters, generator=generator)
+    rendered_order_by = order_by.render_order_by(shape.ordered_by, generator=generator)
+    rendered_offset = render_offset(shape.offset_val, generator=generator)
+    rendered_limit = render_limit(shape.limit_val, generator=generator)
+    return combine_many_renderers(
+        RenderedQuery(f'{shape.parent.column_name}: {{ '),
+        join_many_renderers(', ', expressions),
+        RenderedQuery(' }'),
+        conditions,
+        rendered_order_by,
+        rendered_offset,
+        rendered_limit,
+    )
@@ -0,0 +1,61 @@
+from edgeql_qb.analyze import render_analyze
+from edgeql_qb.render.condition import render_conditions
+from edgeql_qb.render.count import render_count, render_count_inner
+from edgeql_qb.render.delete import render_delete
+from edgeql_qb.render.group import (
+    render_group,
+    render_group_by,
+    render_group_by_expressions,
+    render_using_expressions,
+)
+from edgeql_qb.render.insert import render_insert, render_unless_conflict
+from edgeql_qb.render.insert import render_values as render_insert_values
+from edgeql_qb.render.multiplex import render_multiplex_select, render_multiplex_with
+from edgeql_qb.render.order_by import render_order_by
+from edgeql_qb.render.pagination import render_limit, render_offset
+from edgeql_qb.render.rows import (
+    chunk_rows,
+    encode_rows,
+    field_casts,
+    render_for_rows,
+    render_for_rows_end,
+    row_field,
+)
+from edgeql_qb.render.select import render_select
+from edgeql_qb.render.structure import describe, structure
+from edgeql_qb.render.update import render_update
+from edgeql_qb.render.update import render_values as render_update_values
+from edgeql_qb.render.with_expr import render_with_expression
+
+# renderers of query stages, queries import them on the first build
+__all__ = [
+    'chunk_rows',
+    'describe',
+    'encode_rows',
+    'field_casts',
+    'render_analyze',
+    'render_conditions',
+    'render_count',
+    'render_count_inner',
+    'render_delete',
+    'render_for_rows',
+    'render_for_rows_end',
+    'render_group',
+    'render_group_by',
+    'render_group_by_expressions',
+    'render_insert',
+    'render_insert_values',
+    'render_limit',
+    'render_multiplex_select',
+    'render_multiplex_with',
+    'render_offset',
+    'render_order_by',
+    'render_select',
+    'render_unless_conflict',
+    'render_update',
+    'render_update_values',
+    'render_using_expressions',
+    'render_with_expression',
+    'row_field',
+    'structure',
+]
@@ -0,0 +1,144 @@
+from collections.abc import Hashable
+from functools import singledispatch
+from hashlib import blake2b
+from typing import Any, NamedTuple, Protocol
+
+from edgeql_qb.expression import (
+    BaseModel,
+    Column,
+    Expression,
+    QueryLiteral,
+    Shape,
+    SubQuery,
+    UnlessConflict,
+)
+from edgeql_qb.func import FuncInvocation
+from edgeql_qb.operators import Alias, Node, SortedExpression
+from edgeql_qb.render.query_literal import is_empty_collection, literal_cast, literal_value
+from edgeql_qb.render.rows import JsonRows
+from edgeql_qb.types import unsafe_text
+
+
+class StructuredQuery(Protocol):
+    def _structure(self, values: list[Any]) -> Hashable:
+        ...  # pragma: no cover
+
+
+class QueryDescription(NamedTuple):
+    fingerprint: str
+    values: tuple[Any, ...]
+
+
+def describe(query: StructuredQuery) -> QueryDescription:
+    """Digest of the query structure and literal values of the query in the order of parameters.
+
+    The digest is stable between processes, because it depends on the text of the structure only.
+    """
+    values: list[Any] = []
+    key = query._structure(values)
+    fingerprint = blake2b(repr(key).encode(), digest_size=16).hexdigest()
+    return QueryDescription(fingerprint, tuple(values))
+
+
+def literal_signature(value: Any) -> Hashable:
+    """Everything about a literal that affects the rendered text, i.e. its type cast."""
+    return type(value), literal_cast(value)
+
+
+@singledispatch
+def structure(node: Any, values: list[Any]) -> Hashable:
+    """Describe a node of a query without its literal values.
+
+    Literal values are appended to `values` in the same order
+    in which renderers assign indexes to the query parameters.
+    Anything that is not a part of the query tree is a literal value.
+    """
+    values.append(literal_value(node))
+    return QueryLiteral, literal_signature(node)
+
+
+@structure.register
+def _(node: QueryLiteral, values: list[Any]) -> Hashable:
+    # collections are literals too, they are passed as a single array parameter
+    if not is_empty_collection(node.value):
+        values.append(literal_value(node.value))
+    return QueryLiteral, literal_signature(node.value)
+
+
+@structure.register
+def _(node: None, values: list[Any]) -> Hashable:
+    return None
+
+
+@structure.register
+def _(node: unsafe_text, values: list[Any]) -> Hashable:
+    return unsafe_text, str(node)
+
+
+@structure.register
+def _(node: Column, values: list[Any]) -> Hashable:
+    return Column, node.path
+
+
+@structure.register
+def _(node: Alias, values: list[Any]) -> Hashable:
+    return Alias, node.name
+
+
+@structure.register
+def _(node: BaseModel, values: list[Any]) -> Hashable:
+    return BaseModel, node.name, node.module
+
+
+@structure.register
+def _(node: Expression, values: list[Any]) -> Hashable:
+    return structure(node.to_infix_notation(), values)
+
+
+@structure.register
+def _(node: tuple, values: list[Any]) -> Hashable:  # type: ignore[type-arg]
+    return tuple(structure(item, values) for item in node)
+
+
+@structure.register
+def _(node: Node, values: list[Any]) -> Hashable:
+    left = structure(node.left, values)
+    right = structure(node.right, values)
+    return Node, node.op, left, right
+
+
+@structure.register
+def _(node: SortedExpression, values: list[Any]) -> Hashable:
+    return SortedExpression, structure(node.expression, values), node.order
+
+
+@structure.register
+def _(node: FuncInvocation, values: list[Any]) -> Hashable:
+    return FuncInvocation, node.func, structure(node.args, values)
+
+
+@structure.register
+def _(node: Shape, values: list[Any]) -> Hashable:
+    # shape columns are rendered after shape's clauses
+    filters = structure(node.filters, values)
+    ordered_by = structure(node.ordered_by, values)
+    offset = structure(node.offset_val, values)
+    limit = structure(node.limit_val, values)
+    columns = structure(node.columns, values)
+    return Shape, structure(node.parent, values), columns, filters, ordered_by, offset, limit
+
+
+@structure.register
+def _(node: UnlessConflict, values: list[Any]) -> Hashable:
+    return UnlessConflict, structure(node.on, values), structure(node.else_, values)
+
+
+@structure.register
+def _(node: SubQuery, values: list[Any]) -> Hashable:
+    return node._structure(values)
+
+
+@structure.register
+def _(node: JsonRows, values: list[Any]) -> Hashable:
+    values.append(node.payload)
+    return JsonRows
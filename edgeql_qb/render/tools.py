@@ -1,14 +1,20 @@
-from collections.abc import Callable
-from functools import reduce
+from collections.abc import Callable, Iterable
 from typing import cast
 
 from edgeql_qb.expression import Column, SubQuery
 from edgeql_qb.operators import Node
+from edgeql_qb.render.buffer import RenderBuffer
 from edgeql_qb.render.types import RenderedQuery
 
 
 def combine_many_renderers(*renderers: RenderedQuery) -> RenderedQuery:
-    return reduce(combine_renderers, renderers)
+    return join_many_renderers('', renderers)
+
+
+def join_many_renderers(separator: str, renderers: Iterable[RenderedQuery]) -> RenderedQuery:
+    buffer = RenderBuffer()
+    buffer.extend(renderers, separator)
+    return buffer.materialize()
 
 
 def join_renderers(separator: str = '') -> Callable[[RenderedQuery, RenderedQuery], RenderedQuery]:
@@ -100,10 +106,3 @@ def render_left_parentheses(
     is_need = need_left_parentheses(left, expression)
     return render_assoc_parentheses(is_need=is_need)
 
-
-def linearize_filter_left(column: Column) -> list[Column]:
-    match column.parent:
-        case None:
-            return [column]
-        case _:
-            return [*linearize_filter_left(column.parent), column]
@@ -1,7 +1,9 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from typing import Any, Protocol
 
 from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.types import Arg
 
 
 @dataclass(slots=True, frozen=True)
@@ -11,3 +13,36 @@ class RenderedQuery:
 
     def map(self, f: Callable[['RenderedQuery'], 'RenderedQuery']) -> 'RenderedQuery':
         return f(self)
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledQuery:
+    """Query text rendered once, ready to be executed with different parameters.
+
+    Values of `Arg` placeholders are passed to `bind` by their names,
+    other parameters keep the values the query was compiled with.
+    """
+
+    query: str
+    context: FrozenDict = FrozenDict()  # noqa: RUF009
+
+    @classmethod
+    def from_rendered(cls, rendered: RenderedQuery) -> 'CompiledQuery':
+        return cls(rendered.query, rendered.context)
+
+    @property
+    def arg_names(self) -> set[str]:
+        return {value.name for value in self.context.values() if isinstance(value, Arg)}
+
+    def bind(self, **values: Any) -> dict[str, Any]:
+        if values.keys() != self.arg_names:
+            raise TypeError(f'Expected arguments {sorted(self.arg_names)}, got {sorted(values)}')
+        return {
+            name: values[value.name] if isinstance(value, Arg) else value
+            for name, value in self.context.items()
+        }
+
+
+class BuildableQuery(Protocol):
+    def build(self, generator: Iterator[int] | None = None) -> RenderedQuery:
+        ...  # pragma: no cover
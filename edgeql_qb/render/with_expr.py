@@ -1,11 +1,14 @@
 from collections.abc import Callable, Iterator
-from functools import reduce
+from typing import Any
 
 from edgeql_qb.expression import Expression
-from edgeql_qb.render.expression import render_expression
-from edgeql_qb.render.tools import combine_many_renderers, join_renderers
+from edgeql_qb.render.expression import Clause, render_expression
+from edgeql_qb.render.hoisting import claim_hoisting, render_bindings
+from edgeql_qb.render.tools import combine_many_renderers, join_many_renderers
 from edgeql_qb.render.types import RenderedQuery
 
+WITH_CLAUSE = Clause(literal_prefix='with')
+
 
 def render_with_expressions(
         expressions: list[RenderedQuery],
@@ -14,7 +17,7 @@ def render_with_expressions(
         return (
             combine_many_renderers(
                 rendered_with,
-                reduce(join_renderers(', '), expressions),
+                join_many_renderers(', ', expressions),
             )
             if expressions
             else rendered_with
@@ -70,11 +73,14 @@ def render_with_expression(
         with_aliases: tuple[Expression, ...],
         generator: Iterator[int],
         module: str | None = None,
+        query: Any = None,
 ) -> RenderedQuery:
+    repeated = claim_hoisting(generator, query)
     renderers = [
-        render_expression(alias.to_infix_notation(), 'with', generator)
+        render_expression(alias.to_infix_notation(), WITH_CLAUSE, generator)
         for alias in with_aliases
     ]
+    renderers.extend(render_bindings(repeated, generator))
     return (
         RenderedQuery('with ')
         .map(render_with_module(module))
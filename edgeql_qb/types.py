@@ -1,4 +1,6 @@
-from typing import Generic, TypeVar
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
 
 T = TypeVar('T')
 
@@ -39,6 +41,22 @@ class float64(GenericHolder[float]):
     edgeql_name = 'float64'
 
 
+# holders of numbers by EdgeDB type, python numbers are cast to the type of the property
+SCALAR_HOLDERS: dict[str, type[GenericHolder[Any]]] = {
+    holder.edgeql_name: holder for holder in (int16, int32, int64, bigint, float32, float64)
+}
+# holders of python numbers compared with properties of unknown types
+INFERRED_HOLDERS: dict[type, type[GenericHolder[Any]]] = {int: int64, float: float64}
+
+
+class array(GenericHolder[Sequence[Any]]):
+    """Array of values of the element type, e.g. `array(int64, [1, 2, 3])`."""
+
+    def __init__(self, element_type: type[GenericHolder[Any]], value: Sequence[Any]):
+        super().__init__(value)
+        self.edgeql_name = f'array<{element_type.edgeql_name}>'
+
+
 class unsafe_text(str):
     """Wrapper for rendering a text node as is.
 
@@ -46,3 +64,17 @@ class unsafe_text(str):
     Otherwise, you may be the first victim of EdgeQL Injection attack.
     There's no honor in this.
     """
+
+
+@dataclass(slots=True, frozen=True)
+class Arg:
+    """Named placeholder of a value, the sample value defines its type.
+
+    Queries with arguments are rendered ahead of time by `python -m edgeql_qb.codegen`.
+    """
+
+    name: str
+    sample: Any
+
+    def __post_init__(self) -> None:
+        assert self.name.isidentifier(), f'Invalid argument name: {self.name!r}'
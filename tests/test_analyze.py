@@ -0,0 +1,84 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.analyze import Cost, parse_analysis
+from edgeql_qb.execution import fetch_analysis
+from edgeql_qb.frozendict import FrozenDict
+
+Nested1 = EdgeDBModel('Nested1')
+FIXTURE = (Path(__file__).parent / 'fixtures' / 'analyze_nested_shape.json').read_text()
+
+
+def test_analyze_wraps_query() -> None:
+    query = Nested1.select(Nested1.c.name).where(Nested1.c.name == 'n1')
+    rendered = query.analyze()
+    assert rendered.query == 'analyze select Nested1 { name } filter .name = <str>$filter_0'
+    assert rendered.context == FrozenDict(filter_0='n1')
+
+
+def test_parse_fine_grained_plan() -> None:
+    analysis = parse_analysis(FIXTURE)
+    assert analysis.plan is not None
+    nodes = list(analysis.plan.walk())
+    assert [node.node_type for node in nodes] == ['Seq Scan', 'Index Scan', 'Seq Scan']
+    assert [node.contexts for node in nodes] == [
+        ('select Nested1',),
+        ('nested2: { name, nested3: { name } }',),
+        ('nested3: { name }',),
+    ]
+    assert nodes[2].cost == Cost(
+        startup_cost=0.0,
+        total_cost=400.1,
+        plan_rows=1,
+        actual_startup_time=3.1,
+        actual_total_time=3.29,
+        actual_rows=1,
+        actual_loops=1,
+    )
+
+
+def test_parse_coarse_grained_shape() -> None:
+    analysis = parse_analysis(FIXTURE)
+    assert analysis.shape is not None
+    assert [child.path for child in analysis.shape.children] == [('nested2',), ('name',)]
+    assert analysis.shape.relations == ('default::Nested1',)
+    node = analysis.most_expensive_path
+    assert node is not None
+    assert node.path == ('nested2', 'nested3')
+    assert node.relations == ('default::Nested3',)
+    assert analysis.summary() == (
+        'most expensive shape: nested2.nested3 (cost 400.10, actual time 3.290 ms)'
+    )
+
+
+def test_parse_estimated_plan_without_shape() -> None:
+    analysis = parse_analysis({'buffers': ['select A'], 'fine_grained': {'plan_type': 'Result'}})
+    assert analysis.plan is not None
+    assert analysis.plan.node_type == 'Result'
+    assert analysis.plan.cost == Cost(startup_cost=0.0, total_cost=0.0, plan_rows=0.0)
+    assert analysis.most_expensive_path is None
+    assert analysis.summary() == 'no shape plan'
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    async def query(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def query_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        self.queries.append(query)
+        return FIXTURE
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+
+def test_fetch_analysis() -> None:
+    client = FakeClient()
+    analysis = asyncio.run(fetch_analysis(Nested1.select(Nested1.c.name), client))
+    assert client.queries == ['analyze select Nested1 { name }']
+    assert analysis == parse_analysis(FIXTURE)
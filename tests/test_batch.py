@@ -0,0 +1,79 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.batch import build_many
+from edgeql_qb.cache import BuildCache
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.queries import SelectQuery
+from edgeql_qb.render.context import RenderContext
+from edgeql_qb.types import int16
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+
+
+def report(i: int) -> SelectQuery:
+    nested2 = Nested1.c.nested2
+    return Nested1.select(
+        Nested1.c.name,
+        nested2(nested2.name).where(nested2.name != f'skip {i}'),
+        others=A.select().where(A.c.p_int16 > int16(i)).limit(3),
+    ).where(Nested1.c.name == f'name {i}').limit(i + 1)
+
+
+def test_build_many_keeps_order() -> None:
+    queries = [report(i) for i in range(200)]
+    expected = [query.build() for query in queries]
+    assert build_many(queries) == expected
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert build_many(queries, executor) == expected
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert build_many(queries, executor, chunksize=50) == expected
+
+
+def test_build_many_sends_large_queries_to_processes() -> None:
+    query = A.select()
+    for i in range(3000):
+        query = query.where(A.c.p_str != f'skip {i}')
+    queries = [query, A.insert.values(**{f'p_{i}': i for i in range(500)})]
+    expected = [query.build() for query in queries]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert build_many(queries, executor) == expected
+
+
+def test_queries_are_picklable() -> None:
+    query = report(1)
+    assert pickle.loads(pickle.dumps(query)).build() == query.build()
+    context = FrozenDict(a=1) | FrozenDict(b=2)
+    assert pickle.loads(pickle.dumps(context)) == FrozenDict(a=1, b=2)
+
+
+def test_shared_render_context() -> None:
+    context = RenderContext(dedup=True)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        names = list(executor.map(lambda i: context.parameter_name('p', i % 10), range(1000)))
+        indexes = list(executor.map(lambda _: next(context), range(1000)))
+    assert sorted(set(names)) == sorted(f'p_{i}' for i in range(10))
+    assert sorted(indexes) == list(range(10, 1010))
+
+
+def test_shared_cache() -> None:
+    cache = BuildCache(maxsize=4)
+    queries = [report(i) for i in range(500)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rendered = list(executor.map(cache.build, queries))
+    assert rendered == [query.build() for query in queries]
+    assert cache.hits + cache.misses == 500
+    assert len(cache) == 1
+
+
+def test_shared_union() -> None:
+    unions = [FrozenDict(a=i) | FrozenDict(b=i) for i in range(100)]
+    shared = FrozenDict()
+    for union in unions:
+        shared = shared | union
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        merged: list[dict[str, int]] = list(executor.map(dict, [*unions, shared] * 4))
+    assert merged[:100] == [{'a': i, 'b': i} for i in range(100)]
+    assert merged[100] == {'a': 99, 'b': 99}
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.cache import BuildCache
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.func import std
+from edgeql_qb.operators import Alias
+from edgeql_qb.queries import InsertQuery, SelectQuery
+from edgeql_qb.types import int16, int64, unsafe_text
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+Nested2 = EdgeDBModel('Nested2')
+Nested3 = EdgeDBModel('Nested3')
+WithConstraints = EdgeDBModel('WithConstraints')
+
+
+def test_cache_hit_extracts_new_values() -> None:
+    cache = BuildCache()
+    first = cache.build(A.select(A.c.p_str).where(A.c.p_str == 'first').limit(1))
+    second = cache.build(A.select(A.c.p_str).where(A.c.p_str == 'second').limit(2))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.query == second.query == (
+        'select A { p_str } filter .p_str = <str>$filter_0 limit <int64>$limit_1'
+    )
+    assert second.context == FrozenDict(filter_0='second', limit_1=2)
+
+
+def test_cache_key_depends_on_literal_types() -> None:
+    cache = BuildCache()
+    cache.build(A.select().where(A.c.p_int16 == int16(1)))
+    rendered = cache.build(A.select().where(A.c.p_int16 == int64(1)))
+    assert rendered.query == 'select A filter .p_int16 = <int64>$filter_0'
+    cache.build(A.select().where(A.c.p_datetime == datetime(2000, 1, 1, tzinfo=timezone.utc)))
+    rendered = cache.build(A.select().where(A.c.p_datetime == datetime(2000, 1, 1)))  # noqa: DTZ001
+    assert rendered.query == 'select A filter .p_datetime = <cal::local_datetime>$filter_0'
+    cache.build(A.select().limit(1))
+    assert cache.build(A.select().limit1).query == 'select A limit 1'
+    assert cache.misses == 6
+    assert cache.hits == 0
+
+
+def test_cache_parameters_order_follows_generator() -> None:
+    def query(n1: str, n2: str, n3: str) -> SelectQuery:
+        return Nested1.select(
+            Nested1.c.nested2(
+                Nested1.c.nested2.nested3(
+                    Nested1.c.nested2.nested3.name,
+                ).where(Nested3.c.name == n3),
+            ).where(Nested2.c.name == n2),
+        ).where(Nested1.c.name == n1)
+
+    cache = BuildCache()
+    cache.build(query('a', 'b', 'c'))
+    rendered = cache.build(query('n1', 'n2', 'n3'))
+    assert cache.hits == 1
+    assert rendered == query('n1', 'n2', 'n3').build()
+    assert rendered.context == FrozenDict(filter_0='n2', filter_1='n3', filter_2='n1')
+
+
+def test_cache_nested_queries() -> None:
+    def query(name: str, value: int) -> InsertQuery:
+        x = Alias('x').assign(std.len(name))
+        return (
+            WithConstraints
+            .insert
+            .with_(x)
+            .values(name=name, composite1=x, composite2=std.to_str(int64(value)))
+            .unless_conflict(
+                on=WithConstraints.c.name,
+                else_=WithConstraints.update.values(composite1=name),
+            )
+        )
+
+    cache = BuildCache()
+    cache.build(query('old', 1))
+    rendered = cache.build(query('new', 2))
+    assert cache.hits == 1
+    assert rendered == query('new', 2).build()
+    assert rendered.context == FrozenDict(
+        with_0='new',
+        insert_1='new',
+        insert_2=2,
+        update_3='new',
+    )
+
+
+def test_cache_all_query_types() -> None:
+    decade = (A.c.p_int64 // 10).label('decade')
+    queries = (
+        A.count.where(A.c.p_int16 <= int16(2)),
+        A.group(A.c.p_str).using(decade).by(decade),
+        (
+            A.delete
+            .where(A.c.p_str == 'a')
+            .order_by(A.c.p_str.desc())
+            .offset(1)
+            .limit(unsafe_text('2'))
+        ),
+        A.update.values(p_str='new').where(A.c.p_str == 'old'),
+        A.select().select_from(A.insert.values(p_str='x').unless_conflict()),
+    )
+    cache = BuildCache()
+    for query in queries:
+        cache.build(query)
+        assert cache.build(query) == query.build()
+    assert cache.hits == cache.misses == len(queries)
+
+
+def test_cache_lru_eviction() -> None:
+    cache = BuildCache(maxsize=2)
+    cache.build(A.select(A.c.p_str))
+    cache.build(A.select(A.c.p_int16))
+    cache.build(A.select(A.c.p_str))
+    cache.build(A.select(A.c.p_int32))
+    assert len(cache) == 2
+    cache.build(A.select(A.c.p_str))
+    cache.build(A.select(A.c.p_int16))
+    assert (cache.hits, cache.misses) == (2, 4)
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,136 @@
+import sys
+from pathlib import Path
+from types import ModuleType
+from uuid import UUID
+
+import pytest
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.codegen import generate_module, register
+from edgeql_qb.codegen.__main__ import main
+from edgeql_qb.types import Arg, int16
+
+A = EdgeDBModel('A')
+
+SOURCE = """
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.codegen import register
+from edgeql_qb.types import Arg
+
+A = EdgeDBModel('A')
+by_string = register(A.select(A.c.p_str).where(A.c.p_str == Arg('value', '')))
+"""
+
+
+def module(**queries: object) -> ModuleType:
+    result = ModuleType('app.queries')
+    vars(result).update(queries)
+    return result
+
+
+def test_generate_module() -> None:
+    source = generate_module(module(
+        A=A,
+        page=register(
+            A.select(A.c.p_str)
+            .where(A.c.p_int16 > Arg('after', int16(0)))
+            .where(A.c.p_str != 'x')
+            .order_by(A.c.p_int16)
+            .offset(Arg('offset', 0))
+            .limit(Arg('limit', 10)),
+        ),
+        by_id=register(
+            A.select().where((A.c.id == Arg('id', UUID(int=0))) | A.c.p_str.like('a%')),
+        ),
+        create=register(A.insert.values(p_str=Arg('value', ''), p_int16=int16(1))),
+    ))
+    assert source == (
+        '"""Generated by `python -m edgeql_qb.codegen app.queries`, do not edit."""\n'
+        'import uuid\n'
+        'from typing import Any\n'
+        '\n'
+        '\n'
+        "PAGE = 'select A { p_str } filter .p_int16 > <int16>$filter_0 "
+        "and .p_str != <str>$filter_1 order by .p_int16 "
+        "offset <int64>$offset_2 limit <int64>$limit_3'\n"
+        '\n'
+        '\n'
+        'def page(after: int, offset: int, limit: int) -> dict[str, Any]:\n'
+        "    return {'filter_0': after, 'filter_1': 'x', 'offset_2': offset, 'limit_3': limit}\n"
+        '\n'
+        '\n'
+        "BY_ID = 'select A filter .id = <uuid>$filter_0 or .p_str like <str>$filter_1'\n"
+        '\n'
+        '\n'
+        'def by_id(id: uuid.UUID) -> dict[str, Any]:\n'
+        "    return {'filter_0': id, 'filter_1': 'a%'}\n"
+        '\n'
+        '\n'
+        "CREATE = 'insert A { p_str := <str>$insert_0, p_int16 := <int16>$insert_1 }'\n"
+        '\n'
+        '\n'
+        'def create(value: str) -> dict[str, Any]:\n'
+        "    return {'insert_0': value, 'insert_1': 1}\n"
+    )
+    generated: dict[str, object] = {}
+    exec(source, generated)
+    page = A.select(A.c.p_str).where(A.c.p_int16 > int16(5)).where(A.c.p_str != 'x')
+    rendered = page.order_by(A.c.p_int16).offset(20).limit(10).build()
+    assert generated['PAGE'] == rendered.query
+    assert generated['page'](5, 20, 10) == rendered.context  # type: ignore[operator]
+
+
+def test_generated_arguments_are_shared() -> None:
+    value = Arg('value', '')
+    source = generate_module(module(
+        twice=register(A.select().where(A.c.p_str == value).where(A.c.p_str != value)),
+    ))
+    assert 'def twice(value: str) -> dict[str, Any]:\n' in source
+    assert "    return {'filter_0': value}\n" in source
+
+
+def test_generated_in_list_arguments() -> None:
+    source = generate_module(module(
+        by_ids=register(A.select().where(A.c.p_int64.in_(Arg('ids', [1])))),
+        by_uuids=register(A.select().where(A.c.id.in_(Arg('ids', (UUID(int=0),))))),
+    ))
+    assert source == (
+        '"""Generated by `python -m edgeql_qb.codegen app.queries`, do not edit."""\n'
+        'import collections.abc\n'
+        'import uuid\n'
+        'from typing import Any\n'
+        '\n'
+        '\n'
+        "BY_IDS = 'select A filter .p_int64 in array_unpack(<array<int64>>$filter_0)'\n"
+        '\n'
+        '\n'
+        'def by_ids(ids: collections.abc.Sequence[int]) -> dict[str, Any]:\n'
+        "    return {'filter_0': ids}\n"
+        '\n'
+        '\n'
+        "BY_UUIDS = 'select A filter .id in array_unpack(<array<uuid>>$filter_0)'\n"
+        '\n'
+        '\n'
+        'def by_uuids(ids: collections.abc.Sequence[uuid.UUID]) -> dict[str, Any]:\n'
+        "    return {'filter_0': ids}\n"
+    )
+
+
+def test_generated_constants_should_be_literals() -> None:
+    query = register(A.select().where(A.c.p_bytes == bytearray(b'a')))
+    with pytest.raises(AssertionError, match='is not a literal'):
+        generate_module(module(query=query))
+
+
+def test_codegen_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / 'codegen_app.py').write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, 'argv', ['codegen', 'codegen_app', '--check'])
+    assert main() == 1
+    assert not (tmp_path / 'codegen_app_edgeql.py').exists()
+    monkeypatch.setattr(sys, 'argv', ['codegen', 'codegen_app'])
+    assert main() == 0
+    generated = (tmp_path / 'codegen_app_edgeql.py').read_text()
+    assert 'def by_string(value: str) -> dict[str, Any]:\n' in generated
+    monkeypatch.setattr(sys, 'argv', ['codegen', 'codegen_app', '--check'])
+    assert main() == 0
@@ -0,0 +1,58 @@
+import pytest
+from edgedb.blocking_client import Client
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.render.types import CompiledQuery
+from edgeql_qb.types import Arg, int16
+
+A = EdgeDBModel('A')
+
+
+def test_compile_select(client: Client) -> None:
+    compiled = A.select(A.c.p_str).where(A.c.p_str == Arg('title', '')).limit(10).compile()
+    assert compiled.query == (
+        'select A { p_str } filter .p_str = <str>$filter_0 limit <int64>$limit_1'
+    )
+    assert compiled.context == FrozenDict(filter_0=Arg('title', ''), limit_1=10)
+    context = compiled.bind(title='Hello')
+    assert context == {'filter_0': 'Hello', 'limit_1': 10}
+    insert = A.insert.values(p_str='Hello').build()
+    client.query(insert.query, **insert.context)
+    result = client.query(compiled.query, **context)
+    assert len(result) == 1
+
+
+def test_compile_matches_build() -> None:
+    queries = (
+        A.count.where(A.c.p_int16 <= int16(2)),
+        A.group(A.c.p_str).by(A.c.p_str),
+        A.delete.where(A.c.p_str == 'test'),
+        A.insert.values(p_str='test'),
+        A.update.values(p_str='new').where(A.c.p_str == 'old'),
+    )
+    for query in queries:
+        rendered = query.build()
+        assert query.compile() == CompiledQuery(rendered.query, rendered.context)
+
+
+def test_bind_does_not_change_compiled_query() -> None:
+    compiled = A.insert.values(p_str='test', p_str2=Arg('value', '')).compile()
+    assert compiled.arg_names == {'value'}
+    assert compiled.bind(value='a') == {'insert_0': 'test', 'insert_1': 'a'}
+    assert compiled.bind(value='b') == {'insert_0': 'test', 'insert_1': 'b'}
+    assert compiled.context == FrozenDict(insert_0='test', insert_1=Arg('value', ''))
+
+
+def test_bind_repeated_argument() -> None:
+    title = Arg('title', '')
+    compiled = A.select().where((A.c.p_str == title) | (A.c.p_str2 == title)).compile()
+    assert compiled.bind(title='a') == {'filter_0': 'a', 'filter_1': 'a'}
+
+
+def test_bind_unknown_argument() -> None:
+    compiled = A.delete.where(A.c.p_str == Arg('title', '')).compile()
+    with pytest.raises(TypeError, match=r"Expected arguments \['title'\], got \['filter_0'\]"):
+        compiled.bind(filter_0='test')
+    with pytest.raises(TypeError, match=r"Expected arguments \['title'\], got \[\]"):
+        compiled.bind()
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.execution import execute, fetch, fetch_single, gather
+from edgeql_qb.types import int16
+
+A = EdgeDBModel('A')
+
+
+class FakeClient:
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.running = self.max_running = 0
+
+    async def _call(self, method: str, query: str, kwargs: dict[str, Any]) -> Any:
+        self.calls.append((method, query, kwargs))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return [query, kwargs]
+
+    async def query(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call('query', query, kwargs)
+
+    async def query_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._call('query_single', query, kwargs)
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> None:
+        await self._call('execute', query, kwargs)
+
+
+def test_fetch_passes_context_as_kwargs() -> None:
+    client = FakeClient()
+    query = A.select(A.c.p_str).where(A.c.p_int16 == int16(1)).limit(2)
+    result = asyncio.run(fetch(query, client))
+    expected = 'select A { p_str } filter .p_int16 = <int16>$filter_0 limit <int64>$limit_1'
+    assert result == [expected, {'filter_0': 1, 'limit_1': 2}]
+    assert client.calls == [('query', expected, {'filter_0': 1, 'limit_1': 2})]
+
+
+def test_query_shortcuts() -> None:
+    client = FakeClient()
+
+    async def run() -> None:
+        await A.select().limit1.fetch_single(client)
+        await A.delete.where(A.c.p_str == 'a').execute(client)
+        await A.count.fetch(client)
+
+    asyncio.run(run())
+    assert client.calls == [
+        ('query_single', 'select A limit 1', {}),
+        ('execute', 'delete A filter .p_str = <str>$filter_0', {'filter_0': 'a'}),
+        ('query', 'select count(A)', {}),
+    ]
+
+
+def test_fetch_accepts_rendered_queries() -> None:
+    client = FakeClient()
+    compiled = A.select().where(A.c.p_str == 'a').compile()
+    asyncio.run(fetch_single(compiled, client))
+    asyncio.run(execute(A.insert.values(p_str='b').build(), client))
+    assert client.calls == [
+        ('query_single', 'select A filter .p_str = <str>$filter_0', {'filter_0': 'a'}),
+        ('execute', 'insert A { p_str := <str>$insert_0 }', {'insert_0': 'b'}),
+    ]
+
+
+def test_gather_keeps_order_and_bounds_concurrency() -> None:
+    client = FakeClient(delay=0.001)
+    queries = [A.select().where(A.c.p_int16 == int16(i)) for i in range(10)]
+    results = asyncio.run(gather(queries, client, concurrency=3))
+    assert [kwargs for _, kwargs in results] == [{'filter_0': i} for i in range(10)]
+    assert client.max_running == 3
+
+
+def test_gather_without_limit() -> None:
+    client = FakeClient(delay=0.001)
+    queries = [A.select().limit(i) for i in range(1, 5)]
+    results = asyncio.run(gather(queries, client, method=fetch_single))
+    assert [kwargs for _, kwargs in results] == [{'limit_0': i} for i in range(1, 5)]
+    assert client.max_running == 4
+    assert {method for method, _, _ in client.calls} == {'query_single'}
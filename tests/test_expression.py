@@ -0,0 +1,62 @@
+import copy
+import pickle
+
+import pytest
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.expression import Column, Expression
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.func import std
+from edgeql_qb.operators import Alias, Node, SortedExpression
+from edgeql_qb.types import int64
+
+A = EdgeDBModel('A')
+
+
+def test_expression_is_normalized_once() -> None:
+    expression = Expression((A.c.p_int64 - -A.c.p_int32).desc())
+    tree = expression.to_infix_notation()
+    assert tree is expression.to_infix_notation()
+    assert isinstance(tree, SortedExpression)
+    assert tree.order == 'desc'
+    assert isinstance(tree.expression, Node)
+    assert tree.expression.op == '+'
+    assert tree.expression.left == Column('p_int64')
+    assert tree.expression.right == Column('p_int32')
+
+
+def test_nested_assignments_become_labels() -> None:
+    x = Alias('x').assign(int64(1))
+    tree = Expression((std.len(x) + x).label('y')).to_infix_notation()
+    assert isinstance(tree, Node)
+    assert tree.left == Alias('y')
+    assert isinstance(tree.right, Node)
+    assert tree.right.right == Alias('x')
+    assert tree.right.left.args == (Alias('x'),)  # type: ignore[attr-defined]
+
+
+def test_operator_like_strings_are_literals() -> None:
+    rendered = A.select().where((A.c.p_str == 'and') | (A.c.p_str == 'desc')).build()
+    assert rendered.query == (
+        'select A filter .p_str = <str>$filter_0 or .p_str = <str>$filter_1'
+    )
+    assert rendered.context == FrozenDict(filter_0='and', filter_1='desc')
+
+
+def test_column_paths_are_interned() -> None:
+    B = EdgeDBModel('B')  # noqa: N806
+    name = A.c.nested2.nested3.name
+    assert name is A.c.nested2.nested3.name
+    assert name is B.c.nested2.nested3.name
+    assert name.path == ('nested2', 'nested3', 'name')
+    assert name.dotted('.') == '.nested2.nested3.name'
+    assert name.dotted('.') is name.dotted('.')
+
+
+def test_columns_survive_copying() -> None:
+    column = A.c.nested2.nested3
+    with pytest.raises(AttributeError, match='_steps'):
+        Column.__new__(Column).name
+    for copied in (copy.copy(column), pickle.loads(pickle.dumps(column))):
+        assert copied.path == column.path
+        assert copied.name.path == ('nested2', 'nested3', 'name')
@@ -0,0 +1,72 @@
+from uuid import UUID
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.func import std
+from edgeql_qb.operators import Alias
+from edgeql_qb.types import array, int16, int64
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+
+
+def test_fingerprint_ignores_literal_values() -> None:
+    first = A.select(A.c.p_str).where(A.c.p_str == 'first').limit(1)
+    second = A.select(A.c.p_str).where(A.c.p_str == 'second').limit(2)
+    assert first.fingerprint() == second.fingerprint()
+    assert first.value_vector() == ('first', 1)
+    assert second.value_vector() == ('second', 2)
+    assert len(first.fingerprint()) == 32
+
+
+def test_fingerprint_depends_on_structure_and_types() -> None:
+    fingerprints = {
+        A.select().where(A.c.p_int16 == int16(1)).fingerprint(),
+        A.select().where(A.c.p_int16 == int64(1)).fingerprint(),
+        A.select().where(A.c.p_int16 != int16(1)).fingerprint(),
+        A.select().limit(1).fingerprint(),
+        A.select().limit1.fingerprint(),
+        A.delete.limit(1).fingerprint(),
+        A.count.fingerprint(),
+    }
+    assert len(fingerprints) == 7
+
+
+def test_value_vector_follows_parameters_order() -> None:
+    query = (
+        Nested1.select(Nested1.c.name)
+        .with_(Alias('x').assign(int64(5)))
+        .where(Nested1.c.name == 'n1')
+        .offset(3)
+    )
+    rendered = query.build()
+    assert query.value_vector() == (5, 'n1', 3)
+    assert tuple(rendered.context.values()) == query.value_vector()
+
+
+def test_fingerprint_of_mutations() -> None:
+    uuid = UUID(int=1)
+    insert = A.insert.values(p_str='a', p_int16=int16(1))
+    assert insert.fingerprint() == A.insert.values(p_str='b', p_int16=int16(2)).fingerprint()
+    assert insert.fingerprint() != A.insert.values(p_int16=int16(2), p_str='b').fingerprint()
+    update = A.update.where(A.c.id == uuid).values(p_str='a')
+    assert update.value_vector() == (uuid, 'a')
+    rows = [{'p_str': 'a'}, {'p_str': 'b'}]
+    assert A.insert.values_many(rows).value_vector() == ('[{"p_str":"a"},{"p_str":"b"}]',)
+
+
+def test_fingerprint_is_memoized() -> None:
+    query = A.select().limit(1)
+    assert query.fingerprint() is query.fingerprint()
+    assert query == A.select().limit(1)
+
+
+def test_fingerprint_of_collections() -> None:
+    empty = A.select().where(A.c.p_int64.in_([])).where(A.c.p_str == 'a')
+    other = A.select().where(A.c.p_int64.in_([])).where(A.c.p_str == 'b')
+    assert empty.fingerprint() == other.fingerprint()
+    assert empty.value_vector() == ('a',)
+    assert empty.build().context == {'filter_1': 'a'}
+    holder = A.select().where(A.c.p_int64.in_(std.array_unpack(array(int64, [1, 2]))))
+    assert holder.value_vector() == ((1, 2),)
+    assert holder.build().context == {'filter_0': (1, 2)}
+    assert holder.fingerprint() != A.select().where(A.c.p_int64.in_([1, 2])).fingerprint()
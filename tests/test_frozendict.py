@@ -1,5 +1,10 @@
+import pickle
+
+from edgeql_qb import EdgeDBModel
 from edgeql_qb.frozendict import FrozenDict
 
+A = EdgeDBModel('A')
+
 
 def test_frozendict_len() -> None:
     assert len(FrozenDict()) == 0
@@ -9,3 +14,52 @@ def test_frozendict_len() -> None:
 def test_frozendict_hash() -> None:
     assert hash(FrozenDict()) == hash(FrozenDict())
     assert hash(FrozenDict(a=1)) == hash(FrozenDict(a=1))
+
+
+def test_frozendict_union() -> None:
+    left = FrozenDict(a=1, b=2)
+    right = FrozenDict(b=3, c=4)
+    assert left | right == FrozenDict(a=1, b=3, c=4)
+    assert list(left | right) == ['a', 'b', 'c']
+    assert left == FrozenDict(a=1, b=2)
+    assert right == FrozenDict(b=3, c=4)
+
+
+def test_frozendict_union_with_empty() -> None:
+    value = FrozenDict(a=1)
+    assert value | FrozenDict() is value
+    assert FrozenDict() | value is value
+
+
+def test_frozendict_nested_unions() -> None:
+    left = FrozenDict(a=1) | FrozenDict(b=2)
+    right = FrozenDict(c=3) | FrozenDict(a=4)
+    union = left | right
+    assert union == {'a': 4, 'b': 2, 'c': 3}
+    assert left == {'a': 1, 'b': 2}
+    assert right['a'] == 4
+    assert len(union) == 3
+
+
+def test_frozendict_long_chain_of_unions() -> None:
+    value = FrozenDict()
+    for i in range(100_000):
+        value |= FrozenDict({f'p_{i}': i})
+    assert len(value) == 100_000
+    assert value['p_99999'] == 99_999
+
+
+def test_frozendict_union_hash() -> None:
+    union = FrozenDict(a=1) | FrozenDict(b=2)
+    assert hash(union) == hash(FrozenDict(a=1, b=2))
+    assert hash(union) == hash(union)
+    assert {union: 'value'}[FrozenDict(b=2, a=1)] == 'value'
+
+
+def test_frozendict_pickles_merged_unions() -> None:
+    value = FrozenDict()
+    for i in range(10_000):
+        value |= FrozenDict({f'p_{i}': i})
+    assert pickle.loads(pickle.dumps(value)) == value
+    rendered = A.insert.values(**{f'p_{i}': i for i in range(500)}).build()
+    assert pickle.loads(pickle.dumps(rendered)) == rendered
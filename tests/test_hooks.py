@@ -0,0 +1,105 @@
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.hooks import StageReport, stage_runner, subscribe, unsubscribe
+from edgeql_qb.operators import Alias
+from edgeql_qb.types import int64
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+WithConstraints = EdgeDBModel('WithConstraints')
+
+
+def stages(reports: list[StageReport]) -> list[tuple[str, str, int, int]]:
+    return [(r.query, r.stage, r.length, r.parameters) for r in reports]
+
+
+def test_query_hooks_report_select_stages() -> None:
+    reports: list[StageReport] = []
+    query = (
+        A.select(A.c.p_str)
+        .with_(Alias('x').assign(int64(1)))
+        .where(A.c.p_int64 == Alias('x'))
+        .order_by(A.c.p_str)
+        .offset(1)
+        .limit(2)
+        .hooks(reports.append)
+    )
+    rendered = query.build()
+    assert stages(reports) == [
+        ('SelectQuery', 'with', len('with x := <int64>$with_0 '), 1),
+        ('SelectQuery', 'select', len('select A { p_str }'), 0),
+        ('SelectQuery', 'filters', len(' filter .p_int64 = x'), 0),
+        ('SelectQuery', 'order_by', len(' order by .p_str'), 0),
+        ('SelectQuery', 'offset', len(' offset <int64>$offset_1'), 1),
+        ('SelectQuery', 'limit', len(' limit <int64>$limit_2'), 1),
+        ('SelectQuery', 'query', len(rendered.query), 3),
+    ]
+    assert all(report.elapsed_ns >= 0 for report in reports)
+
+
+def test_query_hooks_report_nested_queries() -> None:
+    reports: list[StageReport] = []
+    Nested1.select().select_from(Nested1.insert.values(name='n1')).hooks(reports.append).build()
+    assert [(r.query, r.stage) for r in reports] == [
+        ('SelectQuery', 'with'),
+        ('SelectQuery', 'select'),
+        ('SelectQuery', 'filters'),
+        ('SelectQuery', 'order_by'),
+        ('SelectQuery', 'offset'),
+        ('SelectQuery', 'limit'),
+        ('SelectQuery', 'query'),
+    ]
+    reports.clear()
+    query = Nested1.select().select_from(Nested1.insert.values(name='n1').hooks(reports.append))
+    query.build()
+    assert [(r.query, r.stage) for r in reports] == [
+        ('InsertQuery', 'with'),
+        ('InsertQuery', 'for'),
+        ('InsertQuery', 'insert'),
+        ('InsertQuery', 'values'),
+        ('InsertQuery', 'unless_conflict'),
+        ('InsertQuery', 'query'),
+    ]
+
+
+def test_global_hooks_report_every_query() -> None:
+    reports: list[StageReport] = []
+    subscribe(reports.append)
+    try:
+        A.count.where(A.c.p_str == 'a').build()
+        A.group(A.c.p_str).using(Alias('s').assign(A.c.p_str)).by(A.c.p_str).build()
+        A.delete.build()
+        A.update.values(p_str='a').build()
+        WithConstraints.insert.values(name='a').unless_conflict().build()
+    finally:
+        unsubscribe(reports.append)
+    assert [(r.query, r.stage) for r in reports if r.stage != 'query'] == [
+        ('CountQuery', 'count'),
+        ('GroupQuery', 'with'),
+        ('GroupQuery', 'group'),
+        ('GroupQuery', 'using'),
+        ('GroupQuery', 'by'),
+        ('DeleteQuery', 'with'),
+        ('DeleteQuery', 'delete'),
+        ('DeleteQuery', 'filters'),
+        ('DeleteQuery', 'order_by'),
+        ('DeleteQuery', 'offset'),
+        ('DeleteQuery', 'limit'),
+        ('UpdateQuery', 'with'),
+        ('UpdateQuery', 'for'),
+        ('UpdateQuery', 'update'),
+        ('UpdateQuery', 'filters'),
+        ('UpdateQuery', 'values'),
+        ('InsertQuery', 'with'),
+        ('InsertQuery', 'for'),
+        ('InsertQuery', 'insert'),
+        ('InsertQuery', 'values'),
+        ('InsertQuery', 'unless_conflict'),
+    ]
+    A.delete.build()
+    assert len(reports) == 26
+
+
+def test_hooks_are_not_measured_without_subscribers() -> None:
+    run = stage_runner('SelectQuery', ())
+    assert run('query', A.select().build).query == 'select A'
+    assert A.select().hooks(print) == A.select()
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+DEFERRED = (
+    'asyncio',
+    'edgeql_qb.catalog',
+    'edgeql_qb.render.select',
+    'edgeql_qb.render.structure',
+)
+
+
+def imported_after(code: str) -> list[str]:
+    """Deferred modules imported by the code in a fresh interpreter."""
+    check = f'{code}; import sys; print(*(m for m in {DEFERRED!r} if m in sys.modules))'
+    result = subprocess.run(
+        [sys.executable, '-c', check],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+def test_import_defers_renderers_and_catalogs() -> None:
+    assert imported_after('import edgeql_qb') == []
+
+
+def test_renderers_are_imported_on_build() -> None:
+    code = 'from edgeql_qb import EdgeDBModel; EdgeDBModel("A").select().build()'
+    assert imported_after(code) == ['edgeql_qb.render.select', 'edgeql_qb.render.structure']
+
+
+def test_shapes_are_rendered_without_queries() -> None:
+    code = (
+        'from edgeql_qb.expression import Column; '
+        'from edgeql_qb.render.expression import Clause, render_expression; '
+        'render_expression(Column("a")(Column("b")), Clause("select"), iter([]))'
+    )
+    assert 'edgeql_qb.render.select' not in imported_after(code)
+
+
+def test_catalogs_are_imported_on_use() -> None:
+    assert imported_after('from edgeql_qb.func import std') == ['edgeql_qb.catalog']
@@ -0,0 +1,168 @@
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from edgeql_qb.codegen.esdl import Member, Pointer, parse_esdl
+from edgeql_qb.codegen.models import generate_models
+from edgeql_qb.codegen.models.__main__ import main
+from edgeql_qb.frozendict import FrozenDict
+
+SCHEMA = Path(__file__).parent / 'dbschema' / 'default.esdl'
+
+
+def generated_models() -> Any:
+    module = ModuleType('models')
+    exec(generate_models(parse_esdl(SCHEMA.read_text()), [str(SCHEMA)]), vars(module))
+    return module
+
+
+models = generated_models()
+A, Nested1 = models.A, models.Nested1
+
+
+def test_parse_esdl() -> None:
+    schema = parse_esdl(SCHEMA.read_text())
+    assert list(schema.types) == [
+        'default::A',
+        'default::Nested3',
+        'default::Nested2',
+        'default::WithConstraints',
+        'default::Nested1',
+    ]
+    assert schema.types['default::WithConstraints'].pointers == (
+        Pointer('name', 'str', 'property'),
+        Pointer('composite1', 'str', 'property'),
+        Pointer('composite2', 'str', 'property'),
+    )
+    assert schema.members('default::Nested2') == {
+        'id': Member('id', 'uuid', is_link=False),
+        'name': Member('name', 'str', is_link=False),
+        'nested3': Member('nested3', 'default::Nested3', is_link=True),
+    }
+
+
+def test_parse_esdl_syntax() -> None:
+    schema = parse_esdl("""
+        module app {
+            # types may be declared before they are referred to
+            abstract type Named {
+                required name: str {
+                    constraint exclusive;
+                };
+                annotation title := 'named {thing}';
+            }
+            type User extending Named {
+                multi friends: User;
+                property tags -> array<str>;
+                link best_friend := (select .friends limit 1);
+                required property `order` -> tuple<int64, str>;
+                index on (.name);
+            }
+            function greet(user: User) -> str using ('Hi, ' ++ user.name);
+        }
+        module other {
+            type Post {
+                required author: app::User;
+                body: default::Text;
+            }
+        }
+    """)
+    assert schema.types['app::Named'].abstract
+    assert schema.members('app::User') == {
+        'id': Member('id', 'uuid', is_link=False),
+        'name': Member('name', 'str', is_link=False),
+        'friends': Member('friends', 'app::User', is_link=True),
+        'tags': Member('tags', 'array<str>', is_link=False),
+        'best_friend': Member('best_friend', None, is_link=False),
+        'order': Member('order', 'tuple<int64, str>', is_link=False),
+    }
+    assert schema.members('other::Post') == {
+        'id': Member('id', 'uuid', is_link=False),
+        'author': Member('author', 'app::User', is_link=True),
+        'body': Member('body', 'default::Text', is_link=False),
+    }
+
+
+def test_generated_models() -> None:
+    nested3 = Nested1.c.nested2.nested3
+    assert nested3 is Nested1.c.nested2.nested3
+    assert Nested1.c.name is Nested1.c.name
+    rendered = Nested1.select(
+        Nested1.c.name,
+        Nested1.c.nested2(Nested1.c.nested2.name, nested3(nested3.name)),
+    ).where(nested3.name == 'x').build()
+    assert rendered.query == (
+        'select Nested1 { name, nested2: { name, nested3: { name } } } '
+        'filter .nested2.nested3.name = <str>$filter_0'
+    )
+    rendered = A.select().where((A.c.p_int16 == 1) & (A.c.p_float32 > 1.5)).build()
+    assert rendered.query == (
+        'select A filter .p_int16 = <int16>$filter_0 and .p_float32 > <float32>$filter_1'
+    )
+    assert rendered.context == FrozenDict(filter_0=1, filter_1=1.5)
+    rendered = A.select().where(A.c.p_int16.in_([1, 2])).build()
+    assert rendered.query == 'select A filter .p_int16 in array_unpack(<array<int16>>$filter_0)'
+    assert rendered.context == FrozenDict(filter_0=(1, 2))
+    rendered = A.update.values(p_int32=A.c.p_int32 + 1).build()
+    assert rendered.query == 'update A set { p_int32 := .p_int32 + <int32>$update_0 }'
+    rendered = A.insert.values(p_bigint=1, p_str='a').build()
+    assert rendered.query == 'insert A { p_bigint := <bigint>$insert_0, p_str := <str>$insert_1 }'
+    rendered = A.update.values_many([{'id': 'a', 'p_int16': 1}], key='id').build()
+    assert "p_int16 := <int16>item['p_int16']" in rendered.query
+
+
+def test_generated_models_of_other_modules() -> None:
+    schema = parse_esdl("""
+        module default {
+            type User {
+                required name: str;
+            }
+        }
+        module app::blog {
+            type Post {
+                required author: default::User;
+                title: str;
+            }
+        }
+    """)
+    module = ModuleType('models')
+    exec(generate_models(schema, ['blog.esdl']), vars(module))
+    assert module.AppBlogPost.c.author.__class__ is module.UserLink
+    rendered = module.AppBlogPost.select(
+        module.AppBlogPost.c.title,
+    ).where(module.AppBlogPost.c.author.name == 'x').build()
+    assert rendered.query == (
+        'with module app::blog select Post { title } filter .author.name = <str>$filter_0'
+    )
+
+
+def test_generated_models_are_typo_proof() -> None:
+    with pytest.raises(AttributeError):
+        Nested1.c.nmae
+    with pytest.raises(AttributeError, match='Nested2Link has no property or link'):
+        Nested1.c.nested2.nmae
+    with pytest.raises(AttributeError):
+        A.insert.values(p_strr='a')
+
+
+def test_generated_models_query_database(client: Any) -> None:
+    insert = A.insert.values(p_int16=1, p_float32=1.5).build()
+    client.query(insert.query, **insert.context)
+    rendered = A.select(A.c.p_int16).where(A.c.p_int16 == 1).build()
+    result = client.query(rendered.query, **rendered.context)
+    assert [row.p_int16 for row in result] == [1]
+
+
+def test_models_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    output = tmp_path / 'models.py'
+    monkeypatch.setattr(sys, 'argv', ['models', str(SCHEMA), '-o', str(output), '--check'])
+    assert main() == 1
+    assert not output.exists()
+    monkeypatch.setattr(sys, 'argv', ['models', str(SCHEMA), '-o', str(output)])
+    assert main() == 0
+    assert 'class Nested1Model(EdgeDBModel):\n' in output.read_text()
+    monkeypatch.setattr(sys, 'argv', ['models', str(SCHEMA), '-o', str(output), '--check'])
+    assert main() == 0
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from edgedb.blocking_client import Client
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.cache import BuildCache
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.operators import Alias
+from edgeql_qb.queries import multiplex
+from edgeql_qb.types import int16
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+
+
+def test_multiplex_reads(client: Client) -> None:
+    for num in range(1, 4):
+        insert = A.insert.values(p_int16=int16(num), p_str=f'{num}').build()
+        client.query(insert.query, **insert.context)
+    query = multiplex(
+        first=A.select(A.c.p_int16).order_by(A.c.p_int16).limit1,
+        strings=(
+            A.select(A.c.p_str)
+            .with_(Alias('x').assign(int16(1)))
+            .where(A.c.p_int16 > Alias('x'))
+            .order_by(A.c.p_str)
+        ),
+        total=A.count.where(A.c.p_int16 > int16(1)),
+    )
+    rendered = query.build()
+    assert rendered.query == (
+        'select { '
+        'first := (select A { p_int16 } order by .p_int16 limit 1), '
+        'strings := (with x := <int16>$with_0 select A { p_str } '
+        'filter .p_int16 > x order by .p_str), '
+        'total := (select count((select A filter .p_int16 > <int16>$filter_1))) '
+        '}'
+    )
+    assert rendered.context == FrozenDict(with_0=1, filter_1=1)
+    result = query.split(client.query_single(rendered.query, **rendered.context))
+    assert result['first'].p_int16 == 1
+    assert [row.p_str for row in result['strings']] == ['2', '3']
+    assert result['total'] == 2
+
+
+def test_multiplex_binds_mutations(client: Client) -> None:
+    query = multiplex(
+        created=Nested1.insert.values(name='n1'),
+        renamed=A.update.where(A.c.p_str == 'a').values(p_str='b'),
+        removed=A.delete.where(A.c.p_str == 'c'),
+        names=Nested1.select(Nested1.c.name),
+    )
+    rendered = query.build()
+    assert rendered.query == (
+        'with created := (insert Nested1 { name := <str>$insert_0 }), '
+        'renamed := (update A filter .p_str = <str>$filter_1 set { p_str := <str>$update_2 }), '
+        'removed := (delete A filter .p_str = <str>$filter_3) '
+        'select { '
+        'created := created, '
+        'renamed := renamed, '
+        'removed := removed, '
+        'names := (select Nested1 { name }) '
+        '}'
+    )
+    assert rendered.context == FrozenDict(insert_0='n1', filter_1='a', update_2='b', filter_3='c')
+    result = query.split(client.query_single(rendered.query, **rendered.context))
+    assert result['renamed'] == result['removed'] == []
+
+
+def test_multiplex_structure_follows_parameters() -> None:
+    def query(name: str, limit: int) -> Any:
+        return multiplex(
+            names=Nested1.select(Nested1.c.name).limit(limit),
+            created=Nested1.insert.values(name=name),
+        )
+
+    cache = BuildCache()
+    cache.build(query('a', 1))
+    rendered = cache.build(query('b', 2))
+    assert cache.hits == 1
+    assert rendered == query('b', 2).build()
+    assert query('b', 2).value_vector() == ('b', 2)
+    assert query('a', 1).fingerprint() == query('b', 2).fingerprint()
+
+
+def test_multiplex_fetch_splits_result() -> None:
+    class FakeClient:
+        async def query_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+            return SimpleNamespace(names=['n'], total=1)
+
+    query = multiplex(names=Nested1.select(Nested1.c.name), total=Nested1.count)
+    result = asyncio.run(query.fetch(FakeClient()))  # type: ignore[arg-type]
+    assert result == {'names': ['n'], 'total': 1}
+
+
+def test_multiplex_fetch_round_trip(client: Client) -> None:
+    class AsyncClient:
+        async def query_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+            return client.query_single(query, *args, **kwargs)
+
+    insert = Nested1.insert.values(name='n1').build()
+    client.query(insert.query, **insert.context)
+    query = multiplex(
+        created=Nested1.insert.values(name='n2'),
+        names=Nested1.select(Nested1.c.name).where(Nested1.c.name == 'n1'),
+        total=Nested1.count.where(Nested1.c.name == 'n1'),
+    )
+    result = asyncio.run(query.fetch(AsyncClient()))  # type: ignore[arg-type]
+    assert set(result) == {'created', 'names', 'total'}
+    assert [row.name for row in result['names']] == ['n1']
+    assert result['total'] == 1
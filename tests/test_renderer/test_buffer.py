@@ -0,0 +1,25 @@
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.render.buffer import RenderBuffer
+from edgeql_qb.render.tools import join_many_renderers
+from edgeql_qb.render.types import RenderedQuery
+
+
+def test_buffer_materialize() -> None:
+    buffer = RenderBuffer()
+    buffer.write('select A')
+    buffer.append(RenderedQuery(' filter .a = <str>$filter_0', FrozenDict(filter_0='a')))
+    buffer.extend(
+        [
+            RenderedQuery(' limit '),
+            RenderedQuery('<int64>$limit_1', FrozenDict(limit_1=1)),
+        ],
+    )
+    rendered = buffer.materialize()
+    assert rendered.query == 'select A filter .a = <str>$filter_0 limit <int64>$limit_1'
+    assert rendered.context == FrozenDict(filter_0='a', limit_1=1)
+
+
+def test_join_many_renderers() -> None:
+    renderers = [RenderedQuery(f'.p_{i}') for i in range(3)]
+    assert join_many_renderers(', ', renderers) == RenderedQuery('.p_0, .p_1, .p_2')
+    assert join_many_renderers(', ', []) == RenderedQuery()
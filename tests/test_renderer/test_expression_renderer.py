@@ -0,0 +1,62 @@
+from itertools import count
+
+from edgedb.blocking_client import Client
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.expression import Column, Expression
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.func import std
+from edgeql_qb.operators import Alias
+from edgeql_qb.render.condition import FILTER_CLAUSE
+from edgeql_qb.render.expression import Clause, render_expression
+from edgeql_qb.render.insert import INSERT_CLAUSE
+from edgeql_qb.render.types import RenderedQuery
+from edgeql_qb.types import int64
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+
+
+class SubColumn(Column):
+    pass
+
+
+def test_clause_column_rules() -> None:
+    column = Nested1.c.nested2.name
+    expression = Expression(column + int64(1)).to_infix_notation()
+    assert render_expression(expression, FILTER_CLAUSE, count()) == RenderedQuery(
+        '.nested2.name + <int64>$filter_0',
+        FrozenDict(filter_0=1),
+    )
+    assert render_expression(expression, INSERT_CLAUSE, count()) == RenderedQuery(
+        'name + <int64>$insert_0',
+        FrozenDict(insert_0=1),
+    )
+    assert render_expression(column, Clause('select'), count()).query == 'name'
+
+
+def test_handler_resolved_for_subclasses() -> None:
+    assert render_expression(SubColumn('name'), FILTER_CLAUSE, count()).query == '.name'
+
+
+def test_subquery_in_filter(client: Client) -> None:
+    rendered = (
+        A.select()
+        .where(A.c.p_str.in_(Nested1.select(Nested1.c.name).where(Nested1.c.name != 'n')))
+        .build()
+    )
+    assert rendered.query == (
+        'select A filter .p_str in (select Nested1 { name } filter .name != <str>$filter_0)'
+    )
+    assert rendered.context == FrozenDict(filter_0='n')
+    client.query(rendered.query, **rendered.context)
+
+
+def test_unary_operation_in_insert(client: Client) -> None:
+    flag = Alias('flag').assign(std.contains('abc', 'a'))
+    rendered = A.insert.with_(flag).values(p_bool=~flag.left).build()
+    assert rendered.query == (
+        'with flag := contains(<str>$with_0, <str>$with_1) insert A { p_bool := not flag }'
+    )
+    assert rendered.context == FrozenDict(with_0='abc', with_1='a')
+    client.query(rendered.query, **rendered.context)
@@ -1,3 +1,7 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
 from edgedb.blocking_client import Client
 
 from edgeql_qb import EdgeDBModel
@@ -186,3 +190,145 @@ def test_conditional_insert_with_query(client: Client) -> None:
     )
     result = client.query(rendered.query, **rendered.context)
     assert len(result) == 1
+
+
+def test_insert_many(client: Client) -> None:
+    rows = [
+        {
+            'p_str': f'row {i}',
+            'p_int16': int16(i),
+            'p_datetime': datetime(2000, 1, 1, i, tzinfo=timezone.utc),
+            'p_duration': timedelta(hours=i),
+            'p_decimal': Decimal(f'{i}.5'),
+        }
+        for i in range(3)
+    ]
+    rows[2]['p_decimal'] = None
+    rendered = A.insert.values_many(rows).build()
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union (insert A { '
+        "p_str := <str>item['p_str'], "
+        "p_int16 := <int16>item['p_int16'], "
+        "p_datetime := <datetime><str>item['p_datetime'], "
+        "p_duration := <duration><str>item['p_duration'], "
+        "p_decimal := <decimal><str>item['p_decimal'] "
+        '})'
+    )
+    assert rendered.context == FrozenDict(rows_0=(
+        '[{"p_str":"row 0","p_int16":0,"p_datetime":"2000-01-01T00:00:00+00:00",'
+        '"p_duration":"0 microseconds","p_decimal":"0.5"},'
+        '{"p_str":"row 1","p_int16":1,"p_datetime":"2000-01-01T01:00:00+00:00",'
+        '"p_duration":"3600000000 microseconds","p_decimal":"1.5"},'
+        '{"p_str":"row 2","p_int16":2,"p_datetime":"2000-01-01T02:00:00+00:00",'
+        '"p_duration":"7200000000 microseconds","p_decimal":null}]'
+    ))
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 3
+    select = A.select(A.c.p_int16, A.c.p_decimal).order_by(A.c.p_int16).build()
+    inserted = client.query(select.query, **select.context)
+    assert [(a.p_int16, a.p_decimal) for a in inserted] == [
+        (0, Decimal('0.5')),
+        (1, Decimal('1.5')),
+        (2, None),
+    ]
+
+
+def test_insert_many_numbers(client: Client) -> None:
+    rows = [
+        {'p_int64': 1, 'p_float64': 1.5, 'p_bool': True},
+        {'p_int64': 2, 'p_float64': 2.5, 'p_bool': False},
+    ]
+    rendered = A.insert.values_many(rows).build()
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union (insert A { '
+        "p_int64 := <int64>item['p_int64'], "
+        "p_float64 := <float64>item['p_float64'], "
+        "p_bool := <bool>item['p_bool'] "
+        '})'
+    )
+    client.query(rendered.query, **rendered.context)
+    select = A.select(A.c.p_int64, A.c.p_float64).order_by(A.c.p_int64).build()
+    inserted = client.query(select.query, **select.context)
+    assert [(a.p_int64, a.p_float64) for a in inserted] == [(1, 1.5), (2, 2.5)]
+
+
+def test_insert_many_unknown_type() -> None:
+    with pytest.raises(TypeError, match=r'Unknown type of \[\], wrap it into a type holder'):
+        A.insert.values_many([{'p_str': []}])
+
+
+def test_insert_many_with_unless_conflict(client: Client) -> None:
+    existing = WithConstraints.insert.values(name='first').build()
+    client.query(existing.query, **existing.context)
+    rendered = (
+        WithConstraints
+        .insert
+        .values_many([{'name': 'first'}, {'name': 'second'}])
+        .unless_conflict(on=WithConstraints.c.name)
+        .build()
+    )
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union '
+        "(insert WithConstraints { name := <str>item['name'] } unless conflict on .name)"
+    )
+    assert rendered.context == FrozenDict(rows_0='[{"name":"first"},{"name":"second"}]')
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 1
+
+
+def test_insert_many_chunked(client: Client) -> None:
+    rows = [{'p_str': 'x' * i} for i in range(10)]
+    chunks = [query.build() for query in A.insert.values_many(rows).chunked(max_rows=4)]
+    assert [len(chunk.context['rows_0']) for chunk in chunks] == [59, 75, 44]
+    chunks = [query.build() for query in A.insert.values_many(rows).chunked(max_bytes=64)]
+    assert [len(chunk.context['rows_0']) for chunk in chunks] == [59, 55, 64]
+    assert all(chunk.query == chunks[0].query for chunk in chunks)
+    for chunk in chunks:
+        client.query(chunk.query, **chunk.context)
+    inserted = client.query(A.select(A.c.p_str).build().query)
+    assert len(inserted) == len(rows)
+
+
+def test_upsert_many_on_composite_constraint(client: Client) -> None:
+    existing = WithConstraints.insert.values(name='old', composite1='a', composite2='b').build()
+    client.query(existing.query, **existing.context)
+    rows = [
+        {'name': 'new', 'composite1': 'a', 'composite2': 'b'},
+        {'name': 'other', 'composite1': 'a', 'composite2': 'c'},
+    ]
+    on = (WithConstraints.c.composite1, WithConstraints.c.composite2)
+    rendered = WithConstraints.insert.upsert_many(rows, on=on).build()
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union (insert WithConstraints { '
+        "name := <str>item['name'], "
+        "composite1 := <str>item['composite1'], "
+        "composite2 := <str>item['composite2'] } "
+        'unless conflict on (.composite1, .composite2) '
+        "else (update WithConstraints set { name := <str>item['name'] }))"
+    )
+    assert rendered.context == FrozenDict(rows_0=(
+        '[{"name":"new","composite1":"a","composite2":"b"},'
+        '{"name":"other","composite1":"a","composite2":"c"}]'
+    ))
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 2
+    select = WithConstraints.select(WithConstraints.c.name).order_by(WithConstraints.c.name)
+    assert [obj.name for obj in client.query(select.build().query)] == ['new', 'other']
+
+
+def test_upsert_many_fields(client: Client) -> None:
+    rows = [{'name': 'first', 'composite1': 'a'}]
+    rendered = WithConstraints.insert.upsert_many(rows, on=WithConstraints.c.name).build()
+    assert rendered.query.endswith(
+        "unless conflict on .name else (update WithConstraints set { "
+        "composite1 := <str>item['composite1'] }))",
+    )
+    rendered = (
+        WithConstraints
+        .insert
+        .upsert_many(rows, on=WithConstraints.c.name, update=())
+        .build()
+    )
+    assert rendered.query.endswith('unless conflict on .name else WithConstraints)')
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 1
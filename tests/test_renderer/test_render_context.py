@@ -0,0 +1,168 @@
+from uuid import UUID
+
+from edgedb.blocking_client import Client
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.func import std
+from edgeql_qb.operators import Alias
+from edgeql_qb.queries import SelectQuery
+from edgeql_qb.render.context import RenderContext
+from edgeql_qb.types import int16, int64
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+Nested2 = EdgeDBModel('Nested2')
+Nested3 = EdgeDBModel('Nested3')
+
+
+def test_context_counts_parameters_like_an_iterator() -> None:
+    context = RenderContext()
+    assert iter(context) is context
+    assert list(zip('ab', context)) == [('a', 0), ('b', 1)]
+    assert next(context) == 2
+
+
+def test_dedup_binds_equal_values_to_single_parameter(client: Client) -> None:
+    name = Alias('name')
+    query = (
+        Nested1.select(
+            Nested1.c.name,
+            Nested1.c.nested2(Nested1.c.nested2.name).where(Nested2.c.name == 'n'),
+        )
+        .with_(name.assign(std.str_lower('n')))
+        .where((Nested1.c.name == 'n') | (Nested1.c.name == name))
+        .limit(1)
+    )
+    rendered = query.build(RenderContext(dedup=True))
+    assert rendered.query == (
+        'with name := str_lower(<str>$with_0) '
+        'select Nested1 { name, nested2: { name } filter .name = <str>$with_0 } '
+        'filter .name = <str>$with_0 or .name = name '
+        'limit <int64>$limit_1'
+    )
+    assert rendered.context == FrozenDict(with_0='n', limit_1=1)
+    result = client.query(rendered.query, **rendered.context)
+    assert result == []
+
+
+def test_dedup_keeps_values_of_different_types_apart() -> None:
+    query = (
+        A.select()
+        .where(A.c.p_int16 == int16(1))
+        .where(A.c.p_int64 == int64(1))
+        .where(A.c.p_int64 == int64(1))
+        .where(A.c.p_str.in_([1]))
+        .offset(1)
+    )
+    rendered = query.build(RenderContext(dedup=True))
+    assert rendered.query == (
+        'select A '
+        'filter .p_int16 = <int16>$filter_0 '
+        'and .p_int64 = <int64>$filter_1 '
+        'and .p_int64 = <int64>$filter_1 '
+        'and .p_str in array_unpack(<array<int64>>$filter_2) '
+        'offset <int64>$filter_1'
+    )
+    assert rendered.context == FrozenDict(filter_0=1, filter_1=1, filter_2=(1,))
+    assert query.build(RenderContext()).query == query.build().query
+
+
+def test_canonical_text_of_equivalent_queries() -> None:
+    first = (
+        A.update
+        .values(p_str='a', p_int16=int16(1))
+        .where(A.c.p_int64 > int64(1))
+        .where((A.c.p_str == 'b') & ~A.c.p_bool)
+    )
+    second = (
+        A.update
+        .where(~A.c.p_bool & (A.c.p_int64 > int64(1)))
+        .values(p_int16=int16(1), p_str='a')
+        .where(A.c.p_str == 'b')
+    )
+    assert first.build().query != second.build().query
+    rendered = first.build(RenderContext(canonical=True))
+    assert rendered == second.build(RenderContext(canonical=True))
+    assert rendered.query == (
+        'update A '
+        'filter .p_str = <str>$filter_0 and .p_int64 > <int64>$filter_1 and not .p_bool '
+        'set { p_int16 := <int16>$update_2, p_str := <str>$update_3 }'
+    )
+    assert rendered.context == FrozenDict(filter_0='b', filter_1=1, update_2=1, update_3='a')
+
+
+def test_canonical_text_keeps_precedence_of_conditions() -> None:
+    query = A.select().where((A.c.p_int64 == int64(1)) | (A.c.p_int64 == int64(2)) & A.c.p_bool)
+    assert query.build(RenderContext(canonical=True)).query == (
+        'select A filter .p_int64 = <int64>$filter_0 '
+        'or .p_int64 = <int64>$filter_1 and .p_bool'
+    )
+    query = query.where(A.c.p_str == 'a')
+    assert query.build(RenderContext(canonical=True)).query == (
+        'select A filter .p_str = <str>$filter_0 and '
+        '(.p_int64 = <int64>$filter_1 or .p_int64 = <int64>$filter_2 and .p_bool)'
+    )
+
+
+def test_hoist_binds_repeated_subqueries_once(client: Client) -> None:
+    def names(name: str) -> SelectQuery:
+        return Nested2.select(Nested2.c.name).where(Nested2.c.name == name)
+
+    query = (
+        Nested1.select(Nested1.c.name, first=names('n2'), second=names('n2'))
+        .where(Nested1.c.nested2.in_(names('n2')))
+        .where(Nested1.c.nested2.in_(names('other')))
+    )
+    rendered = query.build(RenderContext(hoist=True))
+    assert rendered.query == (
+        'with _subquery_0 := (select Nested2 { name } filter .name = <str>$filter_0) '
+        'select Nested1 { name, first := (_subquery_0), second := (_subquery_0) } '
+        'filter .nested2 in (_subquery_0) '
+        'and .nested2 in (select Nested2 { name } filter .name = <str>$filter_1)'
+    )
+    assert rendered.context == FrozenDict(filter_0='n2', filter_1='other')
+    result = client.query(rendered.query, **rendered.context)
+    assert result == []
+
+
+def test_hoist_orders_nested_bindings() -> None:
+    nested3 = Nested3.select().where(Nested3.c.name == 'n3')
+    query = Nested1.select(
+        first=Nested2.select(a=nested3, b=nested3).limit1,
+        second=Nested2.select(a=nested3, b=nested3).limit1,
+    )
+    assert query.build(RenderContext(hoist=True)).query == (
+        'with _subquery_0 := (select Nested3 filter .name = <str>$filter_0), '
+        '_subquery_1 := (select Nested2 { a := (_subquery_0), b := (_subquery_0) } limit 1) '
+        'select Nested1 { first := (_subquery_1), second := (_subquery_1) }'
+    )
+
+
+def test_hoist_keeps_subqueries_of_bulk_queries_in_place() -> None:
+    nested2 = Nested2.select(Nested2.c.name).where(Nested2.c.name == 'n2')
+    query = (
+        A.update
+        .where(A.c.p_str.in_(nested2))
+        .where(A.c.p_str != nested2.limit1)
+        .values_many([{'id': UUID(int=1), 'p_str': 'a'}])
+    )
+    rendered = query.build(RenderContext(hoist=True))
+    assert rendered == query.build()
+    assert rendered.query.startswith('for item in json_array_unpack(<json>$rows_0) union (')
+
+
+def test_hoist_keeps_with_aliases_and_mutations_in_place() -> None:
+    nested2 = Nested2.select().where(Nested2.c.name == 'n2')
+    query = (
+        Nested1.select(first=nested2)
+        .with_(Alias('x').assign(nested2))
+        .select_from(Nested1.insert.values(name='n1'))
+    )
+    rendered = query.build(RenderContext(hoist=True))
+    assert rendered.query == (
+        'with x := (select Nested2 filter .name = <str>$filter_0) '
+        'select (insert Nested1 { name := <str>$insert_1 }) '
+        '{ first := (select Nested2 filter .name = <str>$filter_2) }'
+    )
+    assert query.build(RenderContext()).query == query.build().query
@@ -8,7 +8,7 @@ from edgeql_qb import EdgeDBModel
 from edgeql_qb.frozendict import FrozenDict
 from edgeql_qb.func import FuncInvocation, std
 from edgeql_qb.operators import BinaryOp
-from edgeql_qb.types import int32, int64, unsafe_text
+from edgeql_qb.types import array, int32, int64, unsafe_text
 
 A = EdgeDBModel('A')
 Nested1 = EdgeDBModel('Nested1')
@@ -44,6 +44,26 @@ Nested3 = EdgeDBModel('Nested3')
             'datetime_current() > <datetime>$filter_0',
             {'filter_0': datetime(2000, 1, 1, tzinfo=timezone.utc)},
         ),
+        (
+            A.c.p_int64.in_([11, 12]),
+            '.p_int64 in array_unpack(<array<int64>>$filter_0)',
+            {'filter_0': (11, 12)},
+        ),
+        (
+            A.c.p_int32.in_((int32(1),)),
+            '.p_int32 in array_unpack(<array<int32>>$filter_0)',
+            {'filter_0': (1,)},
+        ),
+        (
+            A.c.p_str.not_in({'Bye'}),
+            '.p_str not in array_unpack(<array<str>>$filter_0)',
+            {'filter_0': ('Bye',)},
+        ),
+        (
+            A.c.p_str.not_in(()),
+            '.p_str not in {}',
+            {},
+        ),
     ),
 )
 def test_complex_filter_with_literal(
@@ -112,3 +132,55 @@ def test_shape_filter_enumeration(client: Client) -> None:
         filter_1='n3',
         filter_2='n1',
     )
+
+
+def test_filter_in_list_text_does_not_depend_on_length(client: Client) -> None:
+    insert = A.insert.values(p_int64=int64(3)).build()
+    client.query(insert.query, **insert.context)
+    queries = {
+        A.select(A.c.p_int64).where(A.c.p_int64.in_(list(range(size)))).build().query
+        for size in (1, 10, 5000)
+    }
+    assert queries == {
+        'select A { p_int64 } filter .p_int64 in array_unpack(<array<int64>>$filter_0)',
+    }
+    rendered = A.select(A.c.p_int64).where(A.c.p_int64.in_(list(range(5000)))).build()
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 1
+    rendered = (
+        A.select(A.c.p_int64)
+        .where(A.c.p_int64.in_(std.array_unpack(array(int64, []))))
+        .build()
+    )
+    assert rendered.query == (
+        'select A { p_int64 } filter .p_int64 in array_unpack(<array<int64>>$filter_0)'
+    )
+    assert rendered.context == FrozenDict(filter_0=())
+    assert client.query(rendered.query, **rendered.context) == []
+
+
+def test_filters_joined_with_or(client: Client) -> None:
+    insert = A.insert.values(p_int64=int64(1), p_str='a').build()
+    client.query(insert.query, **insert.context)
+    rendered = (
+        A.select(A.c.p_int64)
+        .where((A.c.p_int64 == int64(1)) | (A.c.p_int64 == int64(2)))
+        .where(A.c.p_str == 'b')
+        .build()
+    )
+    assert rendered.query == (
+        'select A { p_int64 } '
+        'filter (.p_int64 = <int64>$filter_0 or .p_int64 = <int64>$filter_1) '
+        'and .p_str = <str>$filter_2'
+    )
+    assert rendered.context == FrozenDict(filter_0=1, filter_1=2, filter_2='b')
+    assert client.query(rendered.query, **rendered.context) == []
+
+
+def test_filter_in_empty_collection(client: Client) -> None:
+    insert = A.insert.values(p_int64=int64(3)).build()
+    client.query(insert.query, **insert.context)
+    rendered = A.select(A.c.p_int64).where(A.c.p_int64.in_([])).build()
+    assert rendered.query == 'select A { p_int64 } filter .p_int64 in {}'
+    assert rendered.context == FrozenDict()
+    assert client.query(rendered.query, **rendered.context) == []
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from edgedb.blocking_client import Client
+
+from edgeql_qb import EdgeDBModel
+from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.func import std
+from edgeql_qb.keyset import Cursor
+from edgeql_qb.types import int16
+
+A = EdgeDBModel('A')
+Nested1 = EdgeDBModel('Nested1')
+
+
+def test_keyset_pages(client: Client) -> None:
+    for num in range(1, 6):
+        insert = A.insert.values(p_int16=int16(num % 2), p_str=f'{num}').build()
+        client.query(insert.query, **insert.context)
+    query = A.select(A.c.p_int16, A.c.p_str).order_by(A.c.p_int16.desc(), A.c.p_str).limit(2)
+    pages = []
+    rendered = query.build()
+    page = client.query(rendered.query, **rendered.context)
+    while page:
+        pages.append([(row.p_int16, row.p_str) for row in page])
+        rendered = query.after(query.cursor(page[-1])).build()
+        page = client.query(rendered.query, **rendered.context)
+    assert pages == [[(1, '1'), (1, '3')], [(1, '5'), (0, '2')], [(0, '4')]]
+
+
+def test_keyset_after_renders_seek_predicate() -> None:
+    query = (
+        A.select(A.c.p_str)
+        .where(A.c.p_bool == True)  # noqa: E712
+        .order_by(A.c.p_str.desc(), A.c.id)
+        .limit(10)
+    )
+    uuid = UUID(int=5)
+    rendered = query.after(query.cursor({'p_str': 'x', 'id': uuid})).build()
+    assert rendered.query == (
+        'select A { p_str } filter .p_bool = <bool>$filter_0 '
+        'and (.p_str < <str>$filter_1 or .p_str = <str>$filter_2 and .id > <uuid>$filter_3) '
+        'order by .p_str desc then .id limit <int64>$limit_4'
+    )
+    assert rendered.context == FrozenDict(
+        filter_0=True,
+        filter_1='x',
+        filter_2='x',
+        filter_3=uuid,
+        limit_4=10,
+    )
+
+
+def test_keyset_before_flips_comparisons() -> None:
+    query = A.select().order_by(A.c.p_int64, A.c.p_str.desc(), A.c.id.asc())
+    cursor = Cursor(('p_int64 asc', 'p_str desc', 'id asc'), (1, 'a', UUID(int=1)))
+    rendered = query.before(cursor).build()
+    assert rendered.query == (
+        'select A filter .p_int64 < <int64>$filter_0 or .p_int64 = <int64>$filter_1 '
+        'and (.p_str > <str>$filter_2 or .p_str = <str>$filter_3 and .id < <uuid>$filter_4) '
+        'order by .p_int64 desc then .p_str asc then .id desc'
+    )
+
+
+def test_keyset_before_takes_nearest_rows() -> None:
+    query = A.select(A.c.p_str).order_by(A.c.p_str).limit(2)
+    rendered = query.before(query.cursor({'p_str': 'x'})).build()
+    assert rendered.query == (
+        'select A { p_str } filter .p_str < <str>$filter_0 '
+        'order by .p_str desc limit <int64>$limit_1'
+    )
+
+
+def test_keyset_pages_backwards(client: Client) -> None:
+    for num in range(1, 6):
+        insert = A.insert.values(p_int16=int16(num % 2), p_str=f'{num}').build()
+        client.query(insert.query, **insert.context)
+    query = A.select(A.c.p_int16, A.c.p_str).order_by(A.c.p_int16.desc(), A.c.p_str).limit(2)
+    pages = []
+    rendered = query.before(query.cursor({'p_int16': 0, 'p_str': '4'})).build()
+    page = client.query(rendered.query, **rendered.context)
+    while page:
+        pages.append([(row.p_int16, row.p_str) for row in reversed(page)])
+        rendered = query.before(query.cursor(page[-1])).build()
+        page = client.query(rendered.query, **rendered.context)
+    assert pages == [[(1, '5'), (0, '2')], [(1, '1'), (1, '3')]]
+
+
+def test_keyset_numbers_are_cast() -> None:
+    query = A.select().order_by(A.c.p_float64.desc(), A.c.p_int16)
+    rendered = query.after(query.cursor({'p_float64': 1.5, 'p_int16': 2})).build()
+    assert rendered.query == (
+        'select A filter .p_float64 < <float64>$filter_0 '
+        'or .p_float64 = <float64>$filter_1 and .p_int16 > <int64>$filter_2 '
+        'order by .p_float64 desc then .p_int16'
+    )
+    assert rendered.context == FrozenDict(filter_0=1.5, filter_1=1.5, filter_2=2)
+
+
+def test_keyset_cursor_rejects_empty_keys() -> None:
+    query = A.select().order_by(A.c.p_str, A.c.id)
+    with pytest.raises(ValueError, match=r"Sort keys \['p_str asc'\] of the cursor row are empty"):
+        query.cursor({'p_str': None, 'id': UUID(int=1)})
+
+
+def test_keyset_cursor_of_nested_rows() -> None:
+    query = Nested1.select().order_by(Nested1.c.nested2.name)
+
+    class Row:
+        def __init__(self, **kwargs: object) -> None:
+            self.__dict__.update(kwargs)
+
+    token = query.cursor(Row(nested2=Row(name='n2')))
+    assert Cursor.from_token(token) == Cursor(('nested2.name asc',), ('n2',))
+    assert query.after(token).build().query.startswith(
+        'select Nested1 filter .nested2.name > <str>$filter_0',
+    )
+
+
+def test_keyset_cursor_token_keeps_types() -> None:
+    values = (
+        datetime(2000, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        timedelta(days=1, microseconds=1),
+        Decimal('1.5'),
+        UUID(int=7),
+        1,
+    )
+    cursor = Cursor(('a asc', 'b asc', 'c asc', 'd asc', 'e asc'), values)
+    assert Cursor.from_token(cursor.token) == cursor
+    assert all(
+        type(value) is type(decoded)
+        for value, decoded in zip(values, Cursor.from_token(cursor.token).values, strict=True)
+    )
+
+
+def test_keyset_requires_sorting_by_columns() -> None:
+    query = A.select().order_by(std.len(A.c.p_str))
+    with pytest.raises(NotImplementedError, match='Keyset pagination by .* is not supported'):
+        query.cursor({'p_str': 'a'})
+
+
+def test_keyset_fingerprint_excludes_cursor_values() -> None:
+    query = A.select().order_by(A.c.p_str)
+    first = query.after(query.cursor({'p_str': 'a'}))
+    second = query.after(query.cursor({'p_str': 'b'}))
+    assert first.fingerprint() == second.fingerprint() != query.fingerprint()
+    assert second.value_vector() == ('b',)
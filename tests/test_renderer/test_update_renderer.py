@@ -1,3 +1,6 @@
+from dataclasses import replace
+from uuid import UUID
+
 from edgedb.blocking_client import Client
 
 from edgeql_qb import EdgeDBModel
@@ -9,6 +12,7 @@ A = EdgeDBModel('A')
 Nested1 = EdgeDBModel('Nested1')
 Nested2 = EdgeDBModel('Nested2')
 Nested3 = EdgeDBModel('Nested3')
+WithConstraints = EdgeDBModel('WithConstraints')
 
 
 def test_simple_update(client: Client) -> None:
@@ -90,3 +94,86 @@ def test_update_existing(client: Client) -> None:
     result = client.query(select.query, **select.context)
     assert len(result) == 1
     assert result[0].p_int16 == 2
+
+
+def test_update_many_by_id(client: Client) -> None:
+    insert = A.insert.values_many([{'p_int16': int16(i)} for i in range(3)]).build()
+    inserted = client.query(insert.query, **insert.context)
+    rows = [{'id': a.id, 'p_int16': int16(a.p_int16 * 10), 'p_str': None} for a in inserted]
+    rows.append({
+        'id': UUID('00000000-0000-0000-0000-000000000000'),
+        'p_int16': int16(-1),
+        'p_str': 'missing',
+    })
+    rendered = A.update.values_many(rows).build()
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union (update A '
+        "filter .id = <uuid><str>item['id'] "
+        "set { p_int16 := <int16>item['p_int16'], p_str := <str>item['p_str'] })"
+    )
+    assert rendered.context['rows_0'].endswith(
+        '{"id":"00000000-0000-0000-0000-000000000000","p_int16":-1,"p_str":"missing"}]',
+    )
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 3
+    select = A.select(A.c.p_int16).order_by(A.c.p_int16).build()
+    assert [a.p_int16 for a in client.query(select.query)] == [0, 10, 20]
+
+
+def test_update_many_by_exclusive_property(client: Client) -> None:
+    for name in ('first', 'second'):
+        insert = WithConstraints.insert.values(name=name).build()
+        client.query(insert.query, **insert.context)
+    rows = [
+        {'composite1': 'c1', 'name': 'first'},
+        {'composite1': 'c2', 'name': 'second'},
+    ]
+    rendered = (
+        WithConstraints
+        .update
+        .where(WithConstraints.c.composite2 == 'c')
+        .values_many(rows, key='name')
+        .build()
+    )
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union (update WithConstraints '
+        "filter .composite2 = <str>$filter_1 and .name = <str>item['name'] "
+        "set { composite1 := <str>item['composite1'] })"
+    )
+    assert rendered.context == FrozenDict(
+        rows_0='[{"name":"first","composite1":"c1"},{"name":"second","composite1":"c2"}]',
+        filter_1='c',
+    )
+    assert client.query(rendered.query, **rendered.context) == []
+    rendered = WithConstraints.update.values_many(rows, key='name').build()
+    result = client.query(rendered.query, **rendered.context)
+    assert len(result) == 2
+    chunks = list(WithConstraints.update.values_many(rows, key='name').chunked(max_rows=1))
+    assert [chunk.build().context for chunk in chunks] == [
+        FrozenDict(rows_0='[{"name":"first","composite1":"c1"}]'),
+        FrozenDict(rows_0='[{"name":"second","composite1":"c2"}]'),
+    ]
+
+
+def test_update_many_replaces_rows() -> None:
+    query = WithConstraints.update.where(WithConstraints.c.composite2 == 'c')
+    first = query.values_many([{'name': 'first', 'composite1': 'c1'}], key='name')
+    rows = [{'name': 'first', 'composite1': 'c2'}, {'name': 'second', 'composite1': 'c3'}]
+    second = first.values_many(rows, key='name')
+    rendered = second.build()
+    assert rendered.query == (
+        'for item in json_array_unpack(<json>$rows_0) union (update WithConstraints '
+        "filter .composite2 = <str>$filter_1 and .name = <str>item['name'] "
+        "set { composite1 := <str>item['composite1'] })"
+    )
+    assert [chunk.build() for chunk in second.chunked(max_rows=1)] == [
+        replace(rendered, context=FrozenDict(
+            rows_0='[{"name":"first","composite1":"c2"}]',
+            filter_1='c',
+        )),
+        replace(rendered, context=FrozenDict(
+            rows_0='[{"name":"second","composite1":"c3"}]',
+            filter_1='c',
+        )),
+    ]
+    assert second.values(composite1='c4').build() == query.values(composite1='c4').build()
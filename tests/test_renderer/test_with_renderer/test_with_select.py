@@ -2,6 +2,7 @@ from edgedb.blocking_client import Client
 
 from edgeql_qb import EdgeDBModel
 from edgeql_qb.frozendict import FrozenDict
+from edgeql_qb.func import std
 from edgeql_qb.operators import Alias
 from edgeql_qb.types import int64
 
@@ -46,3 +47,11 @@ def test_select_with_module_and_without_expressions() -> None:
         'with module test_module select A { p_int64 }'
     )
     assert rendered.context == FrozenDict()
+
+
+def test_select_with_function_of_literal(client: Client) -> None:
+    x = Alias('x').assign(std.len('Hello'))
+    rendered = A.select(Alias('x').label('y')).with_(x).build()
+    assert rendered.query == 'with x := len(<str>$with_0) select A { y := x }'
+    assert rendered.context == FrozenDict(with_0='Hello')
+    client.query(rendered.query, **rendered.context)